@@ -10,16 +10,24 @@ Date: August 2025
 
 from flask import Flask
 from flask_cors import CORS
+import atexit
+import functools
 import logging
 import os
-from pathlib import Path
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-def create_app(config_name='default'):
+# Process-wide logging queue dan listener (shared antar app instances)
+_log_queue = None
+_log_listener = None
+
+def create_app(config_name=None):
     """
     Factory function untuk membuat Flask application
     
     Args:
         config_name (str): Nama konfigurasi yang akan digunakan
+            (default: berdasarkan FLASK_ENV)
         
     Returns:
         Flask: Configured Flask application instance
@@ -27,9 +35,19 @@ def create_app(config_name='default'):
     # Inisialisasi Flask app
     app = Flask(__name__)
     
+    # Multipart parsing yang dituning untuk upload besar
+    from app.utils.upload_request import UploadRequest
+    app.request_class = UploadRequest
+    
+    # JSON serialization via orjson (fallback ke stdlib json)
+    from app.utils.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+    
     # Load konfigurasi
-    from app.config import Config
-    app.config.from_object(Config)
+    from app.config import get_config
+    config_class = get_config(config_name)
+    app.config.from_object(config_class)
+    config_class.init_app(app)
     
     # Setup CORS untuk cross-origin requests
     CORS(app, resources={
@@ -43,6 +61,10 @@ def create_app(config_name='default'):
     # Setup logging
     setup_logging(app)
     
+    # Start background sampler untuk system metrics (/health)
+    from app.controllers.health_controller import start_metrics_sampler
+    start_metrics_sampler()
+    
     # Buat directories yang diperlukan
     create_required_directories(app)
     
@@ -61,23 +83,95 @@ def setup_logging(app):
     """
     Setup logging configuration untuk aplikasi
     
+    Semua file logging dibangun di satu tempat (config-driven). Request
+    threads hanya melakukan queue.put lewat QueueHandler; file I/O
+    dikerjakan oleh QueueListener di background thread.
+    
     Args:
         app (Flask): Flask application instance
     """
-    if not app.debug and not app.testing:
-        # Setup file handler untuk production
-        if not os.path.exists('logs'):
-            os.mkdir('logs')
+    if not app.debug and not app.testing and app.config.get('ENABLE_FILE_LOGGING', True):
+        log_queue = _get_log_queue(app.config)
+        
+        # Skip jika handler untuk queue ini sudah terpasang
+        already_attached = any(
+            isinstance(handler, QueueHandler) and handler.queue is log_queue
+            for handler in app.logger.handlers
+        )
+        if already_attached:
+            return
+        
+        app.logger.addHandler(QueueHandler(log_queue))
+        
+        app.logger.setLevel(logging.INFO)
+        app.logger.info('OCR ML Engine startup')
+
+
+def _get_log_queue(config):
+    """
+    Get (atau buat sekali per process) logging queue beserta listener-nya
+    
+    Args:
+        config: Flask config mapping
+    
+    Returns:
+        queue.Queue: Queue yang dikonsumsi oleh file logging listener
+    """
+    global _log_queue, _log_listener
+    
+    if _log_listener is None:
+        from app.utils.log_handler import BufferedRotatingFileHandler
         
-        file_handler = logging.FileHandler('logs/ocr_app.log')
+        log_file = config.get('LOG_FILE', 'logs/ocr_app.log')
+        log_dir = os.path.dirname(log_file)
+        if log_dir:
+            _ensure_directory(log_dir)
+        
+        file_handler = BufferedRotatingFileHandler(
+            log_file,
+            maxBytes=config.get('MAX_LOG_SIZE_MB', 10) * 1024 * 1024,
+            backupCount=config.get('BACKUP_COUNT', 10),
+            buffer_size=64 * 1024,
+            flush_interval=30.0,
+            flush_level=logging.ERROR
+        )
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
         ))
         file_handler.setLevel(logging.INFO)
-        app.logger.addHandler(file_handler)
         
-        app.logger.setLevel(logging.INFO)
-        app.logger.info('OCR ML Engine startup')
+        _log_queue = queue.Queue(-1)
+        _log_listener = QueueListener(_log_queue, file_handler, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_stop_log_listener, file_handler)
+    
+    return _log_queue
+
+
+def _stop_log_listener(file_handler):
+    """Drain logging queue dan flush buffered file handler saat exit"""
+    if _log_listener is not None:
+        _log_listener.stop()
+    file_handler.flush()
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_directory(directory):
+    """
+    Pastikan directory ada (syscalls hanya sekali per path per process)
+    
+    Args:
+        directory (str): Directory path
+    
+    Returns:
+        bool: True jika directory baru dibuat
+    """
+    try:
+        os.stat(directory)
+        return False
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        return True
 
 
 def create_required_directories(app):
@@ -87,16 +181,16 @@ def create_required_directories(app):
     Args:
         app (Flask): Flask application instance
     """
-    required_dirs = [
+    required_dirs = {
         app.config.get('UPLOAD_FOLDER', 'uploads'),
         app.config.get('RESULTS_FOLDER', 'results'),
         'logs',
         'cache'
-    ]
+    }
     
     for directory in required_dirs:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        app.logger.debug(f"Directory ensured: {directory}")
+        if _ensure_directory(directory) and app.debug:
+            app.logger.debug("Directory created: %s", directory)
 
 
 def register_blueprints(app):
@@ -121,43 +215,57 @@ def register_error_handlers(app):
     Args:
         app (Flask): Flask application instance
     """
+    # Resolve sekali saat registration, bukan saat error terjadi
+    max_mb = app.config.get('MAX_CONTENT_LENGTH', 50 * 1024 * 1024) // (1024 * 1024)
+    
+    # Pre-serialized response bodies (konstan untuk lifetime app)
+    not_found_body = app.json.dumps({
+        'error': 'Resource not found',
+        'status_code': 404,
+        'message': 'The requested resource was not found on this server'
+    }).encode('utf-8')
+    
+    too_large_body = app.json.dumps({
+        'error': 'File too large',
+        'status_code': 413,
+        'message': f'File size exceeds maximum limit of {max_mb}MB'
+    }).encode('utf-8')
+    
+    internal_error_body = app.json.dumps({
+        'error': 'Internal server error',
+        'status_code': 500,
+        'message': 'An internal server error occurred'
+    }).encode('utf-8')
+    
+    unexpected_error_body = app.json.dumps({
+        'error': 'Unexpected error',
+        'status_code': 500,
+        'message': 'An unexpected error occurred'
+    }).encode('utf-8')
+    
+    def json_error(body, status_code):
+        return app.response_class(body, status=status_code, mimetype='application/json')
     
     @app.errorhandler(404)
     def not_found_error(error):
         """Handle 404 errors"""
-        return {
-            'error': 'Resource not found',
-            'status_code': 404,
-            'message': 'The requested resource was not found on this server'
-        }, 404
+        return json_error(not_found_body, 404)
     
     @app.errorhandler(413)
     def request_entity_too_large(error):
         """Handle file size too large errors"""
-        return {
-            'error': 'File too large',
-            'status_code': 413,
-            'message': f'File size exceeds maximum limit of {app.config.get("MAX_CONTENT_LENGTH", 50)}MB'
-        }, 413
+        return json_error(too_large_body, 413)
     
     @app.errorhandler(500)
     def internal_error(error):
         """Handle internal server errors"""
-        app.logger.error(f'Server Error: {error}')
-        return {
-            'error': 'Internal server error',
-            'status_code': 500,
-            'message': 'An internal server error occurred'
-        }, 500
+        app.logger.error('Server Error: %s', error)
+        return json_error(internal_error_body, 500)
     
     @app.errorhandler(Exception)
     def handle_exception(e):
         """Handle unexpected exceptions"""
-        app.logger.error(f'Unhandled Exception: {e}')
-        return {
-            'error': 'Unexpected error',
-            'status_code': 500,
-            'message': 'An unexpected error occurred'
-        }, 500
+        app.logger.error('Unhandled Exception: %s', e)
+        return json_error(unexpected_error_body, 500)
     
     app.logger.info("Error handlers registered successfully")
@@ -12,6 +12,29 @@ import os
 from pathlib import Path
 
 
+# String values yang dianggap True untuk boolean env vars
+_TRUE = frozenset({'1', 'true', 'yes', 'on'})
+
+
+def _envbool(name: str, default: bool = False) -> bool:
+    """
+    Parse boolean environment variable
+    
+    Args:
+        name (str): Nama environment variable
+        default (bool): Value jika variable tidak di-set
+    
+    Returns:
+        bool: Parsed value
+    """
+    value = os.environ.get(name)
+    return default if value is None else value.strip().lower() in _TRUE
+
+
+# Env-derived flags, dibaca sekali saat import
+_OCR_USE_GPU = _envbool('OCR_USE_GPU')
+
+
 class Config:
     """
     Base configuration class dengan settings default
@@ -22,6 +45,7 @@ class Config:
     
     # File upload settings
     MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50MB max file size
+    MAX_FORM_MEMORY_SIZE = 500 * 1024  # Batas in-memory untuk non-file form fields
     UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER') or 'uploads'
     RESULTS_FOLDER = os.environ.get('RESULTS_FOLDER') or 'results'
     ALLOWED_IMAGE_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'webp'}
@@ -29,9 +53,9 @@ class Config:
     
     # OCR Engine settings
     OCR_DEFAULT_LANGUAGES = ['en', 'id']
-    OCR_DEFAULT_ENGINE = 'both'  # tesseract, easyocr, both
+    OCR_DEFAULT_ENGINE = 'auto'  # auto, tesseract, easyocr, both
     OCR_DEFAULT_ENHANCEMENT_LEVEL = 2  # 1=basic, 2=medium, 3=aggressive
-    OCR_USE_GPU = os.environ.get('OCR_USE_GPU', 'False').lower() == 'true'
+    OCR_USE_GPU = _OCR_USE_GPU
     OCR_MIN_CONFIDENCE = 30
     
     # Tesseract configuration
@@ -54,6 +78,9 @@ class Config:
     
     # Performance settings
     BATCH_SIZE = 10
+    OCR_BATCH_WORKERS = 0  # 0 = auto detect (os.cpu_count), GPU selalu 1
+    OCR_BATCH_MAX_INFLIGHT = 24  # Maksimum batch tasks yang antri/berjalan lintas requests
+    OCR_BATCH_MAX_FILES = 24  # Maksimum files per /ocr/batch request
     ENABLE_MULTIPROCESSING = False
     PROCESS_COUNT = 0  # 0 = auto detect
     MEMORY_LIMIT_MB = 1000
@@ -118,7 +145,7 @@ class ProductionConfig(Config):
     TESTING = False
     
     # Production-specific settings
-    OCR_USE_GPU = os.environ.get('OCR_USE_GPU', 'False').lower() == 'true'
+    OCR_USE_GPU = _OCR_USE_GPU
     LOG_LEVEL = 'INFO'
     ENABLE_FILE_LOGGING = True
     
@@ -127,29 +154,12 @@ class ProductionConfig(Config):
     ENABLE_MULTIPROCESSING = True
     ENABLE_CACHE = True
     
+    # Log rotation (file handler dibangun di app.setup_logging)
+    BACKUP_COUNT = 10
+    
     @staticmethod
     def init_app(app):
         Config.init_app(app)
-        
-        # Setup production logging
-        import logging
-        from logging.handlers import RotatingFileHandler
-        
-        if not os.path.exists('logs'):
-            os.mkdir('logs')
-        
-        file_handler = RotatingFileHandler(
-            'logs/ocr_app.log',
-            maxBytes=10240000,  # 10MB
-            backupCount=10
-        )
-        file_handler.setFormatter(logging.Formatter(
-            '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
-        ))
-        file_handler.setLevel(logging.INFO)
-        app.logger.addHandler(file_handler)
-        
-        app.logger.setLevel(logging.INFO)
         app.logger.info('Production configuration loaded')
 
 
@@ -189,6 +199,10 @@ config = {
 }
 
 
+# Config class hasil resolve dari FLASK_ENV (di-cache setelah call pertama)
+_RESOLVED = None
+
+
 def get_config(config_name=None):
     """
     Get configuration class berdasarkan environment
@@ -199,7 +213,12 @@ def get_config(config_name=None):
     Returns:
         Config: Configuration class
     """
-    if config_name is None:
-        config_name = os.environ.get('FLASK_ENV', 'development')
+    global _RESOLVED
+    
+    if config_name is not None:
+        return config.get(config_name, DevelopmentConfig)
+    
+    if _RESOLVED is None:
+        _RESOLVED = config.get(os.environ.get('FLASK_ENV', 'development'), DevelopmentConfig)
     
-    return config.get(config_name, DevelopmentConfig)
+    return _RESOLVED
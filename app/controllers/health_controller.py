@@ -9,15 +9,284 @@ Date: August 2025
 """
 
 import os
+import sys
 import time
-import psutil
-from typing import Dict, Any
+import threading
+from bisect import bisect_right
+from typing import Dict, Any, Tuple
 from flask import current_app
+import importlib
+import importlib.metadata
 import importlib.util
 
 from app.utils.response_formatter import ResponseFormatter
 
 
+# Interval (detik) antara dua sampling system metrics
+SAMPLE_INTERVAL = 2.0
+
+# Delay (detik) sebelum sample pertama setelah cpu_percent di-seed
+CPU_SEED_DELAY = 0.5
+
+# TTL (detik) untuk cached dependency report
+DEPENDENCY_CACHE_TTL = 60
+
+# Cache hasil _check_dependencies (installed versions tidak berubah saat runtime)
+_DEPS_CACHE = {'ts': 0, 'data': None}
+
+# Resource usage thresholds (percent) dan status label per band:
+# < 80 healthy, < 95 warning, selebihnya critical
+_STATUS_THRESHOLDS = (80, 95)
+_STATUS_LABELS = ('healthy', 'warning', 'critical')
+
+_BYTES_PER_GB = 1024 ** 3
+
+# Stateless formatter, shared oleh semua HealthController instances
+_FORMATTER = ResponseFormatter()
+
+# Lazy-loaded psutil module
+_psutil = None
+
+# Process start time (immutable, di-cache setelah dibaca sekali)
+_process_start_time = None
+
+# Linux: baca /proc/stat dan /proc/meminfo langsung (tanpa psutil wrappers)
+_PROC_AVAILABLE = sys.platform.startswith('linux') and os.path.exists('/proc/stat')
+
+# CPU times (total, idle) dari sampling sebelumnya
+_last_cpu_times = None
+
+
+def _get_psutil():
+    """
+    Import psutil saat pertama kali dibutuhkan (memoized)
+    
+    Returns:
+        module: psutil module
+    """
+    global _psutil
+    if _psutil is None:
+        _psutil = importlib.import_module('psutil')
+    return _psutil
+
+
+def _get_process_start_time() -> float:
+    """
+    Get process start time (dibaca sekali dari psutil lalu di-cache)
+    
+    Returns:
+        float: Process create time (epoch seconds)
+    """
+    global _process_start_time
+    if _process_start_time is None:
+        _process_start_time = _get_psutil().Process().create_time()
+    return _process_start_time
+
+
+def _read_proc_cpu_times():
+    """
+    Read aggregate CPU times dari /proc/stat
+    
+    Returns:
+        tuple: (total_jiffies, idle_jiffies)
+    """
+    with open('/proc/stat') as f:
+        fields = f.readline().split()
+    
+    # user nice system idle iowait irq softirq steal
+    values = [int(v) for v in fields[1:9]]
+    return sum(values), values[3] + values[4]
+
+
+def _cpu_percent() -> float:
+    """
+    CPU usage percent sejak call sebelumnya (non-blocking)
+    
+    Returns:
+        float: CPU usage percent (0.0 pada call pertama)
+    """
+    global _last_cpu_times
+    
+    if not _PROC_AVAILABLE:
+        return _get_psutil().cpu_percent(interval=None)
+    
+    total, idle = _read_proc_cpu_times()
+    previous, _last_cpu_times = _last_cpu_times, (total, idle)
+    if previous is None:
+        return 0.0
+    
+    total_delta = total - previous[0]
+    if total_delta <= 0:
+        return 0.0
+    
+    busy_delta = total_delta - (idle - previous[1])
+    return round(busy_delta / total_delta * 100, 1)
+
+
+def _memory_info():
+    """
+    Get memory usage (dari /proc/meminfo di Linux, psutil selain itu)
+    
+    Returns:
+        tuple: (total_bytes, used_bytes, available_bytes, percent)
+    """
+    if not _PROC_AVAILABLE:
+        memory = _get_psutil().virtual_memory()
+        return memory.total, memory.used, memory.available, memory.percent
+    
+    with open('/proc/meminfo') as f:
+        data = f.read()
+    
+    fields = {}
+    for line in data.splitlines():
+        key, _, rest = line.partition(':')
+        if key in ('MemTotal', 'MemAvailable'):
+            fields[key] = int(rest.split()[0]) * 1024  # kB -> bytes
+            if len(fields) == 2:
+                break
+    
+    total = fields['MemTotal']
+    available = fields['MemAvailable']
+    used = total - available
+    return total, used, available, round(used / total * 100, 1)
+
+
+def _usage_status(percent: float) -> str:
+    """
+    Map usage percent ke status label
+    
+    Args:
+        percent (float): Resource usage percent
+    
+    Returns:
+        str: 'healthy', 'warning', atau 'critical'
+    """
+    return _STATUS_LABELS[bisect_right(_STATUS_THRESHOLDS, percent)]
+
+
+def _collect_system_metrics(include_cpu: bool = True) -> Dict[str, Any]:
+    """
+    Collect system resource metrics (non-blocking)
+    
+    Args:
+        include_cpu (bool): False jika CPU baseline baru di-seed; CPU usage
+            ditandai 'pending' karena delta ~0 detik tidak bermakna
+    
+    Returns:
+        dict: System metrics data
+    """
+    try:
+        psutil = _get_psutil()
+        
+        # CPU usage sejak sampling sebelumnya (tidak blocking)
+        cpu_percent = _cpu_percent() if include_cpu else None
+        
+        # Memory usage
+        mem_total, mem_used, mem_available, mem_percent = _memory_info()
+        
+        # Disk usage for current directory
+        disk = psutil.disk_usage('.')
+        disk_total = disk.total
+        disk_percent = disk.used / disk_total * 100
+        
+        return {
+            'cpu': {
+                'usage_percent': cpu_percent,
+                'cores': psutil.cpu_count(),
+                'status': _usage_status(cpu_percent) if include_cpu else 'pending'
+            },
+            'memory': {
+                'total_mb': mem_total >> 20,
+                'used_mb': mem_used >> 20,
+                'available_mb': mem_available >> 20,
+                'usage_percent': mem_percent,
+                'status': _usage_status(mem_percent)
+            },
+            'disk': {
+                'total_gb': round(disk_total / _BYTES_PER_GB, 2),
+                'used_gb': round(disk.used / _BYTES_PER_GB, 2),
+                'free_gb': round(disk.free / _BYTES_PER_GB, 2),
+                'usage_percent': round(disk_percent, 2),
+                'status': _usage_status(disk_percent)
+            }
+        }
+        
+    except Exception as e:
+        return {
+            'error': f'Failed to get system metrics: {e}',
+            'status': 'error'
+        }
+
+
+class _MetricsSampler:
+    """
+    Background sampler untuk system metrics
+    
+    Thread daemon me-refresh snapshot setiap SAMPLE_INTERVAL detik,
+    sehingga request /health cukup membaca snapshot terakhir.
+    """
+    
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self._snapshot: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    
+    def start(self):
+        """Seed cpu_percent, prime memory/disk sample lalu start background thread (idempotent)"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='metrics-sampler', daemon=True
+            )
+        
+        # Call pertama _cpu_percent() hanya men-set baseline CPU times
+        try:
+            _cpu_percent()
+        except Exception:
+            pass
+        
+        # CPU usage baru valid setelah sample pertama thread (CPU_SEED_DELAY)
+        self.sample(include_cpu=False)
+        self._thread.start()
+    
+    
+    def _run(self):
+        """Sampling loop (sample pertama setelah CPU_SEED_DELAY)"""
+        time.sleep(min(CPU_SEED_DELAY, self.interval))
+        while True:
+            self.sample()
+            time.sleep(self.interval)
+    
+    
+    def sample(self, include_cpu: bool = True):
+        """Ambil sample baru dan swap snapshot"""
+        snapshot = _collect_system_metrics(include_cpu)
+        with self._lock:
+            self._snapshot = snapshot
+    
+    
+    def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Get copy dari snapshot terakhir
+        
+        Returns:
+            dict: System metrics snapshot (kosong jika belum pernah sampling)
+        """
+        with self._lock:
+            return dict(self._snapshot)
+
+
+_metrics_sampler = _MetricsSampler()
+
+
+def start_metrics_sampler():
+    """Start background system metrics sampler"""
+    _metrics_sampler.start()
+
+
 class HealthController:
     """
     Controller untuk system health checks
@@ -29,30 +298,31 @@ class HealthController:
     - Performance metrics
     """
     
-    def __init__(self):
-        """Initialize Health Controller"""
-        self.response_formatter = ResponseFormatter()
-    
-    
-    def get_health_status(self) -> Dict[str, Any]:
+    def get_health_status(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive system health status
         
+        Args:
+            refresh (bool): Force recompute dependency report (bypass cache)
+        
         Returns:
             dict: Complete health check results
         """
         try:
             start_time = time.time()
             
+            # Snapshot config sekali (hindari LocalProxy lookup berulang)
+            cfg = current_app.config
+            
             # Basic health info
             health_data = {
                 'status': 'healthy',
                 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
                 'uptime': self._get_uptime(),
                 'service_info': {
-                    'name': current_app.config.get('API_TITLE', 'OCR ML Engine API'),
-                    'version': current_app.config.get('API_VERSION', '1.0.0'),
-                    'environment': current_app.config.get('ENV', 'development')
+                    'name': cfg.get('API_TITLE', 'OCR ML Engine API'),
+                    'version': cfg.get('API_VERSION', '1.0.0'),
+                    'environment': cfg.get('ENV', 'development')
                 }
             }
             
@@ -60,11 +330,11 @@ class HealthController:
             health_data['system'] = self._get_system_metrics()
             
             # Dependency checks
-            dependencies = self._check_dependencies()
+            dependencies = self._check_dependencies(refresh=refresh)
             health_data['dependencies'] = dependencies
             
             # Storage checks
-            health_data['storage'] = self._check_storage()
+            health_data['storage'] = self._check_storage(cfg)
             
             # Determine overall health status
             overall_status = self._determine_overall_status(dependencies, health_data['system'])
@@ -75,7 +345,7 @@ class HealthController:
             
             status_code = 200 if overall_status == 'healthy' else 503
             
-            return self.response_formatter.format_response(
+            return _FORMATTER.format_response(
                 success=overall_status == 'healthy',
                 message=f'System is {overall_status}',
                 data=health_data,
@@ -83,8 +353,8 @@ class HealthController:
             )
             
         except Exception as e:
-            current_app.logger.error(f"Health check failed: {e}")
-            return self.response_formatter.error_response(
+            current_app.logger.error("Health check failed: %s", e)
+            return _FORMATTER.error_response(
                 'Health check failed',
                 str(e),
                 status_code=503
@@ -100,14 +370,12 @@ class HealthController:
         """
         try:
             # Simple uptime based on process start time
-            process = psutil.Process()
-            create_time = process.create_time()
-            uptime_seconds = time.time() - create_time
+            uptime_seconds = time.time() - _get_process_start_time()
             
             # Convert ke human readable format
-            days = int(uptime_seconds // 86400)
-            hours = int((uptime_seconds % 86400) // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
+            days, remainder = divmod(int(uptime_seconds), 86400)
+            hours, remainder = divmod(remainder, 3600)
+            minutes = remainder // 60
             
             if days > 0:
                 return f"{days}d {hours}h {minutes}m"
@@ -122,152 +390,121 @@ class HealthController:
     
     def _get_system_metrics(self) -> Dict[str, Any]:
         """
-        Get system resource metrics
+        Get system resource metrics dari background sampler
         
         Returns:
             dict: System metrics data
         """
-        try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            
-            # Disk usage for current directory
-            disk = psutil.disk_usage('.')
-            
-            return {
-                'cpu': {
-                    'usage_percent': cpu_percent,
-                    'cores': psutil.cpu_count(),
-                    'status': 'healthy' if cpu_percent < 80 else 'warning' if cpu_percent < 95 else 'critical'
-                },
-                'memory': {
-                    'total_mb': round(memory.total / 1024 / 1024, 2),
-                    'used_mb': round(memory.used / 1024 / 1024, 2),
-                    'available_mb': round(memory.available / 1024 / 1024, 2),
-                    'usage_percent': memory.percent,
-                    'status': 'healthy' if memory.percent < 80 else 'warning' if memory.percent < 95 else 'critical'
-                },
-                'disk': {
-                    'total_gb': round(disk.total / 1024 / 1024 / 1024, 2),
-                    'used_gb': round(disk.used / 1024 / 1024 / 1024, 2),
-                    'free_gb': round(disk.free / 1024 / 1024 / 1024, 2),
-                    'usage_percent': round((disk.used / disk.total) * 100, 2),
-                    'status': 'healthy' if disk.used / disk.total < 0.8 else 'warning' if disk.used / disk.total < 0.95 else 'critical'
-                }
-            }
-            
-        except Exception as e:
-            return {
-                'error': f'Failed to get system metrics: {e}',
-                'status': 'error'
-            }
+        snapshot = _metrics_sampler.get_snapshot()
+        if not snapshot:
+            # Sampler belum berjalan (misal controller dipakai di luar create_app)
+            snapshot = _collect_system_metrics()
+        
+        return snapshot
     
     
-    def _check_dependencies(self) -> Dict[str, Any]:
+    def _check_dependencies(self, refresh: bool = False) -> Dict[str, Any]:
         """
-        Check availability of required dependencies
+        Check availability of required dependencies (cached dengan TTL)
+        
+        Args:
+            refresh (bool): Force recompute, abaikan cache
         
         Returns:
             dict: Dependency check results
         """
+        now = time.time()
+        if (not refresh and _DEPS_CACHE['data'] is not None
+                and now - _DEPS_CACHE['ts'] < DEPENDENCY_CACHE_TTL):
+            return _DEPS_CACHE['data']
+        
         dependencies = {}
         
-        # Critical dependencies
+        # Critical dependencies: name -> (import name, distribution names yang menyediakan module)
         critical_deps = {
-            'opencv-python': 'cv2',
-            'Pillow': 'PIL',
-            'numpy': 'numpy',
-            'flask': 'flask',
-            'pytesseract': 'pytesseract',
-            'easyocr': 'easyocr',
-            'pdf2image': 'pdf2image',
-            'PyPDF2': 'PyPDF2'
+            'opencv-python': ('cv2', ('opencv-python', 'opencv-python-headless',
+                                      'opencv-contrib-python', 'opencv-contrib-python-headless')),
+            'Pillow': ('PIL', ('Pillow', 'Pillow-SIMD')),
+            'numpy': ('numpy', ('numpy',)),
+            'flask': ('flask', ('flask',)),
+            'pytesseract': ('pytesseract', ('pytesseract',)),
+            'easyocr': ('easyocr', ('easyocr',)),
+            'pdf2image': ('pdf2image', ('pdf2image',)),
+            'PyPDF2': ('PyPDF2', ('PyPDF2',))
         }
         
-        for dep_name, import_name in critical_deps.items():
-            try:
-                spec = importlib.util.find_spec(import_name)
-                if spec is not None:
-                    # Try to import untuk version info
-                    module = importlib.import_module(import_name)
-                    version = getattr(module, '__version__', 'unknown')
-                    
-                    dependencies[dep_name] = {
-                        'status': 'available',
-                        'version': version,
-                        'critical': True
-                    }
-                else:
-                    dependencies[dep_name] = {
-                        'status': 'missing',
-                        'version': None,
-                        'critical': True,
-                        'error': 'Module not found'
-                    }
-                    
-            except Exception as e:
-                dependencies[dep_name] = {
-                    'status': 'error',
-                    'version': None,
-                    'critical': True,
-                    'error': str(e)
-                }
+        for dep_name, (import_name, dist_names) in critical_deps.items():
+            dependencies[dep_name] = self._probe_dependency(import_name, dist_names, critical=True)
         
         # Optional dependencies
         optional_deps = {
-            'psutil': 'psutil',
-            'requests': 'requests'
+            'psutil': ('psutil', ('psutil',)),
+            'requests': ('requests', ('requests',))
         }
         
-        for dep_name, import_name in optional_deps.items():
-            try:
-                spec = importlib.util.find_spec(import_name)
-                if spec is not None:
-                    module = importlib.import_module(import_name)
-                    version = getattr(module, '__version__', 'unknown')
-                    
-                    dependencies[dep_name] = {
-                        'status': 'available',
-                        'version': version,
-                        'critical': False
-                    }
-                else:
-                    dependencies[dep_name] = {
-                        'status': 'missing',
-                        'version': None,
-                        'critical': False
-                    }
-                    
-            except Exception as e:
-                dependencies[dep_name] = {
-                    'status': 'error',
-                    'version': None,
-                    'critical': False,
-                    'error': str(e)
-                }
+        for dep_name, (import_name, dist_names) in optional_deps.items():
+            dependencies[dep_name] = self._probe_dependency(import_name, dist_names, critical=False)
+        
+        _DEPS_CACHE['data'] = dependencies
+        _DEPS_CACHE['ts'] = now
         
         return dependencies
     
     
-    def _check_storage(self) -> Dict[str, Any]:
+    def _probe_dependency(self, import_name: str, dist_names: Tuple[str, ...],
+                          critical: bool) -> Dict[str, Any]:
+        """
+        Probe satu dependency tanpa import module
+        
+        Availability ditentukan oleh find_spec(import_name); dist-info metadata
+        hanya dipakai untuk version string. Satu module bisa disediakan oleh
+        beberapa distributions (misal cv2 dari opencv-python-headless).
+        
+        Args:
+            import_name (str): Module name (misal 'cv2')
+            dist_names (tuple): Distribution names yang menyediakan module
+            critical (bool): Apakah dependency critical
+        
+        Returns:
+            dict: Dependency status entry
+        """
+        try:
+            if importlib.util.find_spec(import_name) is None:
+                return {'status': 'missing', 'version': None, 'critical': critical,
+                        'error': 'Module not found'}
+            
+            version = 'unknown'
+            for dist_name in dist_names:
+                try:
+                    version = importlib.metadata.version(dist_name)
+                    break
+                except importlib.metadata.PackageNotFoundError:
+                    continue
+            
+            return {'status': 'available', 'version': version, 'critical': critical}
+        except Exception as e:
+            return {'status': 'error', 'version': None, 'critical': critical, 'error': str(e)}
+    
+    
+    def _check_storage(self, cfg) -> Dict[str, Any]:
         """
         Check storage availability dan configuration
         
+        Args:
+            cfg: Flask config mapping (snapshot dari get_health_status)
+        
         Returns:
             dict: Storage check results
         """
         try:
             storage_info = {
                 'temp_directory': {
-                    'path': current_app.config.get('UPLOAD_FOLDER', 'temp'),
+                    'path': cfg.get('UPLOAD_FOLDER', 'temp'),
                     'exists': False,
                     'writable': False
                 },
                 'results_directory': {
-                    'path': current_app.config.get('RESULTS_FOLDER', 'results'),
+                    'path': cfg.get('RESULTS_FOLDER', 'results'),
                     'exists': False,
                     'writable': False
                 }
@@ -276,14 +513,13 @@ class HealthController:
             for dir_type, dir_info in storage_info.items():
                 path = dir_info['path']
                 
-                # Check if directory exists
-                if os.path.exists(path):
+                # stat untuk existence; access() untuk write permission efektif
+                # process (owner/group/other bits, root, ACLs)
+                try:
+                    os.stat(path)
                     dir_info['exists'] = True
-                    
-                    # Check if writable
-                    if os.access(path, os.W_OK):
-                        dir_info['writable'] = True
-                else:
+                    dir_info['writable'] = os.access(path, os.W_OK)
+                except FileNotFoundError:
                     # Try to create directory
                     try:
                         os.makedirs(path, exist_ok=True)
@@ -312,27 +548,22 @@ class HealthController:
         Returns:
             str: Overall status ('healthy', 'warning', 'critical')
         """
-        # Check critical dependencies
-        critical_deps_failed = any(
-            dep.get('status') != 'available' and dep.get('critical', False) 
-            for dep in dependencies.values()
-        )
-        
-        if critical_deps_failed:
-            return 'critical'
+        # Check critical dependencies (short-circuit pada failure pertama)
+        for dep in dependencies.values():
+            if dep.get('critical', False) and dep.get('status') != 'available':
+                return 'critical'
         
         # Check system resources
         if system.get('error'):
             return 'warning'
         
-        cpu_status = system.get('cpu', {}).get('status', 'healthy')
-        memory_status = system.get('memory', {}).get('status', 'healthy')
-        disk_status = system.get('disk', {}).get('status', 'healthy')
-        
-        if any(status == 'critical' for status in [cpu_status, memory_status, disk_status]):
-            return 'critical'
-        
-        if any(status == 'warning' for status in [cpu_status, memory_status, disk_status]):
-            return 'warning'
+        # Single pass, track severity tertinggi
+        has_warning = False
+        for resource in ('cpu', 'memory', 'disk'):
+            status = system.get(resource, {}).get('status', 'healthy')
+            if status == 'critical':
+                return 'critical'
+            if status == 'warning':
+                has_warning = True
         
-        return 'healthy'
+        return 'warning' if has_warning else 'healthy'
@@ -9,23 +9,144 @@ Date: August 2025
 """
 
 import os
+import re
+import atexit
+import logging
 import uuid
+import hashlib
 import time
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Iterator
 from werkzeug.datastructures import FileStorage
 from flask import current_app
-import io
-from PIL import Image
-import json
 
-# Import services
-from app.services.ocr_service import OCRService
-from app.services.pdf_service import PDFService
-from app.services.image_service import ImageService
+# Services di-import lazily (OCR/PDF stack memuat cv2, easyocr, torch)
 from app.utils.file_manager import FileManager
 from app.utils.response_formatter import ResponseFormatter
 
 
+logger = logging.getLogger(__name__)
+
+# TTL untuk cached models info (engine versions/languages tetap selama process hidup)
+MODELS_INFO_CACHE_TTL = 300
+
+# Jumlah stored results yang di-cache di memory (LRU) untuk /results/<id>
+RESULT_CACHE_SIZE = 1024
+
+# Patterns untuk text statistics (compiled sekali saat import)
+_DIGIT_RE = re.compile(r'\d')
+_NON_WS_RE = re.compile(r'\S')
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+# Text dengan panjang >= ini (dan ASCII-only) memakai numba kernel jika tersedia
+_KERNEL_MIN_LENGTH = 64 * 1024
+_text_kernels = None
+
+def _count_paragraphs(text: str) -> int:
+    """
+    Count non-empty paragraphs (blocks dipisah '\\n\\n') tanpa split/slicing
+    
+    Equivalent dengan len([p for p in text.split('\\n\\n') if p.strip()]).
+    
+    Args:
+        text (str): Input text
+    
+    Returns:
+        int: Jumlah paragraphs
+    """
+    count = 0
+    start = 0
+    length = len(text)
+    find = text.find
+    search = _NON_WS_RE.search
+    
+    while True:
+        end = find('\n\n', start)
+        if end == -1:
+            end = length
+        
+        if search(text, start, end) is not None:
+            count += 1
+        
+        if end == length:
+            return count
+        start = end + 2
+
+
+def _get_text_kernels():
+    """Import text_kernels module saat pertama dibutuhkan (numba import mahal)"""
+    global _text_kernels
+    if _text_kernels is None:
+        from app.utils import text_kernels
+        _text_kernels = text_kernels
+    return _text_kernels
+
+
+# Shared executor untuk load/enhance images di batch processing
+_batch_executor = None
+_batch_slots = None
+_batch_executor_lock = threading.Lock()
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    """
+    Get (atau create) module-level executor untuk batch processing
+    
+    Jumlah workers dari OCR_BATCH_WORKERS (0 = os.cpu_count()); dengan GPU
+    enabled hanya satu worker supaya tidak berebut device.
+    
+    Returns:
+        ThreadPoolExecutor: Shared executor
+    """
+    global _batch_executor, _batch_slots
+    
+    if _batch_executor is None:
+        with _batch_executor_lock:
+            if _batch_executor is None:
+                config = current_app.config
+                if config.get('OCR_USE_GPU', False):
+                    max_workers = 1
+                else:
+                    max_workers = config.get('OCR_BATCH_WORKERS', 0) or os.cpu_count() or 1
+                _batch_slots = threading.BoundedSemaphore(
+                    max(config.get('OCR_BATCH_MAX_INFLIGHT', 24), max_workers)
+                )
+                _batch_executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix='ocr-batch'
+                )
+    
+    return _batch_executor
+
+
+def _submit_batch_task(fn, *args) -> Future:
+    """
+    Submit task ke batch executor dengan batas in-flight tasks
+    
+    Request thread block di sini kalau sudah ada OCR_BATCH_MAX_INFLIGHT
+    tasks yang antri atau berjalan, supaya concurrent batch requests tidak
+    menumpuk decoded images di memory tanpa batas.
+    
+    Args:
+        fn: Callable yang dijalankan di worker thread
+        *args: Arguments untuk fn
+    
+    Returns:
+        Future: Future dari task
+    """
+    executor = _get_batch_executor()
+    _batch_slots.acquire()
+    try:
+        future = executor.submit(fn, *args)
+    except Exception:
+        _batch_slots.release()
+        raise
+    future.add_done_callback(lambda _: _batch_slots.release())
+    return future
+
+
 class OCRController:
     """
     Controller untuk OCR operations
@@ -46,18 +167,95 @@ class OCRController:
         self.file_manager = None
         self.response_formatter = ResponseFormatter()
         
-        # Initialize services saat pertama kali digunakan (lazy loading)
-        self._initialized = False
+        # Setiap service dibuat saat pertama kali dibutuhkan (lazy loading)
+        self._init_lock = threading.Lock()
+        
+        # Config values yang tidak berubah saat runtime (dibaca sekali dari app config)
+        self._settings = None
+        
+        # Cached models info response
+        self._models_info_cache = {'ts': 0, 'data': None}
+        
+        # LRU cache untuk results yang sudah dibaca dari disk
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # Result persistence berjalan di background, di luar response path
+        self._save_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ocr-save')
+        self._pending_saves = {}
+        self._pending_lock = threading.Lock()
+        atexit.register(self._save_executor.shutdown, wait=True)
     
     
-    def _ensure_initialized(self):
-        """Ensure semua services sudah diinisialisasi"""
-        if not self._initialized:
-            self.ocr_service = OCRService()
-            self.pdf_service = PDFService()
-            self.image_service = ImageService()
-            self.file_manager = FileManager()
-            self._initialized = True
+    def _get_settings(self) -> Dict[str, Any]:
+        """
+        Get controller settings dari app config (di-cache setelah call pertama)
+        
+        Controller dibuat saat import routes (tanpa app context), jadi
+        settings dibaca saat request pertama.
+        """
+        if self._settings is None:
+            config = current_app.config
+            self._settings = {
+                'api_version': config.get('API_VERSION', '1.0.0'),
+                'enable_cache': config.get('ENABLE_CACHE', False),
+                'cache_expiry_hours': config.get('CACHE_EXPIRY_HOURS', 24),
+                'default_engine': config.get('OCR_DEFAULT_ENGINE', 'auto'),
+                'use_gpu': config.get('OCR_USE_GPU', False)
+            }
+        return self._settings
+    
+    
+    def _ensure_files(self) -> FileManager:
+        """Ensure FileManager sudah diinisialisasi"""
+        if self.file_manager is None:
+            with self._init_lock:
+                if self.file_manager is None:
+                    self.file_manager = FileManager()
+        return self.file_manager
+    
+    
+    def _ensure_image(self):
+        """Ensure ImageService sudah diinisialisasi"""
+        if self.image_service is None:
+            with self._init_lock:
+                if self.image_service is None:
+                    from app.services.image_service import ImageService
+                    self.image_service = ImageService()
+        return self.image_service
+    
+    
+    def _ensure_ocr(self):
+        """Ensure OCRService (dan OCR engines) sudah diinisialisasi"""
+        if self.ocr_service is None:
+            with self._init_lock:
+                if self.ocr_service is None:
+                    from app.services.ocr_service import OCRService
+                    self.ocr_service = OCRService(use_gpu=self._get_settings()['use_gpu'])
+        return self.ocr_service
+    
+    
+    def _ensure_pdf(self):
+        """
+        Ensure PDFService sudah diinisialisasi
+        
+        OCRService hanya dibuat jika PDF perlu OCR fallback.
+        """
+        if self.pdf_service is None:
+            image_service = self._ensure_image()
+            settings = self._get_settings()
+            # Page cache memakai cache directory yang sama dengan image result cache
+            file_manager = self._ensure_files() if settings['enable_cache'] else None
+            with self._init_lock:
+                if self.pdf_service is None:
+                    from app.services.pdf_service import PDFService
+                    self.pdf_service = PDFService(
+                        image_service=image_service,
+                        ocr_service_factory=self._ensure_ocr,
+                        file_manager=file_manager,
+                        cache_expiry_hours=settings['cache_expiry_hours']
+                    )
+        return self.pdf_service
     
     
     def process_single_image(self, file: FileStorage, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -68,80 +266,99 @@ class OCRController:
             file (FileStorage): Image file dari request
             params (dict): Processing parameters
                 - enhancement_level: int (1-3)
-                - engine: str ('tesseract', 'easyocr', 'both')
+                - engine: str ('auto', 'tesseract', 'easyocr', 'both')
                 - languages: str (comma-separated language codes)
         
         Returns:
             dict: OCR result dengan extracted text dan metadata
         """
         try:
-            self._ensure_initialized()
+            self._ensure_files()
+            self._ensure_image()
+            self._ensure_ocr()
             
-            # Generate unique result ID
-            result_id = str(uuid.uuid4())
+            filename = file.filename
+            enhancement_level = params.get('enhancement_level', 2)
+            engine = params.get('engine', 'auto')
+            languages = params.get('languages', 'en,id').split(',')
             
-            # Save uploaded file temporarily
-            temp_path = self.file_manager.save_temp_file(file, result_id)
+            # Generate unique result ID dan timestamp (sekali per request)
+            result_id = uuid.uuid4().hex
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
             
-            try:
-                # Load dan validate image
-                image = self.image_service.load_image(temp_path)
-                if image is None:
-                    return self.response_formatter.error_response(
-                        'Invalid image file',
-                        'Could not load the uploaded image'
-                    )
-                
-                # Apply image enhancement
-                enhanced_image = self.image_service.enhance_image(
-                    image, 
-                    level=params.get('enhancement_level', 2)
-                )
+            settings = self._get_settings()
+            use_cache = settings['enable_cache']
+            
+            # Upload di-decode langsung dari request stream (tanpa temp file)
+            stream = file.stream
+            
+            # Content-hash cache: upload identik dengan parameter sama tidak di-OCR ulang
+            cache_key = None
+            if use_cache:
+                content_hash, file_size = self.file_manager.hash_stream(stream)
+                cache_key = hashlib.blake2b(
+                    f"{content_hash}:{enhancement_level}:{engine}:{','.join(languages)}".encode('utf-8'),
+                    digest_size=16
+                ).hexdigest()
                 
-                # Perform OCR
-                ocr_result = self.ocr_service.extract_text(
-                    enhanced_image,
-                    engine=params.get('engine', 'both'),
-                    languages=params.get('languages', 'en,id').split(',')
+                cached = self.file_manager.load_cached_result(
+                    cache_key, max_age_hours=settings['cache_expiry_hours']
                 )
-                
-                # Calculate confidence dan statistics
-                stats = self._calculate_text_stats(ocr_result.get('text', ''))
-                
-                # Prepare result
-                result = {
-                    'result_id': result_id,
-                    'filename': file.filename,
-                    'file_size': len(file.read()),
-                    'processing_time': ocr_result.get('processing_time', 0),
-                    'enhancement_level': params.get('enhancement_level', 2),
-                    'engine_used': ocr_result.get('engine_used', params.get('engine', 'both')),
-                    'languages': params.get('languages', 'en,id').split(','),
-                    'extracted_text': ocr_result.get('text', ''),
-                    'confidence_score': ocr_result.get('confidence', 0),
-                    'statistics': stats,
-                    'metadata': {
-                        'image_size': f"{image.width}x{image.height}",
-                        'image_mode': image.mode,
-                        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                        'api_version': current_app.config.get('API_VERSION', '1.0.0')
-                    }
-                }
-                
-                # Save result untuk future retrieval
-                self._save_result(result_id, result)
-                
-                # Reset file pointer
-                file.seek(0)
-                
-                return self.response_formatter.success_response(
-                    'Image processed successfully',
-                    result
+                if cached is not None:
+                    cached['result_id'] = result_id
+                    cached['filename'] = filename
+                    cached['metadata']['timestamp'] = timestamp
+                    cached['metadata']['cache_hit'] = True
+                    
+                    self._save_result(result_id, cached)
+                    
+                    return self.response_formatter.success_response(
+                        'Image processed successfully',
+                        cached
+                    )
+            else:
+                file_size = self.file_manager.get_stream_size(stream)
+            
+            # Load dan validate image
+            image = self.image_service.load_image_from_stream(stream)
+            if image is None:
+                return self.response_formatter.error_response(
+                    'Invalid image file',
+                    'Could not load the uploaded image'
                 )
-                
-            finally:
-                # Cleanup temporary file
-                self.file_manager.cleanup_temp_file(temp_path)
+            
+            # Apply image enhancement
+            enhanced_image = self.image_service.enhance_image(
+                image, 
+                level=enhancement_level
+            )
+            
+            # Perform OCR
+            ocr_result = self.ocr_service.extract_text(
+                enhanced_image,
+                engine=engine,
+                languages=languages
+            )
+            
+            # Prepare result
+            result = self._build_image_result(
+                result_id, filename, file_size, image, ocr_result,
+                enhancement_level, engine, languages, timestamp
+            )
+            
+            # Save result untuk future retrieval
+            self._save_result(result_id, result)
+            
+            if cache_key is not None and 'error' not in ocr_result:
+                try:
+                    self.file_manager.save_cached_result(cache_key, result)
+                except Exception as e:
+                    current_app.logger.warning("Failed to cache result %s: %s", result_id, e)
+            
+            return self.response_formatter.success_response(
+                'Image processed successfully',
+                result
+            )
                 
         except Exception as e:
             current_app.logger.error(f"Single image OCR error: {e}")
@@ -163,40 +380,88 @@ class OCRController:
             dict: Batch processing results
         """
         try:
-            self._ensure_initialized()
+            self._ensure_files()
+            self._ensure_image()
+            self._ensure_ocr()
             
-            batch_id = str(uuid.uuid4())
-            results = []
+            batch_id = uuid.uuid4().hex
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+            results = [None] * len(files)
             successful_count = 0
             failed_count = 0
             total_processing_time = 0
             
-            current_app.logger.info(f"Starting batch processing with {len(files)} files")
+            current_app.logger.info("Starting batch processing with %d files", len(files))
+            
+            enhancement_level = params.get('enhancement_level', 2)
+            engine = params.get('engine', 'auto')
+            languages = params.get('languages', 'en,id').split(',')
+            
+            # Filenames di-bind sebelum processing supaya error messages tetap valid
+            filenames = [file.filename for file in files]
             
-            for i, file in enumerate(files):
+            # Load dan enhance semua images secara paralel, OCR dijalankan dalam satu batched call
+            futures = {
+                _submit_batch_task(self._load_batch_image, file, enhancement_level): i
+                for i, file in enumerate(files)
+            }
+            
+            loaded = []  # (index, filename, result_id, file_size, image, enhanced_image)
+            for future in as_completed(futures):
+                i = futures[future]
+                filename = filenames[i]
                 try:
-                    # Process each file
-                    file_result = self.process_single_image(file, params)
-                    
-                    if file_result.get('success', False):
-                        successful_count += 1
-                        total_processing_time += file_result.get('data', {}).get('processing_time', 0)
-                        
-                        # Add batch info ke result
-                        file_result['data']['batch_id'] = batch_id
-                        file_result['data']['batch_index'] = i + 1
-                        
+                    result_id, file_size, image, enhanced_image = future.result()
+                    if image is None:
+                        results[i] = self.response_formatter.error_response(
+                            'Invalid image file',
+                            'Could not load the uploaded image'
+                        )
                     else:
-                        failed_count += 1
-                    
-                    results.append(file_result)
+                        loaded.append((i, filename, result_id, file_size, image, enhanced_image))
+                
+                except Exception as e:
+                    results[i] = self.response_formatter.error_response(
+                        f'Failed to process {filename}',
+                        str(e)
+                    )
+            
+            # Urutkan kembali sesuai input supaya batch_index stabil
+            loaded.sort(key=lambda entry: entry[0])
+            
+            ocr_results = self.ocr_service.extract_text_batched(
+                [entry[5] for entry in loaded],
+                engine=engine,
+                languages=languages
+            )
+            
+            for (i, filename, result_id, file_size, image, _), ocr_result in zip(loaded, ocr_results):
+                try:
+                    result = self._build_image_result(
+                        result_id, filename, file_size, image, ocr_result,
+                        enhancement_level, engine, languages, timestamp
+                    )
+                    self._save_result(result_id, result)
                     
+                    result['batch_id'] = batch_id
+                    result['batch_index'] = i + 1
+                    results[i] = self.response_formatter.success_response(
+                        'Image processed successfully',
+                        result
+                    )
+                
                 except Exception as e:
-                    failed_count += 1
-                    results.append(self.response_formatter.error_response(
-                        f'Failed to process {file.filename}',
+                    results[i] = self.response_formatter.error_response(
+                        f'Failed to process {filename}',
                         str(e)
-                    ))
+                    )
+            
+            for file_result in results:
+                if file_result.get('success', False):
+                    successful_count += 1
+                    total_processing_time += file_result['data'].get('processing_time', 0)
+                else:
+                    failed_count += 1
             
             # Prepare batch summary
             batch_result = {
@@ -207,7 +472,7 @@ class OCRController:
                 'success_rate': (successful_count / len(files)) * 100 if files else 0,
                 'total_processing_time': total_processing_time,
                 'average_processing_time': total_processing_time / successful_count if successful_count > 0 else 0,
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'timestamp': timestamp,
                 'results': results
             }
             
@@ -227,6 +492,167 @@ class OCRController:
             )
     
     
+    def process_batch_images_stream(self, files: List[FileStorage],
+                                    params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Process multiple images dan yield setiap result segera setelah selesai
+        
+        Setiap file diproses end-to-end di batch executor; results di-yield
+        berdasarkan urutan selesai (bukan urutan input), dengan batch_index
+        menunjuk posisi file di input.
+        
+        Args:
+            files (list): List of image files
+            params (dict): Processing parameters
+        
+        Yields:
+            dict: Formatted response per file
+        """
+        self._ensure_files()
+        self._ensure_image()
+        self._ensure_ocr()
+        
+        # Settings di-cache di sini karena worker threads tidak punya app context
+        self._get_settings()
+        
+        enhancement_level = params.get('enhancement_level', 2)
+        engine = params.get('engine', 'auto')
+        languages = params.get('languages', 'en,id').split(',')
+        
+        batch_id = uuid.uuid4().hex
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        
+        current_app.logger.info("Starting streamed batch processing with %d files", len(files))
+        
+        filenames = [file.filename for file in files]
+        
+        futures = {
+            _submit_batch_task(
+                self._process_batch_file, file, filenames[i], enhancement_level, engine, languages, timestamp
+            ): i
+            for i, file in enumerate(files)
+        }
+        
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                file_result = future.result()
+            except Exception as e:
+                file_result = self.response_formatter.error_response(
+                    f'Failed to process {filenames[i]}',
+                    str(e)
+                )
+            
+            if file_result.get('success', False):
+                file_result['data']['batch_id'] = batch_id
+                file_result['data']['batch_index'] = i + 1
+            
+            yield file_result
+    
+    
+    def _process_batch_file(self, file: FileStorage, filename: str, enhancement_level: int,
+                            engine: str, languages: List[str], timestamp: str) -> Dict[str, Any]:
+        """
+        Process satu file end-to-end untuk streamed batch (di worker thread)
+        
+        Args:
+            file (FileStorage): Image file dari request
+            filename (str): Original filename
+            enhancement_level (int): Enhancement level (1-3)
+            engine (str): OCR engine
+            languages (list): Language codes
+            timestamp (str): Batch timestamp
+        
+        Returns:
+            dict: Formatted response untuk file ini
+        """
+        result_id, file_size, image, enhanced_image = self._load_batch_image(file, enhancement_level)
+        if image is None:
+            return self.response_formatter.error_response(
+                'Invalid image file',
+                'Could not load the uploaded image'
+            )
+        
+        ocr_result = self.ocr_service.extract_text(enhanced_image, engine=engine, languages=languages)
+        
+        result = self._build_image_result(
+            result_id, filename, file_size, image, ocr_result,
+            enhancement_level, engine, languages, timestamp
+        )
+        self._save_result(result_id, result)
+        
+        return self.response_formatter.success_response(
+            'Image processed successfully',
+            result
+        )
+    
+    
+    def _load_batch_image(self, file: FileStorage, enhancement_level: int):
+        """
+        Load dan enhance satu batch image dari request stream (dijalankan di worker thread)
+        
+        Args:
+            file (FileStorage): Image file dari request
+            enhancement_level (int): Enhancement level (1-3)
+        
+        Returns:
+            tuple: (result_id, file_size, image, enhanced_image); image None jika gagal di-load
+        """
+        result_id = uuid.uuid4().hex
+        stream = file.stream
+        file_size = self.file_manager.get_stream_size(stream)
+        
+        image = self.image_service.load_image_from_stream(stream)
+        if image is None:
+            return result_id, file_size, None, None
+        
+        enhanced_image = self.image_service.enhance_image(image, level=enhancement_level)
+        return result_id, file_size, image, enhanced_image
+    
+    
+    def _build_image_result(self, result_id: str, filename: str, file_size: int, image,
+                            ocr_result: Dict[str, Any], enhancement_level: int, engine: str,
+                            languages: List[str], timestamp: str) -> Dict[str, Any]:
+        """
+        Build result dict untuk satu processed image
+        
+        Args:
+            result_id (str): Unique result ID
+            filename (str): Original filename
+            file_size (int): Ukuran upload dalam bytes
+            image (PIL.Image): Loaded (non-enhanced) image
+            ocr_result (dict): Output dari OCRService
+            enhancement_level (int): Enhancement level yang dipakai
+            engine (str): Requested OCR engine
+            languages (list): Language codes
+            timestamp (str): Request timestamp
+        
+        Returns:
+            dict: Result data
+        """
+        # Calculate confidence dan statistics
+        stats = self._calculate_text_stats(ocr_result.get('text', ''))
+        
+        return {
+            'result_id': result_id,
+            'filename': filename,
+            'file_size': file_size,
+            'processing_time': ocr_result.get('processing_time', 0),
+            'enhancement_level': enhancement_level,
+            'engine_used': ocr_result.get('engine_used', engine),
+            'languages': languages,
+            'extracted_text': ocr_result.get('text', ''),
+            'confidence_score': ocr_result.get('confidence', 0),
+            'statistics': stats,
+            'metadata': {
+                'image_size': f"{image.width}x{image.height}",
+                'image_mode': image.mode,
+                'timestamp': timestamp,
+                'api_version': self._get_settings()['api_version']
+            }
+        }
+    
+    
     def process_pdf_file(self, file: FileStorage, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process PDF file untuk text extraction
@@ -238,21 +664,33 @@ class OCRController:
                 - page_end: int (optional)
                 - enhancement_level: int (1-3)
                 - try_direct: bool (try direct text extraction first)
+                - include_full_text: bool (sertakan full_text di result, default True)
         
         Returns:
             dict: PDF processing result
         """
         try:
-            self._ensure_initialized()
+            self._ensure_files()
+            self._ensure_pdf()
             
-            result_id = str(uuid.uuid4())
+            enhancement_level = params.get('enhancement_level', 2)
+            
+            result_id = uuid.uuid4().hex
             
             # Save PDF temporarily
             temp_path = self.file_manager.save_temp_file(file, result_id)
             
             try:
-                # Get PDF info
-                pdf_info = self.pdf_service.get_pdf_info(temp_path)
+                # Extract text dengan parameters; PDF info dibaca dari document yang sama
+                extraction_result = self.pdf_service.extract_text_from_pdf(
+                    temp_path,
+                    page_start=params.get('page_start'),
+                    page_end=params.get('page_end'),
+                    enhancement_level=enhancement_level,
+                    try_direct=params.get('try_direct', True)
+                )
+                
+                pdf_info = extraction_result.get('pdf_info')
                 
                 if not pdf_info:
                     return self.response_formatter.error_response(
@@ -260,47 +698,37 @@ class OCRController:
                         'Could not read the uploaded PDF'
                     )
                 
-                # Extract text dengan parameters
-                extraction_result = self.pdf_service.extract_text_from_pdf(
-                    temp_path,
-                    page_start=params.get('page_start'),
-                    page_end=params.get('page_end'),
-                    enhancement_level=params.get('enhancement_level', 2),
-                    try_direct=params.get('try_direct', True)
-                )
+                pages = extraction_result.get('pages', [])
                 
                 # Calculate statistics
-                all_text = ' '.join([page.get('text', '') for page in extraction_result.get('pages', [])])
+                all_text = ' '.join(page.get('text', '') for page in pages)
                 stats = self._calculate_text_stats(all_text)
                 
                 # Prepare result
                 result = {
                     'result_id': result_id,
                     'filename': file.filename,
-                    'file_size': len(file.read()),
+                    'file_size': os.path.getsize(temp_path),
                     'pdf_info': pdf_info,
                     'processing_method': extraction_result.get('method', 'unknown'),
-                    'pages_processed': len(extraction_result.get('pages', [])),
+                    'pages_processed': len(pages),
                     'total_processing_time': extraction_result.get('total_time', 0),
-                    'enhancement_level': params.get('enhancement_level', 2),
-                    'pages': extraction_result.get('pages', []),
-                    'full_text': all_text,
+                    'enhancement_level': enhancement_level,
+                    'pages': pages,
+                    'full_text': all_text if params.get('include_full_text', True) else None,
                     'average_confidence': extraction_result.get('average_confidence', 0),
                     'statistics': stats,
                     'metadata': {
                         'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                        'api_version': current_app.config.get('API_VERSION', '1.0.0')
+                        'api_version': self._get_settings()['api_version']
                     }
                 }
                 
                 # Save result
                 self._save_result(result_id, result)
                 
-                # Reset file pointer
-                file.seek(0)
-                
                 return self.response_formatter.success_response(
-                    f'PDF processed successfully: {len(extraction_result.get("pages", []))} pages',
+                    f'PDF processed successfully: {len(pages)} pages',
                     result
                 )
                 
@@ -327,36 +755,84 @@ class OCRController:
             dict: Stored result data atau None jika tidak ditemukan
         """
         try:
-            self._ensure_initialized()
-            return self.file_manager.load_result(result_id)
+            with self._result_cache_lock:
+                cached = self._result_cache.get(result_id)
+                if cached is not None:
+                    self._result_cache.move_to_end(result_id)
+                    return cached
+            
+            self._ensure_files()
+            
+            # Tunggu save yang masih pending untuk result ini
+            with self._pending_lock:
+                pending = self._pending_saves.get(result_id)
+            if pending is not None:
+                pending.result()
+            
+            result = self.file_manager.load_result(result_id)
+            if result is not None:
+                with self._result_cache_lock:
+                    self._result_cache[result_id] = result
+                    if len(self._result_cache) > RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+            
+            return result
             
         except Exception as e:
             current_app.logger.error(f"Failed to retrieve result {result_id}: {e}")
             return None
     
     
-    def get_models_info(self) -> Dict[str, Any]:
+    def invalidate_result(self, result_id: str) -> None:
+        """
+        Remove result dari in-memory cache (dipanggil setiap kali result ditulis)
+        
+        Args:
+            result_id (str): Result ID
+        """
+        with self._result_cache_lock:
+            self._result_cache.pop(result_id, None)
+    
+    
+    def get_models_info(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get information tentang available OCR models
         
+        Args:
+            force_refresh (bool): Abaikan cache dan query ulang engines
+        
         Returns:
             dict: Models information
         """
         try:
-            self._ensure_initialized()
+            cache = self._models_info_cache
+            now = time.time()
+            if (not force_refresh and cache['data'] is not None
+                    and now - cache['ts'] < MODELS_INFO_CACHE_TTL):
+                return self.response_formatter.success_response(
+                    'Models information retrieved',
+                    cache['data']
+                )
+            
+            self._ensure_ocr()
             
-            tesseract_info = self.ocr_service.get_tesseract_info()
-            easyocr_info = self.ocr_service.get_easyocr_info()
+            tesseract_info = self.ocr_service.get_tesseract_info(refresh=force_refresh)
+            easyocr_info = self.ocr_service.get_easyocr_info(refresh=force_refresh)
+            
+            models_info = {
+                'tesseract': tesseract_info,
+                'easyocr': easyocr_info,
+                'supported_languages': self.ocr_service.get_supported_languages(refresh=force_refresh),
+                'default_engine': self._get_settings()['default_engine'],
+                'available_engines': ['auto', 'tesseract', 'easyocr', 'both']
+            }
+            
+            cache['data'] = models_info
+            cache['ts'] = now
             
             return self.response_formatter.success_response(
                 'Models information retrieved',
-                {
-                    'tesseract': tesseract_info,
-                    'easyocr': easyocr_info,
-                    'supported_languages': self.ocr_service.get_supported_languages(),
-                    'default_engine': current_app.config.get('OCR_DEFAULT_ENGINE', 'both'),
-                    'available_engines': ['tesseract', 'easyocr', 'both']
-                }
+                models_info
             )
             
         except Exception as e:
@@ -387,17 +863,31 @@ class OCRController:
                 'has_special_chars': False
             }
         
-        import re
-        
-        # Basic counts
         char_count = len(text)
+        
+        # Text panjang: single-pass compiled kernel (ASCII-only supaya semantics sama)
+        if char_count >= _KERNEL_MIN_LENGTH and text.isascii():
+            kernels = _get_text_kernels()
+            if kernels.NUMBA_AVAILABLE:
+                word_count, line_count, paragraph_count, has_numbers, has_special_chars = \
+                    kernels.ascii_text_stats(text)
+                return {
+                    'character_count': char_count,
+                    'word_count': word_count,
+                    'line_count': line_count,
+                    'paragraph_count': paragraph_count,
+                    'has_numbers': has_numbers,
+                    'has_special_chars': has_special_chars
+                }
+        
+        # Basic counts (C-level str methods, tanpa list allocation kecuali untuk words)
         word_count = len(text.split())
-        line_count = len(text.split('\n'))
-        paragraph_count = len([p for p in text.split('\n\n') if p.strip()])
+        line_count = text.count('\n') + 1
+        paragraph_count = _count_paragraphs(text)
         
         # Content analysis
-        has_numbers = bool(re.search(r'\d', text))
-        has_special_chars = bool(re.search(r'[!@#$%^&*(),.?":{}|<>]', text))
+        has_numbers = _DIGIT_RE.search(text) is not None
+        has_special_chars = not _SPECIAL_CHARS.isdisjoint(text)
         
         return {
             'character_count': char_count,
@@ -411,15 +901,39 @@ class OCRController:
     
     def _save_result(self, result_id: str, result_data: Dict[str, Any]) -> None:
         """
-        Save result ke storage untuk future retrieval
+        Save result ke storage untuk future retrieval (di background thread)
+        
+        Shallow copy diambil di sini karena FileManager.save_result menambah
+        _metadata dan caller masih bisa memodifikasi dict setelah return.
         
         Args:
             result_id (str): Unique result ID
             result_data (dict): Result data untuk disimpan
         """
         try:
-            self.file_manager.save_result(result_id, result_data)
+            self.invalidate_result(result_id)
+            future = self._save_executor.submit(self._write_result, result_id, dict(result_data))
+            
+            with self._pending_lock:
+                self._pending_saves[result_id] = future
+            future.add_done_callback(lambda _: self._discard_pending(result_id))
             
         except Exception as e:
-            current_app.logger.error(f"Failed to save result {result_id}: {e}")
+            # Module logger: juga dipanggil dari batch worker threads tanpa app context
+            logger.error("Failed to save result %s: %s", result_id, e)
             # Don't raise error, just log it
+    
+    
+    def _write_result(self, result_id: str, result_data: Dict[str, Any]) -> None:
+        """Write result ke disk (dijalankan di save executor, tanpa app context)"""
+        try:
+            self.file_manager.save_result(result_id, result_data)
+            
+        except Exception as e:
+            logger.error("Failed to save result %s: %s", result_id, e)
+    
+    
+    def _discard_pending(self, result_id: str) -> None:
+        """Remove result dari pending saves setelah write selesai"""
+        with self._pending_lock:
+            self._pending_saves.pop(result_id, None)
@@ -12,9 +12,10 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import uuid
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Bounding box untuk detected text"""
     x: int
@@ -42,7 +43,7 @@ class BoundingBox:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectedWord:
     """Individual detected word dengan metadata"""
     text: str
@@ -67,7 +68,58 @@ class DetectedWord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class OCRResultVectorized:
+    """
+    Detected words dalam struct-of-arrays layout
+    
+    Untuk results dengan banyak words: satu list texts plus numpy arrays
+    untuk confidences (float32) dan bboxes (N x 4 int32: x, y, width, height),
+    tanpa DetectedWord/BoundingBox object per word.
+    """
+    texts: List[str] = field(default_factory=list)
+    confidences: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    bboxes: np.ndarray = field(default_factory=lambda: np.empty((0, 4), dtype=np.int32))
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def __getitem__(self, index: int) -> DetectedWord:
+        """Single-word view sebagai DetectedWord"""
+        x, y, width, height = self.bboxes[index].tolist()
+        return DetectedWord(
+            text=self.texts[index],
+            confidence=float(self.confidences[index]),
+            bbox=BoundingBox(x=x, y=y, width=width, height=height)
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert ke columnar dictionary"""
+        return {
+            'texts': self.texts,
+            'confidences': self.confidences.tolist(),
+            'bboxes': self.bboxes.tolist()
+        }
+    
+    def to_words(self) -> List[DetectedWord]:
+        """Convert ke list of DetectedWord"""
+        return [self[i] for i in range(len(self.texts))]
+    
+    @classmethod
+    def from_words(cls, words: List[Dict[str, Any]]) -> 'OCRResultVectorized':
+        """Create dari word dicts (format output OCRService)"""
+        count = len(words)
+        return cls(
+            texts=[word['text'] for word in words],
+            confidences=np.fromiter((word['confidence'] for word in words), dtype=np.float32, count=count),
+            bboxes=np.array(
+                [(b['x'], b['y'], b['width'], b['height']) for b in (word['bbox'] for word in words)],
+                dtype=np.int32
+            ).reshape(count, 4)
+        )
+
+
+@dataclass(slots=True)
 class ImageStats:
     """Image statistics dan quality metrics"""
     width: int
@@ -103,7 +155,7 @@ class ImageStats:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TextStatistics:
     """Text content statistics"""
     character_count: int
@@ -125,10 +177,10 @@ class TextStatistics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """Complete OCR result untuk single image"""
-    result_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    result_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     filename: str = ""
     file_size: int = 0
     processing_time: float = 0.0
@@ -163,7 +215,7 @@ class OCRResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFPageResult:
     """OCR result untuk single PDF page"""
     page_number: int
@@ -189,7 +241,7 @@ class PDFPageResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFInfo:
     """PDF file information"""
     filename: str
@@ -213,10 +265,10 @@ class PDFInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFResult:
     """Complete PDF processing result"""
-    result_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    result_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     filename: str = ""
     file_size: int = 0
     pdf_info: Optional[PDFInfo] = None
@@ -251,10 +303,10 @@ class PDFResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Batch processing result"""
-    batch_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    batch_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     total_files: int = 0
     successful: int = 0
     failed: int = 0
@@ -279,7 +331,7 @@ class BatchResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineInfo:
     """OCR Engine information"""
     name: str
@@ -301,7 +353,7 @@ class EngineInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemHealth:
     """System health information"""
     status: str = "unknown"  # 'healthy', 'warning', 'critical'
@@ -8,7 +8,7 @@ Author: AI Assistant
 Date: August 2025
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, stream_with_context
 import os
 from werkzeug.utils import secure_filename
 import uuid
@@ -26,6 +26,70 @@ api_bp = Blueprint('api', __name__)
 ocr_controller = OCRController()
 health_controller = HealthController()
 
+# Key di app.extensions untuk config values yang di-cache per app saat blueprint di-register
+_EXTENSION_KEY = 'ocr_api'
+
+
+def _app_settings(app) -> dict:
+    """Per-app settings dict (satu process bisa punya beberapa apps, misal tests)"""
+    return app.extensions.setdefault(_EXTENSION_KEY, {
+        'api_info': {},
+        'request_defaults': {},
+        'validation_config': {}
+    })
+
+
+def _api_info() -> dict:
+    """Static bagian dari api_info response untuk current app"""
+    return current_app.extensions[_EXTENSION_KEY]['api_info']
+
+
+def _request_defaults() -> dict:
+    """Default OCR parameters untuk current app"""
+    return current_app.extensions[_EXTENSION_KEY]['request_defaults']
+
+
+def _validation_config() -> dict:
+    """File validation settings untuk current app"""
+    return current_app.extensions[_EXTENSION_KEY]['validation_config']
+
+
+@api_bp.record_once
+def _init_api_info(state):
+    """Cache config values untuk api_info saat blueprint pertama kali di-register ke app"""
+    config = state.app.config
+    _app_settings(state.app)['api_info'].update({
+        'service': config.get('API_TITLE', 'OCR ML Engine API'),
+        'version': config.get('API_VERSION', '1.0.0'),
+        'description': config.get('API_DESCRIPTION', 'OCR API untuk text extraction'),
+        'supported_formats': {
+            'images': list(config.get('ALLOWED_IMAGE_EXTENSIONS', [])),
+            'documents': list(config.get('ALLOWED_PDF_EXTENSIONS', []))
+        }
+    })
+
+
+@api_bp.record_once
+def _init_request_defaults(state):
+    """Cache default parameters dan validation settings untuk OCR handlers"""
+    config = state.app.config
+    settings = _app_settings(state.app)
+    validation_config = settings['validation_config']
+    
+    settings['request_defaults'].update({
+        'enhancement_level': config.get('OCR_DEFAULT_ENHANCEMENT_LEVEL', 2),
+        'engine': config.get('OCR_DEFAULT_ENGINE', 'auto'),
+        'languages': ','.join(config.get('OCR_DEFAULT_LANGUAGES', ['en', 'id'])),
+        'batch_max_files': config.get('OCR_BATCH_MAX_FILES', 24)
+    })
+    
+    validation_config.update({
+        'MAX_FILE_SIZE': config.get('MAX_FILE_SIZE', 50 * 1024 * 1024)
+    })
+    for key in ('ALLOWED_IMAGE_EXTENSIONS', 'ALLOWED_PDF_EXTENSIONS'):
+        if key in config:
+            validation_config[key] = frozenset(config[key])
+
 
 @api_bp.route('/', methods=['GET'])
 def api_info():
@@ -35,10 +99,11 @@ def api_info():
     Returns:
         dict: API information dan available endpoints
     """
+    info = _api_info()
     return jsonify({
-        'service': current_app.config.get('API_TITLE', 'OCR ML Engine API'),
-        'version': current_app.config.get('API_VERSION', '1.0.0'),
-        'description': current_app.config.get('API_DESCRIPTION', 'OCR API untuk text extraction'),
+        'service': info['service'],
+        'version': info['version'],
+        'description': info['description'],
         'status': 'running',
         'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
         'endpoints': {
@@ -49,10 +114,7 @@ def api_info():
             'POST /api/ocr/pdf': 'OCR untuk PDF file',
             'GET /api/results/<result_id>': 'Get OCR result by ID'
         },
-        'supported_formats': {
-            'images': list(current_app.config.get('ALLOWED_IMAGE_EXTENSIONS', [])),
-            'documents': list(current_app.config.get('ALLOWED_PDF_EXTENSIONS', []))
-        }
+        'supported_formats': info['supported_formats']
     })
 
 
@@ -61,10 +123,14 @@ def health_check():
     """
     Health check endpoint untuk monitoring
     
+    Expected:
+        - Optional: refresh (boolean) untuk force recompute dependency report
+    
     Returns:
         dict: System health status
     """
-    return health_controller.get_health_status()
+    refresh = request.args.get('refresh', 'false').lower() == 'true'
+    return health_controller.get_health_status(refresh=refresh)
 
 
 @api_bp.route('/ocr/image', methods=['POST'])
@@ -75,7 +141,7 @@ def ocr_single_image():
     Expected:
         - multipart/form-data dengan 'file' field
         - Optional: enhancement_level (1-3)
-        - Optional: engine ('tesseract', 'easyocr', 'both')
+        - Optional: engine ('auto', 'tesseract', 'easyocr', 'both')
         - Optional: languages (comma-separated)
     
     Returns:
@@ -93,7 +159,7 @@ def ocr_single_image():
         file = request.files['file']
         
         # Validate file
-        file_validation = validate_file(file, 'image', current_app.config)
+        file_validation = validate_file(file, 'image', _validation_config())
         if not file_validation['valid']:
             return jsonify({
                 'error': file_validation['message'],
@@ -101,13 +167,12 @@ def ocr_single_image():
             }), 400
         
         # Get optional parameters
+        defaults = _request_defaults()
         params = {
-            'enhancement_level': int(request.form.get('enhancement_level', 
-                                   current_app.config.get('OCR_DEFAULT_ENHANCEMENT_LEVEL', 2))),
-            'engine': request.form.get('engine', 
-                                     current_app.config.get('OCR_DEFAULT_ENGINE', 'both')),
-            'languages': request.form.get('languages', 
-                                        ','.join(current_app.config.get('OCR_DEFAULT_LANGUAGES', ['en', 'id'])))
+            'enhancement_level': int(request.form.get('enhancement_level',
+                                                      defaults['enhancement_level'])),
+            'engine': request.form.get('engine', defaults['engine']),
+            'languages': request.form.get('languages', defaults['languages'])
         }
         
         # Process dengan controller
@@ -132,11 +197,13 @@ def ocr_batch_images():
     Expected:
         - multipart/form-data dengan multiple 'files' fields
         - Optional: enhancement_level (1-3)
-        - Optional: engine ('tesseract', 'easyocr', 'both')
+        - Optional: engine ('auto', 'tesseract', 'easyocr', 'both')
         - Optional: languages (comma-separated)
+        - Optional: stream (boolean) atau Accept: application/x-ndjson untuk
+          menerima satu JSON line per file segera setelah file selesai
     
     Returns:
-        dict: Batch OCR results
+        dict: Batch OCR results (atau ndjson stream dari per-file results)
     """
     try:
         # Validate request untuk batch
@@ -149,12 +216,22 @@ def ocr_batch_images():
         
         files = request.files.getlist('files')
         
+        # Tolak batch yang terlalu besar sebelum validasi dan processing dimulai
+        max_files = _request_defaults()['batch_max_files']
+        if len(files) > max_files:
+            return jsonify({
+                'error': 'Too many files',
+                'message': f'Batch contains {len(files)} files, maximum is {max_files}. '
+                           f'Split the upload into multiple batch requests.',
+                'status_code': 413
+            }), 413
+        
         # Validate semua files
-        validated_files = []
-        for file in files:
-            file_validation = validate_file(file, 'image', current_app.config)
-            if file_validation['valid']:
-                validated_files.append(file)
+        validation_config = _validation_config()
+        validated_files = [
+            file for file in files
+            if validate_file(file, 'image', validation_config)['valid']
+        ]
         
         if not validated_files:
             return jsonify({
@@ -163,15 +240,30 @@ def ocr_batch_images():
             }), 400
         
         # Get parameters
+        defaults = _request_defaults()
         params = {
-            'enhancement_level': int(request.form.get('enhancement_level', 
-                                   current_app.config.get('OCR_DEFAULT_ENHANCEMENT_LEVEL', 2))),
-            'engine': request.form.get('engine', 
-                                     current_app.config.get('OCR_DEFAULT_ENGINE', 'both')),
-            'languages': request.form.get('languages', 
-                                        ','.join(current_app.config.get('OCR_DEFAULT_LANGUAGES', ['en', 'id'])))
+            'enhancement_level': int(request.form.get('enhancement_level',
+                                                      defaults['enhancement_level'])),
+            'engine': request.form.get('engine', defaults['engine']),
+            'languages': request.form.get('languages', defaults['languages'])
         }
         
+        # Streamed response: results dikirim sesuai urutan selesai
+        wants_stream = (request.form.get('stream', 'false').lower() == 'true'
+                        or request.accept_mimetypes.best == 'application/x-ndjson')
+        if wants_stream:
+            file_results = ocr_controller.process_batch_images_stream(validated_files, params)
+            dumps = current_app.json.dumps
+            
+            def generate():
+                for file_result in file_results:
+                    yield dumps(file_result) + '\n'
+            
+            return current_app.response_class(
+                stream_with_context(generate()),
+                mimetype='application/x-ndjson'
+            )
+        
         # Process dengan controller
         result = ocr_controller.process_batch_images(validated_files, params)
         
@@ -196,6 +288,7 @@ def ocr_pdf_file():
         - Optional: page_start, page_end untuk range processing
         - Optional: enhancement_level (1-3)
         - Optional: try_direct (boolean)
+        - Optional: include_full_text (boolean, default true)
     
     Returns:
         dict: PDF OCR results
@@ -212,7 +305,7 @@ def ocr_pdf_file():
         file = request.files['file']
         
         # Validate PDF file
-        file_validation = validate_file(file, 'pdf', current_app.config)
+        file_validation = validate_file(file, 'pdf', _validation_config())
         if not file_validation['valid']:
             return jsonify({
                 'error': file_validation['message'],
@@ -221,11 +314,12 @@ def ocr_pdf_file():
         
         # Get parameters
         params = {
-            'enhancement_level': int(request.form.get('enhancement_level', 
-                                   current_app.config.get('OCR_DEFAULT_ENHANCEMENT_LEVEL', 2))),
+            'enhancement_level': int(request.form.get('enhancement_level',
+                                                      _request_defaults()['enhancement_level'])),
             'page_start': request.form.get('page_start', type=int),
             'page_end': request.form.get('page_end', type=int),
-            'try_direct': request.form.get('try_direct', 'true').lower() == 'true'
+            'try_direct': request.form.get('try_direct', 'true').lower() == 'true',
+            'include_full_text': request.form.get('include_full_text', 'true').lower() == 'true'
         }
         
         # Process dengan controller
@@ -279,11 +373,15 @@ def models_info():
     """
     Get information tentang OCR models yang tersedia
     
+    Expected:
+        - Optional: refresh (boolean) untuk force refresh cached models info
+    
     Returns:
         dict: Information tentang available models
     """
     try:
-        info = ocr_controller.get_models_info()
+        refresh = request.args.get('refresh', 'false').lower() == 'true'
+        info = ocr_controller.get_models_info(force_refresh=refresh)
         return jsonify(info), 200
         
     except Exception as e:
@@ -8,12 +8,32 @@ Author: AI Assistant
 Date: August 2025
 """
 
+import io
+import os
 import logging
-from typing import Optional, Tuple, Union
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Union, BinaryIO
 import numpy as np
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image, ImageFilter
 import cv2
 
+# IMREAD_COLOR selalu 3-channel 8-bit; EXIF orientation diabaikan seperti PIL
+_IMREAD_FLAGS = cv2.IMREAD_COLOR | cv2.IMREAD_IGNORE_ORIENTATION
+
+# Batas per-thread buffer pool: jumlah shapes yang disimpan dan buffers per shape
+_POOL_MAX_SHAPES = 4
+_POOL_BUFFERS_PER_SHAPE = 3
+
+# cv2.ocl.Device TYPE_GPU bit (juga set untuk TYPE_DGPU / TYPE_IGPU)
+_OCL_DEVICE_TYPE_GPU = 4
+
+# Longest edge untuk orientation / text region analysis
+_ANALYSIS_MAX_SIDE = 1024
+
+# Intensity levels untuk histogram-based statistics
+_LEVELS = np.arange(256, dtype=np.float64)
+
 
 class ImageService:
     """
@@ -51,6 +71,165 @@ class ImageService:
                 'brightness_factor': 1.2
             }
         }
+        
+        # Structuring element untuk level 3 clean up
+        self._morph_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
+        
+        # Per-thread pool untuk intermediate buffers (lihat _get_buffer)
+        self._buffer_pools = threading.local()
+        
+        # Deteksi CUDA build sekali saja (opencv-python default tanpa CUDA)
+        self.cuda_available = self._detect_cuda()
+        
+        # Tanpa CUDA, pakai OpenCL (T-API / UMat) jika ada GPU device
+        self.opencl_available = not self.cuda_available and self._detect_opencl_gpu()
+        
+        # Enhancement pipeline per level dengan semua constants sudah di-bind
+        self._enhance_fns = {
+            level: self._compile_enhance(level, config)
+            for level, config in self.enhancement_configs.items()
+        }
+    
+    
+    def _compile_enhance(self, level: int, config: dict):
+        """
+        Build enhancement pipeline untuk satu level
+        
+        Tone LUT (contrast sekitar mid-gray + brightness) dan sharpening kernel
+        (ekuivalen ImageEnhance.Sharpness) dihitung sekali di sini dan
+        di-capture oleh closure, jadi tidak ada config lookup per request.
+        
+        Args:
+            level (int): Enhancement level
+            config (dict): Enhancement config untuk level tersebut
+        
+        Returns:
+            callable: Function (RGB np.ndarray) -> PIL.Image
+        """
+        denoise = self._denoise
+        apply_text_enhancement = self._apply_text_enhancement
+        get_buffer = self._get_buffer
+        put_buffer = self._put_buffer
+        
+        strength = config['denoise_strength']
+        tone_lut = self._build_tone_lut(config['contrast_factor'], config['brightness_factor'])
+        sharpen_kernel = self._build_sharpen_kernel(config['sharpen_factor'])
+        
+        if self.cuda_available:
+            return self._compile_enhance_gpu(level, strength, tone_lut, sharpen_kernel)
+        
+        if self.opencl_available:
+            return self._compile_enhance_opencl(level, strength, tone_lut, sharpen_kernel)
+        
+        def enhance(cv_image: np.ndarray) -> Image.Image:
+            # Seluruh pipeline tetap di RGB uint8 arrays (dari buffer pool) sampai akhir
+            denoised = denoise(cv_image, level, strength, dst=get_buffer(cv_image.shape))
+            
+            # Contrast + brightness sebagai satu table lookup (in-place)
+            cv2.LUT(denoised, tone_lut, dst=denoised)
+            
+            # Sharpening
+            sharpened = cv2.filter2D(denoised, -1, sharpen_kernel, dst=get_buffer(cv_image.shape))
+            
+            # Additional processing untuk text clarity
+            enhanced_image = apply_text_enhancement(sharpened, level)
+            
+            # PIL sudah meng-copy pixels, buffers bisa dipakai request berikutnya
+            put_buffer(denoised)
+            put_buffer(sharpened)
+            return enhanced_image
+        
+        return enhance
+    
+    
+    @staticmethod
+    def _build_tone_lut(contrast: float, brightness: float) -> np.ndarray:
+        """Build uint8 LUT untuk contrast + brightness adjustment"""
+        values = np.arange(256, dtype=np.float64) / 255.0
+        lut = ((values - 0.5) * contrast + 0.5) * 255 * brightness
+        return np.clip(np.rint(lut), 0, 255).astype(np.uint8)
+    
+    
+    @staticmethod
+    def _build_sharpen_kernel(factor: float) -> np.ndarray:
+        """Build 3x3 sharpening kernel: factor * identity + (1 - factor) * smooth"""
+        smooth = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32) / 13
+        identity = np.zeros((3, 3), dtype=np.float32)
+        identity[1, 1] = 1
+        return factor * identity + (1 - factor) * smooth
+    
+    
+    def _get_buffer(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """
+        Ambil uninitialized buffer dari per-thread pool (atau alokasi baru)
+        
+        Args:
+            shape (tuple): Array shape
+            dtype: Array dtype
+        
+        Returns:
+            np.ndarray: Buffer dengan shape dan dtype yang diminta
+        """
+        pool = getattr(self._buffer_pools, 'pool', None)
+        if pool is not None:
+            buffers = pool.get((shape, np.dtype(dtype)))
+            if buffers:
+                return buffers.pop()
+        return np.empty(shape, dtype=dtype)
+    
+    
+    def _put_buffer(self, buffer: np.ndarray) -> None:
+        """
+        Kembalikan buffer ke per-thread pool untuk dipakai ulang
+        
+        Pool hanya menyimpan buffers untuk beberapa shape terakhir supaya
+        memory tidak tumbuh tanpa batas saat ukuran image bervariasi.
+        
+        Args:
+            buffer (np.ndarray): Buffer yang sudah tidak dipakai caller
+        """
+        pool = getattr(self._buffer_pools, 'pool', None)
+        if pool is None:
+            pool = self._buffer_pools.pool = OrderedDict()
+        
+        key = (buffer.shape, buffer.dtype)
+        buffers = pool.setdefault(key, [])
+        pool.move_to_end(key)
+        if len(buffers) < _POOL_BUFFERS_PER_SHAPE:
+            buffers.append(buffer)
+        
+        while len(pool) > _POOL_MAX_SHAPES:
+            pool.popitem(last=False)
+    
+    
+    def _detect_opencl_gpu(self) -> bool:
+        """
+        Enable OpenCL T-API jika default OpenCL device adalah GPU
+        
+        CPU-only OpenCL runtimes (mis. pocl) tidak dipakai karena biasanya
+        lebih lambat dari native SIMD path OpenCV.
+        """
+        try:
+            if not cv2.ocl.haveOpenCL():
+                return False
+            
+            cv2.ocl.setUseOpenCL(True)
+            device = cv2.ocl.Device.getDefault()
+            if cv2.ocl.useOpenCL() and device.type() & _OCL_DEVICE_TYPE_GPU:
+                return True
+            
+            cv2.ocl.setUseOpenCL(False)
+            return False
+        except Exception:
+            return False
+    
+    
+    def _detect_cuda(self) -> bool:
+        """Check apakah OpenCV punya CUDA device yang bisa dipakai"""
+        try:
+            return hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except Exception:
+            return False
     
     
     def load_image(self, image_path: str) -> Optional[Image.Image]:
@@ -64,21 +243,209 @@ class ImageService:
             PIL.Image: Loaded image atau None jika gagal
         """
         try:
-            # Load image dengan PIL
-            image = Image.open(image_path)
+            # Decode dengan OpenCV (libjpeg-turbo/libpng), fallback ke PIL
+            # untuk format yang tidak didukung OpenCV (mis. GIF)
+            cv_image = cv2.imread(image_path, _IMREAD_FLAGS)
+            if cv_image is not None:
+                image = self._rgb_from_bgr(cv_image)
+            else:
+                image = Image.open(image_path)
+                
+                # Convert ke RGB jika bukan RGB mode
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+            
+            self.logger.info(f"Successfully loaded image: {image_path} ({image.size})")
+            return image
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load image {image_path}: {e}")
+            return None
+    
+    
+    def load_image_from_stream(self, stream: BinaryIO) -> Optional[Image.Image]:
+        """
+        Load image langsung dari file-like stream (tanpa temp file)
+        
+        Args:
+            stream: Seekable binary stream (mis. FileStorage.stream)
+        
+        Returns:
+            PIL.Image: Loaded image atau None jika gagal
+        """
+        try:
+            buffer = self._read_stream_buffer(stream)
+            
+            cv_image = cv2.imdecode(buffer, _IMREAD_FLAGS) if buffer.size else None
+            if cv_image is not None:
+                return self._rgb_from_bgr(cv_image)
+            
+            stream.seek(0)
+            image = Image.open(stream)
+            
+            # Decode sekarang, selama stream masih terbuka
+            image.load()
             
             # Convert ke RGB jika bukan RGB mode
             if image.mode != 'RGB':
                 image = image.convert('RGB')
             
-            self.logger.info(f"Successfully loaded image: {image_path} ({image.size})")
             return image
             
         except Exception as e:
-            self.logger.error(f"Failed to load image {image_path}: {e}")
+            self.logger.error(f"Failed to load image from stream: {e}")
             return None
     
     
+    @staticmethod
+    def _read_stream_buffer(stream: BinaryIO) -> np.ndarray:
+        """
+        Read seluruh stream ke uint8 array dengan satu alokasi
+        
+        In-memory uploads (BytesIO) dipakai langsung tanpa copy; file-backed
+        uploads dibaca ke bytearray yang sudah di-size sesuai ukuran stream.
+        
+        Args:
+            stream: Seekable binary stream
+        
+        Returns:
+            np.ndarray: Encoded image bytes
+        """
+        if isinstance(stream, io.BytesIO):
+            return np.frombuffer(stream.getbuffer(), dtype=np.uint8)
+        
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(0)
+        buffer = bytearray(size)
+        read = stream.readinto(buffer)
+        return np.frombuffer(buffer, dtype=np.uint8, count=read)
+    
+    
+    @staticmethod
+    def _rgb_from_bgr(cv_image: np.ndarray) -> Image.Image:
+        """Convert decoded BGR array ke PIL RGB image (konversi in-place)"""
+        cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB, dst=cv_image)
+        return Image.fromarray(cv_image)
+    
+    
+    def _compile_enhance_gpu(self, level: int, strength: int,
+                             tone_lut: np.ndarray, sharpen_kernel: np.ndarray):
+        """
+        Build enhancement pipeline yang seluruhnya berjalan di CUDA device
+        
+        Image di-upload sekali dan hanya hasil akhir yang di-download.
+        Adaptive threshold (Gaussian, block 11, C=2) disusun dari Gaussian
+        filter + compare karena cv2.cuda tidak punya adaptiveThreshold.
+        
+        Args:
+            level (int): Enhancement level
+            strength (int): Denoise strength
+            tone_lut (np.ndarray): 256-entry tone LUT
+            sharpen_kernel (np.ndarray): 3x3 sharpening kernel
+        
+        Returns:
+            callable: Function (RGB np.ndarray) -> PIL.Image
+        """
+        denoise = self._denoise_gpu
+        
+        tone_filter = cv2.cuda.createLookUpTable(tone_lut.reshape(1, 256))
+        # Linear filter CUDA tidak support 3-channel, sharpening dilakukan di RGBA
+        sharpen_filter = cv2.cuda.createLinearFilter(cv2.CV_8UC4, cv2.CV_8UC4, sharpen_kernel)
+        
+        adaptive_threshold = self._build_adaptive_threshold_gpu()
+        open_filter = cv2.cuda.createMorphologyFilter(cv2.MORPH_OPEN, cv2.CV_8UC1, self._morph_kernel)
+        
+        def enhance(cv_image: np.ndarray) -> Image.Image:
+            gpu_image = cv2.cuda_GpuMat()
+            gpu_image.upload(cv_image)
+            
+            gpu_image = denoise(gpu_image, level, strength)
+            gpu_image = tone_filter.transform(gpu_image)
+            gpu_image = cv2.cuda.cvtColor(gpu_image, cv2.COLOR_RGB2RGBA)
+            gpu_image = sharpen_filter.apply(gpu_image)
+            
+            if level >= 2:
+                gray = cv2.cuda.cvtColor(gpu_image, cv2.COLOR_RGBA2GRAY)
+                binary = adaptive_threshold(gray)
+                if level == 3:
+                    binary = open_filter.apply(binary)
+                gpu_image = cv2.cuda.cvtColor(binary, cv2.COLOR_GRAY2RGB)
+            else:
+                gpu_image = cv2.cuda.cvtColor(gpu_image, cv2.COLOR_RGBA2RGB)
+            
+            return Image.fromarray(gpu_image.download())
+        
+        return enhance
+    
+    
+    @staticmethod
+    def _build_adaptive_threshold_gpu():
+        """
+        Build CUDA equivalent dari cv2.adaptiveThreshold (Gaussian, block 11, C=2, THRESH_BINARY)
+        
+        OpenCV: dst = 255 jika src - mean > -C, dengan mean uint8 Gaussian blur
+        (BORDER_REPLICATE). Dalam integers: src - mean > -2  <=>  src + 1 >= mean.
+        LUT +1 hanya clip di src = 255, dan 255 >= mean selalu benar, jadi
+        hasilnya tetap exact (background putih tetap putih).
+        
+        Returns:
+            callable: Function (CV_8UC1 GpuMat) -> CV_8UC1 GpuMat binary
+        """
+        blur_filter = cv2.cuda.createGaussianFilter(
+            cv2.CV_8UC1, cv2.CV_8UC1, (11, 11), 0, 0,
+            cv2.BORDER_REPLICATE, cv2.BORDER_REPLICATE
+        )
+        offset_filter = cv2.cuda.createLookUpTable(
+            np.clip(np.arange(256) + 1, 0, 255).astype(np.uint8).reshape(1, 256)
+        )
+        
+        def adaptive_threshold(gray):
+            return cv2.cuda.compare(
+                offset_filter.transform(gray), blur_filter.apply(gray), cv2.CMP_GE
+            )
+        
+        return adaptive_threshold
+    
+    
+    def _compile_enhance_opencl(self, level: int, strength: int,
+                                tone_lut: np.ndarray, sharpen_kernel: np.ndarray):
+        """
+        Build enhancement pipeline di atas cv2.UMat (OpenCL transparent API)
+        
+        Operasi sama dengan CPU pipeline; OpenCV men-dispatch setiap call ke
+        OpenCL device dan data tetap di device sampai UMat.get() di akhir.
+        
+        Args:
+            level (int): Enhancement level
+            strength (int): Denoise strength
+            tone_lut (np.ndarray): 256-entry tone LUT
+            sharpen_kernel (np.ndarray): 3x3 sharpening kernel
+        
+        Returns:
+            callable: Function (RGB np.ndarray) -> PIL.Image
+        """
+        denoise = self._denoise
+        morph_kernel = self._morph_kernel
+        
+        def enhance(cv_image: np.ndarray) -> Image.Image:
+            umat = denoise(cv2.UMat(cv_image), level, strength)
+            umat = cv2.LUT(umat, tone_lut)
+            umat = cv2.filter2D(umat, -1, sharpen_kernel)
+            
+            if level >= 2:
+                gray = cv2.cvtColor(umat, cv2.COLOR_RGB2GRAY)
+                binary = cv2.adaptiveThreshold(
+                    gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+                )
+                if level == 3:
+                    binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, morph_kernel)
+                umat = cv2.cvtColor(binary, cv2.COLOR_GRAY2RGB)
+            
+            return Image.fromarray(umat.get())
+        
+        return enhance
+    
+    
     def enhance_image(self, image: Image.Image, level: int = 2) -> Image.Image:
         """
         Apply enhancement ke image untuk improve OCR accuracy
@@ -91,34 +458,10 @@ class ImageService:
             PIL.Image: Enhanced image
         """
         try:
-            if level not in self.enhancement_configs:
+            if level not in self._enhance_fns:
                 level = 2  # Default ke medium
             
-            config = self.enhancement_configs[level]
-            enhanced_image = image.copy()
-            
-            cv_image = np.array(enhanced_image)
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2BGR)
-            
-            cv_image = cv2.fastNlMeansDenoisingColored(
-                cv_image, None, config['denoise_strength'], config['denoise_strength'], 7, 21
-            )
-            
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB)
-            enhanced_image = Image.fromarray(cv_image)
-            
-            contrast_enhancer = ImageEnhance.Contrast(enhanced_image)
-            enhanced_image = contrast_enhancer.enhance(config['contrast_factor'])
-            
-            brightness_enhancer = ImageEnhance.Brightness(enhanced_image)
-            enhanced_image = brightness_enhancer.enhance(config['brightness_factor'])
-            
-            # 5. Sharpening
-            sharpness_enhancer = ImageEnhance.Sharpness(enhanced_image)
-            enhanced_image = sharpness_enhancer.enhance(config['sharpen_factor'])
-            
-            # 6. Additional processing untuk text clarity
-            enhanced_image = self._apply_text_enhancement(enhanced_image, level)
+            enhanced_image = self._enhance_fns[level](np.asarray(image))
             
             self.logger.info(f"Applied enhancement level {level} to image")
             return enhanced_image
@@ -128,48 +471,102 @@ class ImageService:
             return image  # Return original jika enhancement gagal
     
     
-    def _apply_text_enhancement(self, image: Image.Image, level: int) -> Image.Image:
+    def _denoise(self, rgb_image: np.ndarray, level: int, strength: int,
+                 dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Denoise RGB image sesuai enhancement level
+        
+        Level 1-2 memakai bilateral filter (channel-agnostic, tanpa konversi
+        RGB/BGR). Level 3 tetap memakai NL-means dengan window lebih kecil.
+        
+        Args:
+            rgb_image (np.ndarray): RGB uint8 image (atau cv2.UMat)
+            level (int): Enhancement level
+            strength (int): Denoise strength dari enhancement config
+            dst (np.ndarray): Optional output buffer (dipakai oleh bilateral path)
+        
+        Returns:
+            np.ndarray: Denoised RGB image
+        """
+        if level < 3:
+            sigma = strength * 10
+            return cv2.bilateralFilter(rgb_image, 5, sigma, sigma, dst=dst)
+        
+        # NL-means colored bekerja di Lab space, jadi butuh urutan BGR
+        bgr_image = cv2.cvtColor(rgb_image, cv2.COLOR_RGB2BGR)
+        bgr_image = cv2.fastNlMeansDenoisingColored(
+            bgr_image, None, strength, strength, 5, 15
+        )
+        return cv2.cvtColor(bgr_image, cv2.COLOR_BGR2RGB)
+    
+    
+    def _denoise_gpu(self, gpu_image, level: int, strength: int):
+        """
+        GPU version dari _denoise (input dan output cv2.cuda_GpuMat RGB)
+        
+        Args:
+            gpu_image (cv2.cuda_GpuMat): RGB uint8 image di device
+            level (int): Enhancement level
+            strength (int): Denoise strength dari enhancement config
+        
+        Returns:
+            cv2.cuda_GpuMat: Denoised RGB image di device
+        """
+        if level < 3:
+            sigma = strength * 10
+            return cv2.cuda.bilateralFilter(gpu_image, 5, sigma, sigma)
+        
+        bgr_image = cv2.cuda.cvtColor(gpu_image, cv2.COLOR_RGB2BGR)
+        bgr_image = cv2.cuda.fastNlMeansDenoisingColored(
+            bgr_image, strength, strength, search_window=15, block_size=5
+        )
+        return cv2.cuda.cvtColor(bgr_image, cv2.COLOR_BGR2RGB)
+    
+    
+    def _apply_text_enhancement(self, image: np.ndarray, level: int) -> Image.Image:
         """
         Apply specific enhancements untuk text recognition
         
         Args:
-            image (PIL.Image): Input image
+            image (np.ndarray): RGB uint8 image array
             level (int): Enhancement level
         
         Returns:
             PIL.Image: Text-enhanced image
         """
         try:
-            # Convert ke grayscale untuk text processing
-            gray_image = image.convert('L')
-            
-            # Convert ke OpenCV format
-            cv_gray = np.array(gray_image)
-            
             # Apply adaptive thresholding untuk better text separation
             if level >= 2:
+                gray_shape = image.shape[:2]
+                
+                # Convert ke grayscale untuk text processing
+                cv_gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY, dst=self._get_buffer(gray_shape))
+                
                 # Gaussian adaptive threshold
                 binary = cv2.adaptiveThreshold(
-                    cv_gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+                    cv_gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2,
+                    dst=self._get_buffer(gray_shape)
                 )
                 
-                # Morphological operations untuk clean up
+                # Morphological opening untuk clean up (in-place, tanpa alokasi baru)
                 if level == 3:
-                    kernel = np.ones((2, 2), np.uint8)
-                    binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-                    binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
+                    cv2.morphologyEx(binary, cv2.MORPH_OPEN, self._morph_kernel, dst=binary)
                 
                 # Convert back ke RGB
-                enhanced = cv2.cvtColor(binary, cv2.COLOR_GRAY2RGB)
-                return Image.fromarray(enhanced)
+                enhanced = cv2.cvtColor(binary, cv2.COLOR_GRAY2RGB, dst=self._get_buffer(image.shape))
+                result = Image.fromarray(enhanced)
+                
+                for buffer in (cv_gray, binary, enhanced):
+                    self._put_buffer(buffer)
+                return result
             
             else:
-                # Light enhancement - just return original
-                return image
+                # Light enhancement - just wrap hasil pipeline
+                return Image.fromarray(image)
                 
         except Exception as e:
             self.logger.error(f"Text enhancement failed: {e}")
-            return image
+            return Image.fromarray(image)
     
     
     def resize_image(self, image: Image.Image, max_width: int = 2000, max_height: int = 2000) -> Image.Image:
@@ -231,42 +628,75 @@ class ImageService:
             return image
     
     
-    def detect_orientation(self, image: Image.Image) -> float:
+    def to_grayscale(self, image: Image.Image) -> np.ndarray:
+        """
+        Convert RGB image ke grayscale array dalam satu cvtColor pass
+        
+        Hasilnya bisa di-pass ke detect_orientation / crop_text_region supaya
+        konversi hanya dilakukan sekali per image.
+        
+        Args:
+            image (PIL.Image): Input RGB image
+        
+        Returns:
+            np.ndarray: Grayscale uint8 array
+        """
+        return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+    
+    
+    def _downscale_for_analysis(self, gray: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Downscale grayscale image sampai longest edge <= _ANALYSIS_MAX_SIDE
+        
+        Args:
+            gray (np.ndarray): Grayscale image
+        
+        Returns:
+            tuple: (downscaled image, scale factor original/downscaled)
+        """
+        scale = max(gray.shape[:2]) / _ANALYSIS_MAX_SIDE
+        if scale <= 1:
+            return gray, 1.0
+        
+        small = cv2.resize(gray, None, fx=1 / scale, fy=1 / scale, interpolation=cv2.INTER_AREA)
+        return small, scale
+    
+    
+    def detect_orientation(self, image: Image.Image, gray: Optional[np.ndarray] = None) -> float:
         """
         Detect text orientation dalam image
         
         Args:
             image (PIL.Image): Input image
+            gray (np.ndarray): Optional grayscale version dari image yang sudah dihitung
         
         Returns:
             float: Detected rotation angle
         """
         try:
-            # Convert ke OpenCV format
-            cv_image = np.array(image)
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2BGR)
-            gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
+            if gray is None:
+                gray = self.to_grayscale(image)
+            
+            # Orientation stabil di resolusi rendah; Hough threshold ikut di-scale
+            small, scale = self._downscale_for_analysis(gray)
             
             # Find contours
-            edges = cv2.Canny(gray, 50, 150, apertureSize=3)
-            lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=100)
-            
-            if lines is not None:
-                angles = []
-                for rho, theta in lines[:, 0]:
-                    angle = (theta - np.pi/2) * 180 / np.pi
-                    angles.append(angle)
+            edges = cv2.Canny(small, 50, 150, apertureSize=3)
+            lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=max(int(100 / scale), 20))
+            
+            if lines is not None and len(lines):
+                # Semua angles sekaligus dari theta column
+                angles = (lines[:, 0, 1] - np.pi / 2) * (180.0 / np.pi)
                 
                 # Find most common angle
-                if angles:
-                    angle = np.median(angles)
-                    # Normalize ke [-45, 45] range
-                    if angle > 45:
-                        angle -= 90
-                    elif angle < -45:
-                        angle += 90
-                    
-                    return angle
+                angle = float(np.median(angles))
+                # Normalize ke [-45, 45] range
+                if angle > 45:
+                    angle -= 90
+                elif angle < -45:
+                    angle += 90
+                
+                return angle
             
             return 0  # No rotation detected
             
@@ -301,40 +731,40 @@ class ImageService:
             return image
     
     
-    def crop_text_region(self, image: Image.Image, padding: int = 10) -> Image.Image:
+    def crop_text_region(self, image: Image.Image, padding: int = 10,
+                         gray: Optional[np.ndarray] = None) -> Image.Image:
         """
         Crop image ke text region untuk better OCR
         
         Args:
             image (PIL.Image): Input image
             padding (int): Padding around detected text region
+            gray (np.ndarray): Optional grayscale version dari image yang sudah dihitung
         
         Returns:
             PIL.Image: Cropped image
         """
         try:
-            # Convert ke OpenCV format
-            cv_image = np.array(image)
-            cv_image = cv2.cvtColor(cv_image, cv2.COLOR_RGB2BGR)
-            gray = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
+            if gray is None:
+                gray = self.to_grayscale(image)
+            
+            # Text region dicari di thumbnail, bbox di-scale kembali ke ukuran asli
+            small, scale = self._downscale_for_analysis(gray)
             
             # Find text regions
-            binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 11, 2)
+            binary = cv2.adaptiveThreshold(small, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 11, 2)
             
             # Find contours
             contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
             if contours:
-                # Get bounding rectangle dari all contours
-                x_min, y_min = float('inf'), float('inf')
-                x_max, y_max = 0, 0
+                # Bounding rectangle dari all contours = bounding rect dari semua points
+                x_min, y_min, w, h = cv2.boundingRect(np.concatenate(contours))
+                x_max, y_max = x_min + w, y_min + h
                 
-                for contour in contours:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    x_min = min(x_min, x)
-                    y_min = min(y_min, y)
-                    x_max = max(x_max, x + w)
-                    y_max = max(y_max, y + h)
+                if scale > 1:
+                    x_min, y_min = int(x_min * scale), int(y_min * scale)
+                    x_max, y_max = int(np.ceil(x_max * scale)), int(np.ceil(y_max * scale))
                 
                 # Add padding
                 height, width = gray.shape
@@ -355,6 +785,28 @@ class ImageService:
             return image
     
     
+    @staticmethod
+    def _histogram_stats(hist: np.ndarray) -> Tuple[float, float, float, float]:
+        """
+        Compute mean, std, min dan max dari 256-bin histogram
+        
+        Args:
+            hist (np.ndarray): Pixel counts per intensity level
+        
+        Returns:
+            tuple: (mean, std, min_value, max_value)
+        """
+        total = hist.sum()
+        if total == 0:
+            return 0.0, 0.0, 0.0, 0.0
+        
+        mean = float(np.dot(_LEVELS, hist) / total)
+        variance = float(np.dot(_LEVELS * _LEVELS, hist) / total) - mean * mean
+        occupied = np.flatnonzero(hist)
+        
+        return mean, float(np.sqrt(max(variance, 0.0))), float(occupied[0]), float(occupied[-1])
+    
+    
     def get_image_stats(self, image: Image.Image) -> dict:
         """
         Get statistical information tentang image
@@ -369,8 +821,33 @@ class ImageService:
             width, height = image.size
             mode = image.mode
             
+            # Bilevel (bool array) dan palette (index values) tidak bisa langsung
+            # dipakai untuk OpenCV stats
+            if mode == '1':
+                image = image.convert('L')
+            elif mode == 'P':
+                image = image.convert('RGB')
+            
             # Convert ke array untuk stats
-            img_array = np.array(image)
+            img_array = np.asarray(image)
+            
+            if img_array.dtype == np.uint8:
+                # Satu histogram per channel, semua stats diturunkan dari 256 bins
+                channels = img_array.shape[2] if img_array.ndim == 3 else 1
+                hist = sum(
+                    cv2.calcHist([img_array], [c], None, [256], [0, 256]).ravel()
+                    for c in range(channels)
+                )
+                mean_brightness, std_brightness, min_value, max_value = self._histogram_stats(hist)
+            else:
+                # Non-8-bit modes (I;16, F) - per-channel mean/std, digabung jadi overall stats
+                channel_means, channel_stds = cv2.meanStdDev(img_array)
+                channel_means = channel_means.ravel()
+                mean_brightness = float(channel_means.mean())
+                std_brightness = float(np.sqrt(max(
+                    (channel_stds.ravel() ** 2 + channel_means ** 2).mean() - mean_brightness ** 2, 0.0
+                )))
+                min_value, max_value, _, _ = cv2.minMaxLoc(img_array.reshape(-1, 1))
             
             stats = {
                 'dimensions': {
@@ -383,20 +860,22 @@ class ImageService:
                     'channels': len(img_array.shape) if len(img_array.shape) > 2 else 1
                 },
                 'quality_metrics': {
-                    'mean_brightness': float(np.mean(img_array)),
-                    'std_brightness': float(np.std(img_array)),
-                    'min_value': float(np.min(img_array)),
-                    'max_value': float(np.max(img_array))
+                    'mean_brightness': mean_brightness,
+                    'std_brightness': std_brightness,
+                    'min_value': float(min_value),
+                    'max_value': float(max_value)
                 }
             }
             
             # Calculate contrast ratio
-            if len(img_array.shape) == 3:
+            if img_array.ndim == 3:
                 # Color image - convert ke grayscale untuk contrast calculation
-                gray = np.dot(img_array[...,:3], [0.2989, 0.5870, 0.1140])
-                contrast = np.std(gray)
+                code = cv2.COLOR_RGBA2GRAY if img_array.shape[2] == 4 else cv2.COLOR_RGB2GRAY
+                gray = cv2.cvtColor(img_array, code)
+                gray_hist = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel()
+                contrast = self._histogram_stats(gray_hist)[1]
             else:
-                contrast = np.std(img_array)
+                contrast = std_brightness
             
             stats['quality_metrics']['contrast'] = float(contrast)
             
@@ -8,8 +8,14 @@ Author: AI Assistant
 Date: August 2025
 """
 
+import re
 import time
+import atexit
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Union, Tuple
 import cv2
 import numpy as np
@@ -18,6 +24,31 @@ import pytesseract
 import easyocr
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
+import tempfile
+
+# torch (dependency dari easyocr) hanya dipakai untuk deteksi CUDA
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+# xxhash optional - fallback ke hashlib.blake2b untuk result cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+# --psm option di tesseract_config (diganti untuk recognition-only mode)
+_PSM_RE = re.compile(r'--psm\s+\d+')
+
+# Integer columns Tesseract TSV (urutan sama dengan output), diikuti conf dan text
+_TESSERACT_INT_COLUMNS = (
+    'level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+    'left', 'top', 'width', 'height'
+)
 
 
 class OCRService:
@@ -32,32 +63,107 @@ class OCRService:
     - Best result selection
     """
     
-    def __init__(self):
-        """Initialize OCR Service dengan engine configuration"""
+    def __init__(self, use_gpu: bool = False):
+        """
+        Initialize OCR Service dengan engine configuration
+        
+        Args:
+            use_gpu (bool): Jalankan EasyOCR di GPU jika CUDA device tersedia
+        """
         self.logger = logging.getLogger(__name__)
         
         # Engine availability flags
         self._tesseract_available = None
         self._easyocr_available = None
-        self._easyocr_reader = None
+        
+        # EasyOCR readers per language set (Reader init ~5-8 detik, jangan dibuang)
+        self._easyocr_readers = OrderedDict()
+        self._easyocr_lock = threading.Lock()
+        self._current_lang_key = None  # Language set dari reader yang terakhir dipakai
+        
+        # Tesseract lang strings per language list ('en', 'id' -> 'en+id')
+        self._lang_strings = {}
+        
+        # Supported languages dan engine info (di-cache setelah query pertama;
+        # Tesseract queries spawn subprocess dan hasilnya tidak berubah)
+        self._supported_languages = None
+        self._tesseract_version = None
+        self._tesseract_info = None
+        self._engine_status = None
+        
+        # In-memory OCR result cache (LRU) per image content + parameters
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
         
         # Default configuration
         self.default_config = {
             'tesseract_config': '--oem 3 --psm 6',
-            'easyocr_gpu': False,
+            'easyocr_gpu': use_gpu and self._cuda_available(),
             'confidence_threshold': 0.5,
-            'max_workers': 2
+            'max_workers': 2,
+            # Image dengan sisi terpanjang di atas ini di-downscale sebelum OCR
+            'max_side': 1600,
+            # Recognizer batch size untuk EasyOCR readtext / readtext_batched
+            'easyocr_batch_size': 16,
+            # Maksimum EasyOCR readers (language sets) yang disimpan di memory
+            'easyocr_max_readers': 3,
+            # Engine 'auto': fallback ke engine kedua jika confidence di bawah ini (0-100)
+            'auto_fallback_confidence': 60.0,
+            # Engine 'auto': grayscale std minimum untuk dianggap document scan
+            'auto_document_std': 50.0,
+            # Maksimum OCR results yang di-cache di memory (0 = cache off)
+            'result_cache_size': 256
         }
         
+        # Persistent pool untuk Tesseract calls (subprocess, GIL released selama menunggu);
+        # EasyOCR tetap di calling thread supaya model tidak diduplikasi per worker
+        self._tesseract_executor = ThreadPoolExecutor(
+            max_workers=self.default_config['max_workers'],
+            thread_name_prefix='ocr-tesseract'
+        )
+        atexit.register(self._tesseract_executor.shutdown, wait=False)
+        
+        self._limit_engine_threads()
+        
         # Check engine availability
         self._check_engines()
     
     
+    def _limit_engine_threads(self):
+        """
+        Batasi internal threads engines supaya concurrent requests tidak oversubscribe CPU
+        
+        OCRService memegang thread tuning untuk process ini: Tesseract
+        subprocesses berjalan single-threaded (OMP_THREAD_LIMIT, kecuali
+        sudah di-set di environment) dan torch intra-op threads dibagi
+        rata dengan Tesseract workers.
+        """
+        # Dibaca oleh setiap Tesseract subprocess saat di-spawn
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+        
+        if TORCH_AVAILABLE:
+            torch_threads = max(1, (os.cpu_count() or 1) // self.default_config['max_workers'])
+            torch.set_num_threads(torch_threads)
+    
+    
+    def _cuda_available(self) -> bool:
+        """Check apakah torch bisa memakai CUDA device"""
+        if not TORCH_AVAILABLE:
+            self.logger.warning("GPU requested but torch is not installed, using CPU")
+            return False
+        
+        if not torch.cuda.is_available():
+            self.logger.warning("GPU requested but no CUDA device found, using CPU")
+            return False
+        
+        return True
+    
+    
     def _check_engines(self):
         """Check availability of OCR engines"""
         # Check Tesseract
         try:
-            pytesseract.get_tesseract_version()
+            self._tesseract_version = str(pytesseract.get_tesseract_version())
             self._tesseract_available = True
             self.logger.info("Tesseract OCR is available")
         except Exception as e:
@@ -66,8 +172,8 @@ class OCRService:
         
         # Check EasyOCR
         try:
-            # Test EasyOCR initialization
-            self._easyocr_reader = easyocr.Reader(['en'], gpu=self.default_config['easyocr_gpu'])
+            # Test EasyOCR initialization (reader disimpan untuk dipakai ulang)
+            self._get_easyocr_reader(['en'])
             self._easyocr_available = True
             self.logger.info("EasyOCR is available")
         except Exception as e:
@@ -76,14 +182,27 @@ class OCRService:
     
     
     def extract_text(self, image: Union[np.ndarray, Image.Image], 
-                    engine: str = 'both', languages: List[str] = None) -> Dict[str, Any]:
+                    engine: str = 'auto', languages: List[str] = None,
+                    resize: bool = True, detail_level: str = 'text',
+                    cache: bool = True, detection: bool = True) -> Dict[str, Any]:
         """
         Extract text dari image menggunakan specified engine(s)
         
+        Engine 'auto' menjalankan satu engine yang dipilih dari image
+        characteristics, dan hanya menjalankan engine kedua jika confidence
+        hasil pertama di bawah auto_fallback_confidence.
+        
         Args:
             image: Input image (numpy array atau PIL Image)
-            engine: OCR engine to use ('tesseract', 'easyocr', 'both')
+            engine: OCR engine to use ('auto', 'tesseract', 'easyocr', 'both')
             languages: List of language codes untuk recognition
+            resize: Downscale image yang lebih besar dari max_side (matikan
+                untuk scan dengan text sangat kecil)
+            detail_level: 'text' (text + confidence saja) atau 'words'
+                (tambah word-level bboxes)
+            cache: Pakai in-memory result cache untuk image identik
+            detection: False jika image sudah berupa crop satu word/line;
+                text detection dilewati dan hanya recognition yang dijalankan
         
         Returns:
             dict: OCR result dengan text, confidence, dan metadata
@@ -91,37 +210,55 @@ class OCRService:
         start_time = time.time()
         
         try:
-            # Convert image ke format yang sesuai
-            image_array = self._prepare_image(image)
+            # Convert image ke format yang sesuai (grayscale jika hanya Tesseract)
+            image_array = self._prepare_image(image, to_gray=engine == 'tesseract')
             
             if languages is None:
                 languages = ['en', 'id']  # Default languages
             
+            cache_key = None
+            if cache and self.default_config['result_cache_size'] > 0:
+                cache_key = self._result_cache_key(
+                    image_array, engine, languages, resize, detail_level, detection
+                )
+                cached = self._get_cached_result(cache_key)
+                if cached is not None:
+                    cached['processing_time'] = time.time() - start_time
+                    return cached
+            
+            scale = 1.0
+            if resize:
+                image_array, scale = self._limit_size(image_array)
+            
             results = {}
             
             # Execute OCR berdasarkan engine selection
             if engine == 'tesseract' and self._tesseract_available:
-                results['tesseract'] = self._extract_with_tesseract(image_array, languages)
+                results['tesseract'] = self._extract_with_tesseract(image_array, languages, detail_level, detection)
             
             elif engine == 'easyocr' and self._easyocr_available:
-                results['easyocr'] = self._extract_with_easyocr(image_array, languages)
+                results['easyocr'] = self._extract_with_easyocr(image_array, languages, detail_level, detection)
+            
+            elif engine == 'auto':
+                results = self._extract_auto(image_array, languages, detail_level, detection)
             
             elif engine == 'both':
                 # Run both engines jika tersedia
                 if self._tesseract_available and self._easyocr_available:
-                    # Parallel execution untuk performance
-                    with ThreadPoolExecutor(max_workers=self.default_config['max_workers']) as executor:
-                        future_tesseract = executor.submit(self._extract_with_tesseract, image_array, languages)
-                        future_easyocr = executor.submit(self._extract_with_easyocr, image_array, languages)
-                        
-                        results['tesseract'] = future_tesseract.result()
-                        results['easyocr'] = future_easyocr.result()
+                    # Tesseract subprocess berjalan paralel dengan EasyOCR di thread ini
+                    future_tesseract = self._tesseract_executor.submit(
+                        self._extract_with_tesseract, image_array, languages, detail_level, detection
+                    )
+                    easyocr_result = self._extract_with_easyocr(image_array, languages, detail_level, detection)
+                    
+                    results['tesseract'] = future_tesseract.result()
+                    results['easyocr'] = easyocr_result
                 
                 elif self._tesseract_available:
-                    results['tesseract'] = self._extract_with_tesseract(image_array, languages)
+                    results['tesseract'] = self._extract_with_tesseract(image_array, languages, detail_level, detection)
                 
                 elif self._easyocr_available:
-                    results['easyocr'] = self._extract_with_easyocr(image_array, languages)
+                    results['easyocr'] = self._extract_with_easyocr(image_array, languages, detail_level, detection)
             
             if not results:
                 return {
@@ -132,11 +269,17 @@ class OCRService:
                     'error': 'No OCR engines available'
                 }
             
+            if scale != 1.0:
+                self._rescale_words(results, scale)
+            
             # Select best result
             best_result = self._select_best_result(results)
             best_result['processing_time'] = time.time() - start_time
             best_result['all_results'] = results
             
+            if cache_key is not None and 'error' not in best_result:
+                self._put_cached_result(cache_key, best_result)
+            
             return best_result
             
         except Exception as e:
@@ -150,30 +293,366 @@ class OCRService:
             }
     
     
-    def _prepare_image(self, image: Union[np.ndarray, Image.Image]) -> np.ndarray:
+    async def extract_text_async(self, image: Union[np.ndarray, Image.Image],
+                                 engine: str = 'auto', languages: List[str] = None,
+                                 resize: bool = True, detail_level: str = 'text',
+                                 detection: bool = True) -> Dict[str, Any]:
+        """
+        Async variant dari extract_text untuk async servers (ASGI)
+        
+        OCR dijalankan di default thread pool event loop sehingga loop tidak
+        ter-block; mode 'both' tetap memakai Tesseract pool yang persistent.
+        
+        Args:
+            image: Input image (numpy array atau PIL Image)
+            engine: OCR engine to use ('auto', 'tesseract', 'easyocr', 'both')
+            languages: List of language codes untuk recognition
+            resize: Downscale image yang lebih besar dari max_side
+            detail_level: 'text' atau 'words'
+            detection: False untuk recognition-only pada pre-cropped images
+        
+        Returns:
+            dict: OCR result, format sama dengan extract_text
+        """
+        return await asyncio.to_thread(
+            self.extract_text, image, engine=engine, languages=languages,
+            resize=resize, detail_level=detail_level, detection=detection
+        )
+    
+    
+    def extract_text_batched(self, images: List[Union[np.ndarray, Image.Image]],
+                             engine: str = 'auto', languages: List[str] = None,
+                             resize: bool = True, detail_level: str = 'text') -> List[Dict[str, Any]]:
+        """
+        Extract text dari multiple images dalam satu call
+        
+        EasyOCR dijalankan lewat readtext_batched per group images dengan
+        shape sama; Tesseract menerima semua images sebagai satu file list.
+        Engine 'auto' memilih engine per image di awal, lalu setiap engine
+        group tetap diproses sebagai batch (lihat _extract_auto_batched).
+        
+        Args:
+            images: List of input images (numpy array atau PIL Image)
+            engine: OCR engine to use ('auto', 'tesseract', 'easyocr', 'both')
+            languages: List of language codes untuk recognition
+            resize: Downscale images yang lebih besar dari max_side
+            detail_level: 'text' atau 'words', sama dengan extract_text
+        
+        Returns:
+            list: OCR result per image, format sama dengan extract_text
+        """
+        start_time = time.time()
+        
+        if not images:
+            return []
+        
+        try:
+            to_gray = engine == 'tesseract'
+            image_arrays = [self._prepare_image(image, to_gray=to_gray) for image in images]
+            scales = [1.0] * len(image_arrays)
+            if resize:
+                image_arrays, scales = map(list, zip(*(self._limit_size(arr) for arr in image_arrays)))
+            
+            if languages is None:
+                languages = ['en', 'id']  # Default languages
+            
+            all_indices = list(range(len(image_arrays)))
+            
+            if engine == 'auto':
+                per_image = self._extract_auto_batched(image_arrays, languages, detail_level)
+            else:
+                groups = {}
+                if engine in ('tesseract', 'both') and self._tesseract_available:
+                    groups['tesseract'] = all_indices
+                if engine in ('easyocr', 'both') and self._easyocr_available:
+                    groups['easyocr'] = all_indices
+                
+                engine_results = self._run_engine_groups(image_arrays, groups, languages, detail_level)
+                per_image = [
+                    {name: results[index] for name, results in engine_results.items()}
+                    for index in all_indices
+                ]
+            
+            # Waktu batch dibagi rata ke setiap image
+            processing_time = (time.time() - start_time) / len(images)
+            
+            if not any(per_image):
+                return [{
+                    'text': '',
+                    'confidence': 0,
+                    'engine_used': 'none',
+                    'processing_time': processing_time,
+                    'error': 'No OCR engines available'
+                } for _ in images]
+            
+            outputs = []
+            for index in all_indices:
+                results = per_image[index]
+                if scales[index] != 1.0:
+                    self._rescale_words(results, scales[index])
+                best_result = self._select_best_result(results)
+                best_result['processing_time'] = processing_time
+                best_result['all_results'] = results
+                outputs.append(best_result)
+            
+            return outputs
+            
+        except Exception as e:
+            self.logger.error(f"Batched OCR extraction failed: {e}")
+            processing_time = (time.time() - start_time) / len(images)
+            return [{
+                'text': '',
+                'confidence': 0,
+                'engine_used': 'error',
+                'processing_time': processing_time,
+                'error': str(e)
+            } for _ in images]
+    
+    
+    def _run_engine_groups(self, image_arrays: List[np.ndarray], groups: Dict[str, List[int]],
+                           languages: List[str], detail_level: str) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """
+        Run batched extraction per engine untuk subset images
+        
+        Tesseract group berjalan di tesseract executor (satu process untuk
+        seluruh group), paralel dengan EasyOCR group di thread ini.
+        
+        Args:
+            image_arrays: Prepared image arrays
+            groups: Image indices per engine name ('tesseract' / 'easyocr')
+            languages: Language codes
+            detail_level: 'text' atau 'words'
+        
+        Returns:
+            dict: Result per image index, per engine
+        """
+        tesseract_future = None
+        tesseract_indices = groups.get('tesseract')
+        if tesseract_indices:
+            tesseract_future = self._tesseract_executor.submit(
+                self._extract_batch_with_tesseract,
+                [image_arrays[i] for i in tesseract_indices], languages, detail_level
+            )
+        
+        engine_results = {}
+        
+        easyocr_indices = groups.get('easyocr')
+        if easyocr_indices:
+            easyocr_results = self._extract_batch_with_easyocr(
+                [image_arrays[i] for i in easyocr_indices], languages, detail_level
+            )
+            engine_results['easyocr'] = dict(zip(easyocr_indices, easyocr_results))
+        
+        if tesseract_future is not None:
+            engine_results['tesseract'] = dict(zip(tesseract_indices, tesseract_future.result()))
+        
+        return engine_results
+    
+    
+    def _extract_auto_batched(self, image_arrays: List[np.ndarray], languages: List[str],
+                              detail_level: str) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Engine 'auto' untuk batch: primary engine per image, lalu fallback batch
+        
+        Images dikelompokkan berdasarkan primary engine dan setiap group
+        dijalankan batched. Hanya images dengan error atau confidence di bawah
+        auto_fallback_confidence yang dijalankan ulang dengan engine kedua.
+        
+        Args:
+            image_arrays: Prepared image arrays
+            languages: Language codes
+            detail_level: 'text' atau 'words'
+        
+        Returns:
+            list: Results per engine untuk setiap image (kosong jika tidak ada engine)
+        """
+        available = []
+        if self._tesseract_available:
+            available.append('tesseract')
+        if self._easyocr_available:
+            available.append('easyocr')
+        
+        per_image = [{} for _ in image_arrays]
+        if not available:
+            return per_image
+        
+        primary_groups = {}
+        for index, image_array in enumerate(image_arrays):
+            primary = self._select_primary_engine(image_array)
+            if primary not in available:
+                primary = available[0]
+            primary_groups.setdefault(primary, []).append(index)
+        
+        for name, results in self._run_engine_groups(image_arrays, primary_groups, languages, detail_level).items():
+            for index, result in results.items():
+                per_image[index][name] = result
+        
+        if len(available) > 1:
+            threshold = self.default_config['auto_fallback_confidence']
+            fallback_groups = {}
+            for primary, indices in primary_groups.items():
+                secondary = 'easyocr' if primary == 'tesseract' else 'tesseract'
+                retry = [
+                    index for index in indices
+                    if 'error' in per_image[index][primary]
+                    or per_image[index][primary].get('confidence', 0) < threshold
+                ]
+                if retry:
+                    fallback_groups[secondary] = retry
+            
+            for name, results in self._run_engine_groups(image_arrays, fallback_groups, languages, detail_level).items():
+                for index, result in results.items():
+                    per_image[index][name] = result
+        
+        return per_image
+    
+    
+    def _result_cache_key(self, image_array: np.ndarray, engine: str, languages: List[str],
+                          resize: bool, detail_level: str, detection: bool) -> Tuple:
+        """
+        Build result cache key dari image content dan OCR parameters
+        
+        Args:
+            image_array: Prepared image array
+            engine: OCR engine
+            languages: Language codes (urutan dipertahankan)
+            resize: Resize flag
+            detail_level: 'text' atau 'words'
+            detection: Detection flag
+        
+        Returns:
+            tuple: Cache key
+        """
+        if XXHASH_AVAILABLE:
+            digest = xxhash.xxh3_128_hexdigest(image_array)
+        else:
+            digest = hashlib.blake2b(image_array, digest_size=16).hexdigest()
+        
+        return (digest, image_array.shape, image_array.dtype.str,
+                engine, tuple(languages), resize, detail_level, detection)
+    
+    
+    def _get_cached_result(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Get copy dari cached result (None jika miss)"""
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(key)
+        
+        return dict(result)
+    
+    
+    def _put_cached_result(self, key: Tuple, result: Dict[str, Any]):
+        """Simpan copy dari result ke LRU cache"""
+        with self._result_cache_lock:
+            self._result_cache[key] = dict(result)
+            self._result_cache.move_to_end(key)
+            
+            while len(self._result_cache) > self.default_config['result_cache_size']:
+                self._result_cache.popitem(last=False)
+    
+    
+    def _extract_auto(self, image: np.ndarray, languages: List[str],
+                      detail_level: str = 'words', detection: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Run primary engine, fallback ke engine lain hanya jika confidence rendah
+        
+        Args:
+            image: Image array (BGR atau grayscale)
+            languages: Language codes
+            detail_level: 'text' atau 'words'
+            detection: False untuk recognition-only pada pre-cropped images
+        
+        Returns:
+            dict: Results per engine yang dijalankan
+        """
+        extractors = {}
+        if self._tesseract_available:
+            extractors['tesseract'] = self._extract_with_tesseract
+        if self._easyocr_available:
+            extractors['easyocr'] = self._extract_with_easyocr
+        
+        if not extractors:
+            return {}
+        
+        primary = self._select_primary_engine(image)
+        if primary not in extractors:
+            primary = next(iter(extractors))
+        
+        results = {primary: extractors[primary](image, languages, detail_level, detection)}
+        
+        primary_result = results[primary]
+        low_confidence = primary_result.get('confidence', 0) < self.default_config['auto_fallback_confidence']
+        
+        if len(extractors) > 1 and ('error' in primary_result or low_confidence):
+            secondary = 'easyocr' if primary == 'tesseract' else 'tesseract'
+            results[secondary] = extractors[secondary](image, languages, detail_level, detection)
+        
+        return results
+    
+    
+    def _select_primary_engine(self, image: np.ndarray) -> str:
+        """
+        Pilih engine pertama untuk mode 'auto' dari cheap image features
+        
+        Document scan (background terang dengan kontras tinggi) -> Tesseract,
+        selain itu (scene text, foto, handwriting) -> EasyOCR.
+        
+        Args:
+            image: Image array (BGR atau grayscale)
+        
+        Returns:
+            str: 'tesseract' atau 'easyocr'
+        """
+        # Subsample supaya statistics murah untuk image besar
+        sample = image[::4, ::4]
+        if sample.ndim == 3:
+            sample = cv2.cvtColor(sample, cv2.COLOR_BGR2GRAY)
+        
+        mean, std = cv2.meanStdDev(sample)
+        
+        if std[0][0] >= self.default_config['auto_document_std'] and mean[0][0] >= 127:
+            return 'tesseract'
+        return 'easyocr'
+    
+    
+    def _prepare_image(self, image: Union[np.ndarray, Image.Image], to_gray: bool = False) -> np.ndarray:
         """
         Prepare image untuk OCR processing
         
         Args:
             image: Input image
+            to_gray: Convert langsung ke single-channel grayscale (untuk
+                Tesseract-only; 3x lebih sedikit data ke subprocess)
         
         Returns:
             np.ndarray: Processed image array
         """
         if isinstance(image, Image.Image):
-            # Convert PIL Image ke numpy array
-            image_array = np.array(image)
+            # Convert PIL Image ke numpy array (tanpa copy tambahan)
+            image_array = np.asarray(image)
             
-            # Convert RGBA ke RGB jika perlu
-            if len(image_array.shape) == 3 and image_array.shape[2] == 4:
-                image_array = cv2.cvtColor(image_array, cv2.COLOR_RGBA2RGB)
+            if image_array.ndim == 3 and image_array.shape[2] == 4:
+                # RGBA -> BGR/GRAY dalam satu pass
+                code = cv2.COLOR_RGBA2GRAY if to_gray else cv2.COLOR_RGBA2BGR
+                image_array = cv2.cvtColor(image_array, code)
             
-            # Convert RGB ke BGR untuk OpenCV
-            if len(image_array.shape) == 3 and image_array.shape[2] == 3:
-                image_array = cv2.cvtColor(image_array, cv2.COLOR_RGB2BGR)
+            elif image_array.ndim == 3 and image_array.shape[2] == 3:
+                if to_gray:
+                    image_array = cv2.cvtColor(image_array, cv2.COLOR_RGB2GRAY)
+                else:
+                    # RGB -> BGR: reversed channel view, satu contiguous copy
+                    image_array = np.ascontiguousarray(image_array[..., ::-1])
         
         elif isinstance(image, np.ndarray):
-            image_array = image.copy()
+            # OCR engines memperlakukan input sebagai read-only, copy tidak diperlukan;
+            # ascontiguousarray hanya copy untuk strided views (cv2 butuh contiguous)
+            image_array = np.ascontiguousarray(image)
+            
+            if to_gray and image_array.ndim == 3:
+                code = cv2.COLOR_BGRA2GRAY if image_array.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+                image_array = cv2.cvtColor(image_array, code)
         
         else:
             raise ValueError("Unsupported image format")
@@ -181,57 +660,75 @@ class OCRService:
         return image_array
     
     
-    def _extract_with_tesseract(self, image: np.ndarray, languages: List[str]) -> Dict[str, Any]:
+    def _limit_size(self, image_array: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Downscale image jika sisi terpanjang melebihi max_side
+        
+        Latency Tesseract/EasyOCR naik sebanding jumlah pixel, sedangkan
+        printed text tetap terbaca setelah INTER_AREA downscale.
+        
+        Args:
+            image_array: Image array dari _prepare_image
+        
+        Returns:
+            tuple: (image array, scale factor original/resized)
+        """
+        height, width = image_array.shape[:2]
+        longest = max(height, width)
+        max_side = self.default_config['max_side']
+        
+        if not max_side or longest <= max_side:
+            return image_array, 1.0
+        
+        ratio = max_side / longest
+        new_size = (max(int(width * ratio), 1), max(int(height * ratio), 1))
+        resized = cv2.resize(image_array, new_size, interpolation=cv2.INTER_AREA)
+        
+        return resized, longest / max(new_size)
+    
+    
+    def _rescale_words(self, results: Dict[str, Dict[str, Any]], scale: float):
+        """
+        Kembalikan word bboxes ke koordinat original image (in place)
+        
+        Args:
+            results: Results per engine
+            scale: Scale factor dari _limit_size
+        """
+        for result in results.values():
+            for word in result.get('words', ()):
+                bbox = word['bbox']
+                for key in ('x', 'y', 'width', 'height'):
+                    bbox[key] = int(round(bbox[key] * scale))
+    
+    
+    def _extract_with_tesseract(self, image: np.ndarray, languages: List[str],
+                                detail_level: str = 'words', detection: bool = True) -> Dict[str, Any]:
         """
         Extract text menggunakan Tesseract OCR
         
         Args:
             image: Image array
             languages: Language codes
+            detail_level: 'text' atau 'words'
+            detection: False untuk single text line (--psm 7, tanpa page layout analysis)
         
         Returns:
             dict: Tesseract OCR result
         """
         try:
             # Prepare language string untuk Tesseract
-            lang_string = '+'.join(languages)
+            lang_string = self._lang_string(languages)
             
             # Configure Tesseract
             config = self.default_config['tesseract_config']
+            if not detection:
+                config = _PSM_RE.sub('', config).strip() + ' --psm 7'
             
-            # Extract text
-            text = pytesseract.image_to_string(image, lang=lang_string, config=config)
-            
-            # Get confidence data
-            data = pytesseract.image_to_data(image, lang=lang_string, config=config, output_type=pytesseract.Output.DICT)
-            
-            # Calculate average confidence
-            confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-            
-            # Get word-level details
-            words = []
-            for i in range(len(data['text'])):
-                if int(data['conf'][i]) > 0:
-                    words.append({
-                        'text': data['text'][i],
-                        'confidence': int(data['conf'][i]),
-                        'bbox': {
-                            'x': data['left'][i],
-                            'y': data['top'][i],
-                            'width': data['width'][i],
-                            'height': data['height'][i]
-                        }
-                    })
+            # Satu Tesseract run untuk text, confidence dan word boxes
+            data = self._run_tesseract_data(image, lang_string, config)
             
-            return {
-                'text': text.strip(),
-                'confidence': avg_confidence,
-                'engine': 'tesseract',
-                'languages': languages,
-                'word_count': len([w for w in words if w['text'].strip()]),
-                'words': words
-            }
+            return self._format_tesseract_data(data, languages, detail_level)
             
         except Exception as e:
             self.logger.error(f"Tesseract extraction failed: {e}")
@@ -243,68 +740,252 @@ class OCRService:
             }
     
     
-    def _extract_with_easyocr(self, image: np.ndarray, languages: List[str]) -> Dict[str, Any]:
+    def _lang_string(self, languages: List[str]) -> str:
         """
-        Extract text menggunakan EasyOCR
+        Get Tesseract lang string untuk languages (di-cache per language list)
+        
+        Urutan dipertahankan karena language pertama menjadi primary
+        language di Tesseract.
         
         Args:
-            image: Image array
             languages: Language codes
         
         Returns:
-            dict: EasyOCR result
+            str: Lang string, contoh 'en+id'
+        """
+        key = tuple(languages)
+        lang_string = self._lang_strings.get(key)
+        if lang_string is None:
+            lang_string = '+'.join(key)
+            self._lang_strings[key] = lang_string
+        return lang_string
+    
+    
+    def _extract_batch_with_tesseract(self, images: List[np.ndarray], languages: List[str],
+                                      detail_level: str = 'words') -> List[Dict[str, Any]]:
         """
+        Extract text dari multiple images dengan satu Tesseract process
+        
+        Images ditulis ke temp directory dan Tesseract menerima file list,
+        sehingga language models hanya di-load sekali untuk seluruh batch.
+        Output TSV dipisah per image lewat kolom page_num.
+        
+        Args:
+            images: List of image arrays
+            languages: Language codes
+            detail_level: 'text' atau 'words'
+        
+        Returns:
+            list: Tesseract result per image (urutan sama dengan input)
+        """
+        if len(images) == 1:
+            return [self._extract_with_tesseract(images[0], languages, detail_level)]
+        
         try:
-            # Initialize reader jika belum ada atau language berbeda
-            if self._easyocr_reader is None:
-                self._easyocr_reader = easyocr.Reader(languages, gpu=self.default_config['easyocr_gpu'])
+            lang_string = self._lang_string(languages)
+            config = self.default_config['tesseract_config']
             
-            # Check jika perlu reinitialize untuk different languages
-            current_langs = getattr(self._easyocr_reader, 'lang_list', [])
-            if set(languages) != set(current_langs):
-                self._easyocr_reader = easyocr.Reader(languages, gpu=self.default_config['easyocr_gpu'])
+            with tempfile.TemporaryDirectory(prefix='ocr-tesseract-') as temp_dir:
+                paths = []
+                for index, image_array in enumerate(images):
+                    # BMP: tanpa compression, encode paling murah
+                    path = os.path.join(temp_dir, f'{index}.bmp')
+                    if not cv2.imwrite(path, image_array):
+                        raise ValueError(f'Failed to write batch image {index}')
+                    paths.append(path)
+                
+                list_path = os.path.join(temp_dir, 'images.txt')
+                with open(list_path, 'w', encoding='utf-8') as list_file:
+                    list_file.write('\n'.join(paths) + '\n')
+                
+                data = self._run_tesseract_data(list_path, lang_string, config)
             
-            # Extract text
-            results = self._easyocr_reader.readtext(image)
+            # Rows per page bersebelahan dan urut; page_num 1-based sesuai urutan file list
+            bounds = np.searchsorted(data['page_num'], np.arange(1, len(images) + 2)).tolist()
             
-            # Process results
-            text_parts = []
-            words = []
-            confidences = []
+            outputs = []
+            for start, end in zip(bounds[:-1], bounds[1:]):
+                page_data = {key: values[start:end] for key, values in data.items()}
+                outputs.append(self._format_tesseract_data(page_data, languages, detail_level))
             
-            for (bbox, text, confidence) in results:
-                if confidence > self.default_config['confidence_threshold']:
-                    text_parts.append(text)
-                    confidences.append(confidence * 100)  # Convert ke percentage
-                    
-                    # Convert bbox format
-                    bbox_array = np.array(bbox)
-                    x_min, y_min = bbox_array.min(axis=0)
-                    x_max, y_max = bbox_array.max(axis=0)
-                    
-                    words.append({
-                        'text': text,
-                        'confidence': confidence * 100,
-                        'bbox': {
-                            'x': int(x_min),
-                            'y': int(y_min),
-                            'width': int(x_max - x_min),
-                            'height': int(y_max - y_min)
-                        }
-                    })
-            
-            # Combine text
-            full_text = ' '.join(text_parts)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+            return outputs
             
-            return {
-                'text': full_text.strip(),
-                'confidence': avg_confidence,
-                'engine': 'easyocr',
-                'languages': languages,
-                'word_count': len(words),
-                'words': words
+        except Exception as e:
+            # Jalankan inline: method ini sendiri bisa berjalan di tesseract executor
+            self.logger.warning(f"Tesseract batch extraction failed, falling back per image: {e}")
+            return [
+                self._extract_with_tesseract(image_array, languages, detail_level)
+                for image_array in images
+            ]
+    
+    
+    def _run_tesseract_data(self, image: Union[np.ndarray, str], lang_string: str,
+                            config: str) -> Dict[str, Any]:
+        """
+        Run Tesseract dan parse TSV output langsung ke numpy columns
+        
+        Output.DICT mem-parse setiap cell dengan Python int()/float();
+        di sini setiap row hanya di-split sekali dan numeric columns
+        dikonversi dalam satu astype.
+        
+        Args:
+            image: Image array atau path (image / file list)
+            lang_string: Tesseract lang string
+            config: Tesseract config
+        
+        Returns:
+            dict: Columns sama dengan image_to_data (numeric sebagai np.ndarray, text sebagai list)
+        """
+        tsv = pytesseract.image_to_data(image, lang=lang_string, config=config)
+        
+        # 11 numeric columns + text (text bisa berisi spasi, tidak berisi tab)
+        rows = [row.split('\t', 11) for row in tsv.split('\n')[1:] if row]
+        
+        if rows:
+            numeric = np.array([row[:11] for row in rows]).astype(np.float64)
+        else:
+            numeric = np.empty((0, 11), dtype=np.float64)
+        
+        data = {
+            name: numeric[:, column].astype(np.int32)
+            for column, name in enumerate(_TESSERACT_INT_COLUMNS)
+        }
+        data['conf'] = numeric[:, 10]
+        data['text'] = [row[11] if len(row) > 11 else '' for row in rows]
+        
+        return data
+    
+    
+    def _format_tesseract_data(self, data: Dict[str, List], languages: List[str],
+                               detail_level: str = 'words') -> Dict[str, Any]:
+        """
+        Convert image_to_data output ke standard result format
+        
+        Args:
+            data: Parsed image_to_data columns (_run_tesseract_data)
+            languages: Language codes
+            detail_level: 'text' (tanpa word dicts) atau 'words'
+        
+        Returns:
+            dict: Tesseract result
+        """
+        text = self._text_from_tesseract_data(data)
+        
+        # Calculate average confidence (conf bisa int atau float string, tergantung versi)
+        conf = np.asarray(data['conf'], dtype=np.float64).astype(np.int32)
+        mask = conf > 0
+        avg_confidence = float(conf[mask].mean()) if mask.any() else 0
+        
+        # Get word-level details
+        indices = np.flatnonzero(mask).tolist()
+        texts = data['text']
+        words = [] if detail_level != 'words' else [
+            {
+                'text': texts[i],
+                'confidence': word_conf,
+                'bbox': {'x': x, 'y': y, 'width': width, 'height': height}
             }
+            for i, word_conf, x, y, width, height in zip(
+                indices,
+                conf[mask].tolist(),
+                np.asarray(data['left'])[mask].tolist(),
+                np.asarray(data['top'])[mask].tolist(),
+                np.asarray(data['width'])[mask].tolist(),
+                np.asarray(data['height'])[mask].tolist()
+            )
+        ]
+        
+        return {
+            'text': text.strip(),
+            'confidence': avg_confidence,
+            'engine': 'tesseract',
+            'languages': languages,
+            'word_count': sum(1 for i in indices if texts[i].strip()),
+            'words': words
+        }
+    
+    
+    def _text_from_tesseract_data(self, data: Dict[str, List]) -> str:
+        """
+        Rebuild plain text output dari image_to_data result
+        
+        Layout sama dengan image_to_string: words dalam satu line dipisah
+        spasi, lines dengan newline, paragraphs/blocks dengan blank line.
+        
+        Args:
+            data: Parsed image_to_data columns (_run_tesseract_data)
+        
+        Returns:
+            str: Extracted text
+        """
+        paragraphs = []
+        lines = []
+        line_words = []
+        current_paragraph = None
+        current_line = None
+        
+        for text, block, paragraph, line in zip(
+            data['text'],
+            np.asarray(data['block_num']).tolist(),
+            np.asarray(data['par_num']).tolist(),
+            np.asarray(data['line_num']).tolist()
+        ):
+            if not text or not text.strip():
+                continue
+            
+            if (block, paragraph, line) != current_line:
+                if line_words:
+                    lines.append(' '.join(line_words))
+                    line_words = []
+                
+                if (block, paragraph) != current_paragraph and lines:
+                    paragraphs.append('\n'.join(lines))
+                    lines = []
+                
+                current_line = (block, paragraph, line)
+                current_paragraph = (block, paragraph)
+            
+            line_words.append(text)
+        
+        if line_words:
+            lines.append(' '.join(line_words))
+        if lines:
+            paragraphs.append('\n'.join(lines))
+        
+        return '\n\n'.join(paragraphs)
+    
+    
+    def _extract_with_easyocr(self, image: np.ndarray, languages: List[str],
+                              detail_level: str = 'words', detection: bool = True) -> Dict[str, Any]:
+        """
+        Extract text menggunakan EasyOCR
+        
+        Args:
+            image: Image array
+            languages: Language codes
+            detail_level: 'text' atau 'words'
+            detection: False untuk recognition-only (CRAFT detector dilewati,
+                seluruh image dianggap satu text region)
+        
+        Returns:
+            dict: EasyOCR result
+        """
+        try:
+            reader = self._get_easyocr_reader(languages)
+            
+            # Extract text
+            if detection:
+                results = reader.readtext(image, batch_size=self.default_config['easyocr_batch_size'])
+            else:
+                height, width = image.shape[:2]
+                results = reader.recognize(
+                    image,
+                    horizontal_list=[[0, width, 0, height]],
+                    free_list=[],
+                    batch_size=self.default_config['easyocr_batch_size']
+                )
+            
+            return self._format_easyocr_result(results, languages, detail_level)
             
         except Exception as e:
             self.logger.error(f"EasyOCR extraction failed: {e}")
@@ -316,6 +997,142 @@ class OCRService:
             }
     
     
+    def _get_easyocr_reader(self, languages: List[str]):
+        """
+        Get EasyOCR reader untuk languages (di-cache per language set)
+        
+        Readers untuk language sets lain tetap disimpan sampai
+        easyocr_max_readers tercapai, lalu yang paling lama tidak dipakai
+        dibuang.
+        
+        Args:
+            languages: Language codes
+        
+        Returns:
+            easyocr.Reader: Reader instance
+        """
+        key = frozenset(languages)
+        
+        # Fast path: language set sama dengan call sebelumnya, tanpa lock / LRU update
+        if key == self._current_lang_key:
+            reader = self._easyocr_readers.get(key)
+            if reader is not None:
+                return reader
+        
+        with self._easyocr_lock:
+            reader = self._easyocr_readers.get(key)
+            if reader is None:
+                reader = easyocr.Reader(
+                    list(languages),
+                    gpu=self.default_config['easyocr_gpu'],
+                    cudnn_benchmark=True
+                )
+                self._easyocr_readers[key] = reader
+                
+                while len(self._easyocr_readers) > self.default_config['easyocr_max_readers']:
+                    self._easyocr_readers.popitem(last=False)
+            else:
+                self._easyocr_readers.move_to_end(key)
+            
+            self._current_lang_key = key
+        
+        return reader
+    
+    
+    def _format_easyocr_result(self, results: List[Tuple], languages: List[str],
+                               detail_level: str = 'words') -> Dict[str, Any]:
+        """
+        Convert raw EasyOCR output ke standard result format
+        
+        Args:
+            results: List of (bbox, text, confidence) dari EasyOCR
+            languages: Language codes
+            detail_level: 'text' (tanpa word dicts) atau 'words'
+        
+        Returns:
+            dict: EasyOCR result
+        """
+        confs = np.fromiter((r[2] for r in results), dtype=np.float64, count=len(results))
+        mask = confs > self.default_config['confidence_threshold']
+        keep = [r for r, m in zip(results, mask.tolist()) if m]
+        
+        words = []
+        if keep and detail_level == 'words':
+            # Semua bboxes (N, 4, 2) direduksi sekaligus, bukan per word
+            bboxes = np.asarray([r[0] for r in keep], dtype=np.float32)
+            mins = bboxes.min(axis=1)
+            sizes = bboxes.max(axis=1) - mins
+            
+            words = [
+                {
+                    'text': text,
+                    'confidence': confidence * 100,  # Convert ke percentage
+                    'bbox': {'x': x, 'y': y, 'width': width, 'height': height}
+                }
+                for (_, text, confidence), (x, y), (width, height) in zip(
+                    keep, mins.astype(np.int32).tolist(), sizes.astype(np.int32).tolist()
+                )
+            ]
+        
+        # Combine text
+        full_text = ' '.join(r[1] for r in keep)
+        avg_confidence = float(confs[mask].mean()) * 100 if keep else 0
+        
+        return {
+            'text': full_text.strip(),
+            'confidence': avg_confidence,
+            'engine': 'easyocr',
+            'languages': languages,
+            'word_count': len(keep),
+            'words': words
+        }
+    
+    
+    def _extract_batch_with_easyocr(self, images: List[np.ndarray], languages: List[str],
+                                    detail_level: str = 'words') -> List[Dict[str, Any]]:
+        """
+        Extract text dari multiple images dengan EasyOCR readtext_batched
+        
+        Images dikelompokkan berdasarkan shape; setiap group dengan ukuran
+        sama di-stack menjadi satu [B, H, W, C] batch sehingga recognizer
+        berjalan sekali per group. Image dengan shape unik diproses per-image.
+        
+        Args:
+            images: List of image arrays
+            languages: Language codes
+            detail_level: 'text' atau 'words'
+        
+        Returns:
+            list: EasyOCR result per image (urutan sama dengan input)
+        """
+        outputs = [None] * len(images)
+        
+        groups = {}
+        for index, image_array in enumerate(images):
+            groups.setdefault(image_array.shape, []).append(index)
+        
+        for indices in groups.values():
+            if len(indices) > 1:
+                try:
+                    reader = self._get_easyocr_reader(languages)
+                    batch = np.stack([images[i] for i in indices])
+                    batch_results = reader.readtext_batched(
+                        batch, batch_size=self.default_config['easyocr_batch_size']
+                    )
+                    
+                    for index, results in zip(indices, batch_results):
+                        outputs[index] = self._format_easyocr_result(results, languages, detail_level)
+                    continue
+                
+                except Exception as e:
+                    self.logger.warning(f"EasyOCR batched extraction failed, falling back per image: {e}")
+            
+            for index in indices:
+                outputs[index] = self._extract_with_easyocr(images[index], languages, detail_level)
+        
+        return outputs
+    
+    
     def _select_best_result(self, results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Select best result dari multiple OCR engines
@@ -330,57 +1147,58 @@ class OCRService:
             if not results:
                 return {'text': '', 'confidence': 0, 'engine_used': 'none'}
             
+            # Result baru (bukan engine result itu sendiri): caller menambahkan
+            # all_results = results, jadi tag in place akan membuat circular reference
+            
             # Jika hanya satu result
             if len(results) == 1:
                 engine_name, result = next(iter(results.items()))
-                result['engine_used'] = engine_name
-                return result
+                return {**result, 'engine_used': engine_name}
             
             # Multiple results - select based on criteria
-            best_result = None
-            best_score = -1
-            
-            for engine_name, result in results.items():
-                if 'error' in result:
-                    continue
-                
-                # Scoring criteria
-                confidence = result.get('confidence', 0)
-                text_length = len(result.get('text', '').strip())
-                word_count = result.get('word_count', 0)
-                
-                # Calculate composite score
-                score = (
-                    confidence * 0.6 +  # Confidence weight: 60%
-                    min(text_length / 100, 50) * 0.3 +  # Text length weight: 30% (capped)
-                    min(word_count, 20) * 0.1  # Word count weight: 10% (capped)
-                )
-                
-                if score > best_score:
-                    best_score = score
-                    best_result = result.copy()
-                    best_result['engine_used'] = engine_name
+            candidates = [(name, result) for name, result in results.items() if 'error' not in result]
             
-            if best_result is None:
+            if not candidates:
                 # Fallback ke first available result
                 engine_name, result = next(iter(results.items()))
-                result['engine_used'] = engine_name
-                return result
+                return {**result, 'engine_used': engine_name}
             
-            return best_result
+            engine_name, best_result = max(candidates, key=lambda item: self._result_score(item[1]))
+            
+            return {**best_result, 'engine_used': engine_name}
             
         except Exception as e:
             self.logger.error(f"Best result selection failed: {e}")
             return {'text': '', 'confidence': 0, 'engine_used': 'error', 'error': str(e)}
     
     
-    def get_supported_languages(self) -> Dict[str, List[str]]:
+    @staticmethod
+    def _result_score(result: Dict[str, Any]) -> float:
+        """Composite score untuk memilih best result antar engines"""
+        confidence = result.get('confidence', 0)
+        text_length = len(result.get('text', '').strip())
+        word_count = result.get('word_count', 0)
+        
+        return (
+            confidence * 0.6 +  # Confidence weight: 60%
+            min(text_length / 100, 50) * 0.3 +  # Text length weight: 30% (capped)
+            min(word_count, 20) * 0.1  # Word count weight: 10% (capped)
+        )
+    
+    
+    def get_supported_languages(self, refresh: bool = False) -> Dict[str, List[str]]:
         """
         Get supported languages untuk each engine
         
+        Args:
+            refresh (bool): Query ulang engines (abaikan cache)
+        
         Returns:
             dict: Supported languages per engine
         """
+        if self._supported_languages is not None and not refresh:
+            return self._supported_languages
+        
         languages = {}
         
         # Tesseract languages
@@ -403,30 +1221,52 @@ class OCRService:
             except Exception:
                 languages['easyocr'] = ['en', 'id']
         
+        self._supported_languages = languages
         return languages
     
     
-    def get_tesseract_info(self) -> Dict[str, Any]:
-        """Get Tesseract engine information"""
+    def get_tesseract_info(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get Tesseract engine information
+        
+        Args:
+            refresh (bool): Query ulang Tesseract (abaikan cache)
+        
+        Returns:
+            dict: Tesseract info
+        """
         if not self._tesseract_available:
             return {'available': False, 'error': 'Tesseract not available'}
         
+        if self._tesseract_info is not None and not refresh:
+            return self._tesseract_info
+        
         try:
-            version = pytesseract.get_tesseract_version()
+            if self._tesseract_version is None or refresh:
+                self._tesseract_version = str(pytesseract.get_tesseract_version())
             languages = pytesseract.get_languages()
             
-            return {
+            self._tesseract_info = {
                 'available': True,
-                'version': str(version),
+                'version': self._tesseract_version,
                 'languages': languages,
                 'config': self.default_config['tesseract_config']
             }
+            return self._tesseract_info
         except Exception as e:
             return {'available': False, 'error': str(e)}
     
     
-    def get_easyocr_info(self) -> Dict[str, Any]:
-        """Get EasyOCR engine information"""
+    def get_easyocr_info(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get EasyOCR engine information
+        
+        Args:
+            refresh (bool): Query ulang supported languages (abaikan cache)
+        
+        Returns:
+            dict: EasyOCR info
+        """
         if not self._easyocr_available:
             return {'available': False, 'error': 'EasyOCR not available'}
         
@@ -436,25 +1276,37 @@ class OCRService:
                 'available': True,
                 'version': getattr(easyocr, '__version__', 'unknown'),
                 'gpu_enabled': self.default_config['easyocr_gpu'],
-                'languages': self.get_supported_languages().get('easyocr', [])
+                'languages': self.get_supported_languages(refresh=refresh).get('easyocr', [])
             }
         except Exception as e:
             return {'available': False, 'error': str(e)}
     
     
-    def get_engine_status(self) -> Dict[str, Any]:
-        """Get status dari semua OCR engines"""
-        return {
+    def get_engine_status(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get status dari semua OCR engines
+        
+        Args:
+            refresh (bool): Query ulang engines (abaikan cache)
+        
+        Returns:
+            dict: Engine status
+        """
+        if self._engine_status is not None and not refresh:
+            return self._engine_status
+        
+        self._engine_status = {
             'tesseract': {
                 'available': self._tesseract_available,
-                'info': self.get_tesseract_info() if self._tesseract_available else None
+                'info': self.get_tesseract_info(refresh) if self._tesseract_available else None
             },
             'easyocr': {
                 'available': self._easyocr_available,
-                'info': self.get_easyocr_info() if self._easyocr_available else None
+                'info': self.get_easyocr_info(refresh) if self._easyocr_available else None
             },
             'recommended_engine': self._get_recommended_engine()
         }
+        return self._engine_status
     
     
     def _get_recommended_engine(self) -> str:
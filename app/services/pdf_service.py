@@ -8,9 +8,17 @@ Author: AI Assistant
 Date: August 2025
 """
 
+import atexit
+import errno
+import hashlib
 import logging
+import queue
+import threading
 import time
-from typing import Dict, Any, List, Optional, Tuple
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, Any, List, Optional, Tuple, Callable
 import tempfile
 import os
 from pathlib import Path
@@ -23,12 +31,122 @@ try:
 except ImportError:
     DEPENDENCIES_AVAILABLE = False
 
+# PyMuPDF optional - text extraction dan rendering di C, fallback ke PyPDF2/pdf2image
+try:
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+PDF_SUPPORT_AVAILABLE = DEPENDENCIES_AVAILABLE or PYMUPDF_AVAILABLE
+
 from PIL import Image
 import numpy as np
 
-# Import internal services
+# Import internal services (OCRService di-import lazily saat OCR fallback dibutuhkan)
 from app.services.image_service import ImageService
-from app.services.ocr_service import OCRService
+from app.utils.file_manager import FileManager
+
+# Sentinel akhir stream antar pipeline stages di _extract_with_ocr
+_PIPELINE_DONE = object()
+
+# Shared process pool untuk PyPDF2 direct extraction (dibuat saat pertama dibutuhkan,
+# dipakai ulang antar requests supaya worker startup hanya dibayar sekali)
+_process_pool = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool(max_workers: int) -> Tuple[ProcessPoolExecutor, int]:
+    """
+    Get shared process pool, buat jika belum ada
+    
+    Args:
+        max_workers (int): Jumlah worker processes untuk pool baru
+    
+    Returns:
+        tuple: (pool, jumlah workers)
+    """
+    global _process_pool, _process_pool_workers
+    with _process_pool_lock:
+        if _process_pool is None:
+            # forkserver: aman dipakai dari multi-threaded server process
+            context = multiprocessing.get_context(
+                'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            )
+            _process_pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+            _process_pool_workers = max_workers
+            atexit.register(_process_pool.shutdown, wait=False)
+        return _process_pool, _process_pool_workers
+
+
+def _discard_process_pool():
+    """Shutdown shared process pool (misal setelah BrokenProcessPool); pool baru dibuat lazily"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def _open_document(pdf_path: str):
+    """
+    Open PDF sekali untuk dipakai ulang (fitz.Document atau PyPDF2.PdfReader)
+    
+    Args:
+        pdf_path (str): Path ke PDF file
+    
+    Returns:
+        Document object sesuai backend yang tersedia
+    """
+    if PYMUPDF_AVAILABLE:
+        return fitz.open(pdf_path)
+    # PdfReader dengan path membaca file ke memory, tidak ada file handle yang tertinggal
+    return PyPDF2.PdfReader(pdf_path)
+
+
+def _close_document(document):
+    """Close document dari _open_document"""
+    if PYMUPDF_AVAILABLE:
+        document.close()
+
+
+def _extract_page_texts(pdf_path: str, page_indices: List[int],
+                        document=None) -> List[Tuple[int, str, Optional[str]]]:
+    """
+    Extract text dari beberapa pages dengan satu document open
+    
+    Memakai PyMuPDF jika tersedia, selain itu PyPDF2. Module-level supaya
+    picklable untuk ProcessPoolExecutor workers.
+    
+    Args:
+        pdf_path (str): Path ke PDF file
+        page_indices (list): 0-based page indices
+        document: Document yang sudah dibuka (optional, hanya dalam process yang sama)
+    
+    Returns:
+        list: (page_index, text, error) per page
+    """
+    owned = document is None
+    if owned:
+        document = _open_document(pdf_path)
+    
+    try:
+        results = []
+        for page_index in page_indices:
+            try:
+                if PYMUPDF_AVAILABLE:
+                    text = document[page_index].get_text('text')
+                else:
+                    text = document.pages[page_index].extract_text()
+                results.append((page_index, text, None))
+            except Exception as e:
+                results.append((page_index, '', str(e)))
+        return results
+    
+    finally:
+        if owned:
+            _close_document(document)
 
 
 class PDFService:
@@ -42,26 +160,60 @@ class PDFService:
     - Batch processing support
     """
     
-    def __init__(self):
-        """Initialize PDF Service"""
+    def __init__(self, image_service: Optional[ImageService] = None,
+                 ocr_service_factory: Optional[Callable[[], Any]] = None,
+                 file_manager: Optional[FileManager] = None,
+                 cache_expiry_hours: int = 24):
+        """
+        Initialize PDF Service
+        
+        Args:
+            image_service (ImageService): Shared ImageService (optional)
+            ocr_service_factory (callable): Factory untuk OCRService, dipanggil
+                saat OCR pertama kali dibutuhkan (default: OCRService baru)
+            file_manager (FileManager): Jika diberikan, hasil per page di-cache
+                di disk berdasarkan content hash PDF (optional)
+            cache_expiry_hours (int): Umur maksimum page cache entries
+        """
         self.logger = logging.getLogger(__name__)
-        self.image_service = ImageService()
-        self.ocr_service = OCRService()
+        self.image_service = image_service or ImageService()
+        self._ocr_service = None
+        self._ocr_service_factory = ocr_service_factory
+        self.file_manager = file_manager
+        self.cache_expiry_hours = cache_expiry_hours
         
         # Check dependencies
-        if not DEPENDENCIES_AVAILABLE:
+        if not PDF_SUPPORT_AVAILABLE:
             self.logger.warning("PDF dependencies not available. Limited functionality.")
         
         # PDF processing configuration
         self.config = {
             'dpi': 300,  # DPI untuk PDF to image conversion
             'format': 'PNG',  # Output format untuk converted images
-            'thread_count': 1,  # Parallel processing threads
+            # pdftoppm processes untuk pdf2image fallback (satu core disisakan untuk OCR/IO)
+            'thread_count': max(1, (os.cpu_count() or 1) - 1),
+            'process_count': None,  # Worker processes untuk direct extraction (None = cpu_count)
+            'parallel_page_threshold': 16,  # Minimum pages sebelum PyPDF2 extraction memakai process pool
+            'pipeline_depth': 2,  # Pages yang boleh antri antar render/enhance/OCR stages
+            'ocr_engine': 'auto',  # Engine untuk OCR fallback (diproses batched per engine group)
+            'ocr_batch_size': 8,  # Pages per extract_text_batched call
             'max_pages': 100,  # Maximum pages to process
             'direct_extraction_threshold': 0.1  # Minimum text ratio untuk direct extraction
         }
     
     
+    @property
+    def ocr_service(self):
+        """OCRService, dibuat saat pertama kali diakses"""
+        if self._ocr_service is None:
+            if self._ocr_service_factory is not None:
+                self._ocr_service = self._ocr_service_factory()
+            else:
+                from app.services.ocr_service import OCRService
+                self._ocr_service = OCRService()
+        return self._ocr_service
+    
+    
     def get_pdf_info(self, pdf_path: str) -> Optional[Dict[str, Any]]:
         """
         Get basic information tentang PDF file
@@ -73,52 +225,113 @@ class PDFService:
             dict: PDF information atau None jika gagal
         """
         try:
-            if not DEPENDENCIES_AVAILABLE:
+            if not PDF_SUPPORT_AVAILABLE:
                 return None
             
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                # Get basic info
-                num_pages = len(pdf_reader.pages)
-                
-                # Try to get metadata
-                metadata = {}
-                if pdf_reader.metadata:
-                    for key, value in pdf_reader.metadata.items():
-                        if value:
-                            metadata[key.replace('/', '')] = str(value)
-                
-                # Check if PDF has extractable text
-                extractable_text = False
-                sample_text = ""
-                
-                if num_pages > 0:
-                    try:
-                        first_page = pdf_reader.pages[0]
-                        sample_text = first_page.extract_text()
-                        extractable_text = len(sample_text.strip()) > 0
-                    except Exception:
-                        pass
-                
-                return {
-                    'filename': os.path.basename(pdf_path),
-                    'file_size': os.path.getsize(pdf_path),
-                    'page_count': num_pages,
-                    'has_extractable_text': extractable_text,
-                    'sample_text_length': len(sample_text.strip()),
-                    'metadata': metadata,
-                    'processing_recommendation': 'direct' if extractable_text else 'ocr'
-                }
+            document = _open_document(pdf_path)
+            try:
+                return self._build_pdf_info(pdf_path, document)
+            finally:
+                _close_document(document)
                 
         except Exception as e:
             self.logger.error(f"Failed to get PDF info for {pdf_path}: {e}")
             return None
     
     
+    def _build_pdf_info(self, pdf_path: str, document) -> Dict[str, Any]:
+        """
+        Build PDF information dari document yang sudah dibuka
+        
+        Args:
+            pdf_path (str): Path ke PDF file
+            document: Document dari _open_document
+        
+        Returns:
+            dict: PDF information
+        """
+        if PYMUPDF_AVAILABLE:
+            num_pages, metadata, sample_text = self._read_pdf_info_pymupdf(document)
+        else:
+            num_pages, metadata, sample_text = self._read_pdf_info_pypdf2(document)
+        
+        extractable_text = len(sample_text.strip()) > 0
+        
+        return {
+            'filename': os.path.basename(pdf_path),
+            'file_size': os.path.getsize(pdf_path),
+            'page_count': num_pages,
+            'has_extractable_text': extractable_text,
+            'sample_text_length': len(sample_text.strip()),
+            'metadata': metadata,
+            'processing_recommendation': 'direct' if extractable_text else 'ocr'
+        }
+    
+    
+    def _read_pdf_info_pymupdf(self, doc) -> Tuple[int, Dict[str, str], str]:
+        """
+        Read page count, metadata dan first page text dengan PyMuPDF
+        
+        Metadata keys disamakan dengan PyPDF2 document info (Title, Author, ...).
+        
+        Args:
+            doc (fitz.Document): Opened document
+        
+        Returns:
+            tuple: (num_pages, metadata, sample_text)
+        """
+        num_pages = doc.page_count
+        
+        metadata = {}
+        for key, value in (doc.metadata or {}).items():
+            if value and key not in ('format', 'encryption'):
+                metadata[key[0].upper() + key[1:]] = str(value)
+        
+        sample_text = ""
+        if num_pages > 0:
+            try:
+                sample_text = doc[0].get_text('text')
+            except Exception:
+                pass
+        
+        return num_pages, metadata, sample_text
+    
+    
+    def _read_pdf_info_pypdf2(self, pdf_reader) -> Tuple[int, Dict[str, str], str]:
+        """
+        Read page count, metadata dan first page text dengan PyPDF2
+        
+        Args:
+            pdf_reader (PyPDF2.PdfReader): Opened reader
+        
+        Returns:
+            tuple: (num_pages, metadata, sample_text)
+        """
+        # Get basic info
+        num_pages = len(pdf_reader.pages)
+        
+        # Try to get metadata
+        metadata = {}
+        if pdf_reader.metadata:
+            for key, value in pdf_reader.metadata.items():
+                if value:
+                    metadata[key.replace('/', '')] = str(value)
+        
+        sample_text = ""
+        if num_pages > 0:
+            try:
+                sample_text = pdf_reader.pages[0].extract_text()
+            except Exception:
+                pass
+        
+        return num_pages, metadata, sample_text
+    
+    
     def extract_text_from_pdf(self, pdf_path: str, page_start: Optional[int] = None,
                              page_end: Optional[int] = None, enhancement_level: int = 2,
-                             try_direct: bool = True) -> Dict[str, Any]:
+                             try_direct: bool = True,
+                             pdf_info: Optional[Dict[str, Any]] = None,
+                             force_refresh: bool = False) -> Dict[str, Any]:
         """
         Extract text dari PDF menggunakan direct extraction atau OCR
         
@@ -128,14 +341,19 @@ class PDFService:
             page_end (int): Ending page (1-indexed, optional)
             enhancement_level (int): Image enhancement level untuk OCR
             try_direct (bool): Try direct text extraction first
+            pdf_info (dict): Hasil get_pdf_info jika caller sudah memilikinya
+                (info tidak dibangun ulang)
+            force_refresh (bool): Abaikan page cache dan extract ulang
         
         Returns:
-            dict: Extraction result dengan pages dan metadata
+            dict: Extraction result dengan pages, metadata dan pdf_info (dari
+                document yang sama, caller tidak perlu get_pdf_info terpisah)
         """
         start_time = time.time()
+        document = None
         
         try:
-            if not DEPENDENCIES_AVAILABLE:
+            if not PDF_SUPPORT_AVAILABLE:
                 return {
                     'pages': [],
                     'method': 'error',
@@ -143,8 +361,14 @@ class PDFService:
                     'error': 'PDF dependencies not available'
                 }
             
-            # Get PDF info
-            pdf_info = self.get_pdf_info(pdf_path)
+            # Satu open untuk PDF info dan direct extraction
+            try:
+                document = _open_document(pdf_path)
+                if pdf_info is None:
+                    pdf_info = self._build_pdf_info(pdf_path, document)
+            except Exception as e:
+                self.logger.error(f"Failed to get PDF info for {pdf_path}: {e}")
+            
             if not pdf_info:
                 return {
                     'pages': [],
@@ -170,21 +394,30 @@ class PDFService:
                 page_end = page_start + self.config['max_pages'] - 1
                 self.logger.warning(f"Limited processing to {self.config['max_pages']} pages")
             
+            page_numbers = list(range(page_start, page_end + 1))
+            pdf_hash = self._pdf_hash(pdf_path)
+            
             # Try direct extraction first jika enabled
             if try_direct and pdf_info['has_extractable_text']:
-                direct_result = self._extract_direct_text(pdf_path, page_start, page_end)
+                direct_result = self._extract_direct_text(
+                    pdf_path, page_numbers, document, pdf_hash, force_refresh
+                )
                 
                 # Check quality of direct extraction
                 if self._is_direct_extraction_good(direct_result):
                     direct_result['method'] = 'direct'
+                    direct_result['pdf_info'] = pdf_info
                     direct_result['total_time'] = time.time() - start_time
                     return direct_result
                 else:
                     self.logger.info("Direct extraction quality poor, falling back to OCR")
             
             # Fallback ke OCR extraction
-            ocr_result = self._extract_with_ocr(pdf_path, page_start, page_end, enhancement_level)
+            ocr_result = self._extract_with_ocr(
+                pdf_path, page_numbers, enhancement_level, pdf_hash, force_refresh
+            )
             ocr_result['method'] = 'ocr'
+            ocr_result['pdf_info'] = pdf_info
             ocr_result['total_time'] = time.time() - start_time
             
             return ocr_result
@@ -197,49 +430,58 @@ class PDFService:
                 'total_time': time.time() - start_time,
                 'error': str(e)
             }
+        
+        finally:
+            if document is not None:
+                _close_document(document)
     
     
-    def _extract_direct_text(self, pdf_path: str, page_start: int, page_end: int) -> Dict[str, Any]:
+    def _extract_direct_text(self, pdf_path: str, page_numbers: List[int], document=None,
+                             pdf_hash: Optional[str] = None, force_refresh: bool = False) -> Dict[str, Any]:
         """
-        Extract text directly dari PDF menggunakan PyPDF2
+        Extract text directly dari PDF (PyMuPDF, fallback PyPDF2)
         
         Args:
             pdf_path (str): Path ke PDF file
-            page_start (int): Starting page
-            page_end (int): Ending page
+            page_numbers (list): Page numbers (1-indexed)
+            document: Document yang sudah dibuka (optional)
+            pdf_hash (str): Content hash untuk page cache (None = tanpa cache)
+            force_refresh (bool): Abaikan cached pages
         
         Returns:
             dict: Direct extraction result
         """
         try:
+            cached = self._load_cached_pages(pdf_hash, page_numbers, 'direct', force_refresh=force_refresh)
+            missing = [page_num for page_num in page_numbers if page_num not in cached]
+            
             pages = []
             
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                
-                for page_num in range(page_start - 1, page_end):
-                    try:
-                        page = pdf_reader.pages[page_num]
-                        text = page.extract_text()
-                        
-                        pages.append({
-                            'page_number': page_num + 1,
-                            'text': text.strip(),
-                            'extraction_method': 'direct',
-                            'confidence': 100 if text.strip() else 0,
-                            'word_count': len(text.split()) if text else 0
-                        })
-                        
-                    except Exception as e:
-                        self.logger.error(f"Failed to extract page {page_num + 1}: {e}")
-                        pages.append({
-                            'page_number': page_num + 1,
-                            'text': '',
-                            'extraction_method': 'direct',
-                            'confidence': 0,
-                            'word_count': 0,
-                            'error': str(e)
-                        })
+            for page_index, text, error in self._extract_page_texts(pdf_path, missing, document) if missing else ():
+                if error is None:
+                    pages.append({
+                        'page_number': page_index + 1,
+                        'text': text.strip(),
+                        'extraction_method': 'direct',
+                        'confidence': 100 if text.strip() else 0,
+                        'word_count': len(text.split()) if text else 0
+                    })
+                else:
+                    self.logger.error(f"Failed to extract page {page_index + 1}: {error}")
+                    pages.append({
+                        'page_number': page_index + 1,
+                        'text': '',
+                        'extraction_method': 'direct',
+                        'confidence': 0,
+                        'word_count': 0,
+                        'error': error
+                    })
+            
+            self._save_cached_pages(pdf_hash, pages, 'direct')
+            
+            if cached:
+                pages.extend(cached.values())
+                pages.sort(key=lambda page: page['page_number'])
             
             # Calculate average confidence
             confidences = [p['confidence'] for p in pages if p['confidence'] > 0]
@@ -261,62 +503,110 @@ class PDFService:
             }
     
     
-    def _extract_with_ocr(self, pdf_path: str, page_start: int, page_end: int, 
-                         enhancement_level: int) -> Dict[str, Any]:
+    def _extract_page_texts(self, pdf_path: str, page_numbers: List[int],
+                            document=None) -> List[Tuple[int, str, Optional[str]]]:
+        """
+        Extract raw text per page, paralel di process pool untuk PDF besar
+        
+        Hanya PyPDF2 backend yang memakai pool: content-stream parsing pure
+        Python (GIL-bound), jadi pages dibagi menjadi contiguous chunks per
+        worker process dan setiap worker membuka PdfReader sendiri sekali.
+        PyMuPDF get_text hanya beberapa ms per page, lebih murah dari IPC.
+        
+        Args:
+            pdf_path (str): Path ke PDF file
+            page_numbers (list): Page numbers (1-indexed)
+            document: Document yang sudah dibuka, dipakai untuk sequential path
+        
+        Returns:
+            list: (page_index, text, error) per page, urutan sama dengan page_numbers
+        """
+        page_indices = [page_num - 1 for page_num in page_numbers]
+        process_count = self.config['process_count'] or os.cpu_count() or 1
+        
+        if (PYMUPDF_AVAILABLE or process_count < 2
+                or len(page_indices) < self.config['parallel_page_threshold']):
+            return _extract_page_texts(pdf_path, page_indices, document)
+        
+        try:
+            executor, workers = _get_process_pool(process_count)
+            
+            chunk_size = -(-len(page_indices) // min(workers, len(page_indices)))
+            chunks = [page_indices[i:i + chunk_size] for i in range(0, len(page_indices), chunk_size)]
+            
+            return [
+                result
+                for chunk_results in executor.map(_extract_page_texts, repeat(pdf_path), chunks)
+                for result in chunk_results
+            ]
+        
+        except Exception as e:
+            self.logger.warning(f"Parallel direct extraction failed, falling back to sequential: {e}")
+            _discard_process_pool()
+            return _extract_page_texts(pdf_path, page_indices, document)
+    
+    
+    def _extract_with_ocr(self, pdf_path: str, page_numbers: List[int], enhancement_level: int,
+                         pdf_hash: Optional[str] = None, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Extract text menggunakan OCR pada converted images
         
         Args:
             pdf_path (str): Path ke PDF file
-            page_start (int): Starting page
-            page_end (int): Ending page
+            page_numbers (list): Page numbers (1-indexed, ascending)
             enhancement_level (int): Image enhancement level
+            pdf_hash (str): Content hash untuk page cache (None = tanpa cache)
+            force_refresh (bool): Abaikan cached pages
         
         Returns:
             dict: OCR extraction result
         """
         try:
+            cached = self._load_cached_pages(
+                pdf_hash, page_numbers, 'ocr', enhancement_level, force_refresh
+            )
+            missing = [page_num for page_num in page_numbers if page_num not in cached]
+            
             pages = []
             
-            # Convert PDF pages ke images
-            images = convert_from_path(
-                pdf_path,
-                dpi=self.config['dpi'],
-                first_page=page_start,
-                last_page=page_end,
-                fmt=self.config['format']
-            )
+            batch = []  # (page_number, enhanced_image) yang menunggu OCR
             
-            for i, image in enumerate(images):
-                page_num = page_start + i
-                
+            def flush_batch():
                 try:
-                    # Apply image enhancement
-                    enhanced_image = self.image_service.enhance_image(image, enhancement_level)
-                    
-                    # Perform OCR
-                    ocr_result = self.ocr_service.extract_text(enhanced_image)
-                    
-                    pages.append({
-                        'page_number': page_num,
-                        'text': ocr_result.get('text', ''),
-                        'extraction_method': 'ocr',
-                        'confidence': ocr_result.get('confidence', 0),
-                        'word_count': len(ocr_result.get('text', '').split()) if ocr_result.get('text') else 0,
-                        'engine_used': ocr_result.get('engine_used', 'unknown'),
-                        'processing_time': ocr_result.get('processing_time', 0)
-                    })
-                    
+                    ocr_results = self.ocr_service.extract_text_batched(
+                        [image for _, image in batch], engine=self.config['ocr_engine']
+                    )
+                    for (page_num, _), ocr_result in zip(batch, ocr_results):
+                        pages.append(self._ocr_page_entry(page_num, ocr_result))
+                
                 except Exception as e:
-                    self.logger.error(f"OCR failed for page {page_num}: {e}")
-                    pages.append({
-                        'page_number': page_num,
-                        'text': '',
-                        'extraction_method': 'ocr',
-                        'confidence': 0,
-                        'word_count': 0,
-                        'error': str(e)
-                    })
+                    for page_num, _ in batch:
+                        self.logger.error(f"OCR failed for page {page_num}: {e}")
+                        pages.append(self._ocr_error_entry(page_num, e))
+                
+                batch.clear()
+            
+            # Render dan enhancement berjalan di background threads, OCR di thread ini
+            for page_num, enhanced_image, error in self._iter_enhanced_pages(
+                pdf_path, missing, enhancement_level
+            ) if missing else ():
+                if error is not None:
+                    self.logger.error(f"OCR failed for page {page_num}: {error}")
+                    pages.append(self._ocr_error_entry(page_num, error))
+                    continue
+                
+                batch.append((page_num, enhanced_image))
+                if len(batch) >= self.config['ocr_batch_size']:
+                    flush_batch()
+            
+            if batch:
+                flush_batch()
+            
+            self._save_cached_pages(pdf_hash, pages, 'ocr', enhancement_level)
+            pages.extend(cached.values())
+            
+            # Error pages dan cached pages ditambahkan tanpa menunggu batch
+            pages.sort(key=lambda page: page['page_number'])
             
             # Calculate statistics
             confidences = [p['confidence'] for p in pages if p['confidence'] > 0]
@@ -342,6 +632,254 @@ class PDFService:
             }
     
     
+    def _pdf_hash(self, pdf_path: str) -> Optional[str]:
+        """
+        Content hash PDF untuk page cache (None jika cache tidak aktif)
+        
+        Hash seluruh file, bukan hanya prefix: incremental updates menambah
+        data di akhir file dengan awal file yang sama.
+        """
+        if self.file_manager is None:
+            return None
+        
+        try:
+            with open(pdf_path, 'rb') as file:
+                digest, _ = self.file_manager.hash_stream(file)
+            return digest
+        except OSError as e:
+            self.logger.warning(f"Failed to hash PDF for page cache: {e}")
+            return None
+    
+    
+    def _page_cache_key(self, pdf_hash: str, page_num: int, method: str,
+                        enhancement_level: Optional[int] = None) -> str:
+        """Cache key per (PDF content, page, method dan parameters yang mempengaruhi hasil)"""
+        key = f"pdf:{pdf_hash}:{page_num}:{method}"
+        if method == 'ocr':
+            key += f":{enhancement_level}:{self.config['dpi']}:{self.config['ocr_engine']}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    
+    
+    def _load_cached_pages(self, pdf_hash: Optional[str], page_numbers: List[int], method: str,
+                           enhancement_level: Optional[int] = None,
+                           force_refresh: bool = False) -> Dict[int, Dict[str, Any]]:
+        """
+        Load cached page entries
+        
+        Args:
+            pdf_hash (str): Content hash PDF (None = cache tidak aktif)
+            page_numbers (list): Page numbers
+            method (str): 'direct' atau 'ocr'
+            enhancement_level (int): Enhancement level (OCR)
+            force_refresh (bool): Abaikan cache
+        
+        Returns:
+            dict: Page entry per page number untuk cache hits
+        """
+        if pdf_hash is None or force_refresh:
+            return {}
+        
+        cached = {}
+        for page_num in page_numbers:
+            page = self.file_manager.load_cached_result(
+                self._page_cache_key(pdf_hash, page_num, method, enhancement_level),
+                max_age_hours=self.cache_expiry_hours
+            )
+            if page is not None:
+                cached[page_num] = page
+        
+        return cached
+    
+    
+    def _save_cached_pages(self, pdf_hash: Optional[str], pages: List[Dict[str, Any]], method: str,
+                           enhancement_level: Optional[int] = None):
+        """Save page entries tanpa error ke page cache"""
+        if pdf_hash is None:
+            return
+        
+        for page in pages:
+            if 'error' in page:
+                continue
+            try:
+                self.file_manager.save_cached_result(
+                    self._page_cache_key(pdf_hash, page['page_number'], method, enhancement_level),
+                    page
+                )
+            except Exception as e:
+                self.logger.warning(f"Failed to cache page {page['page_number']}: {e}")
+    
+    
+    def _ocr_page_entry(self, page_num: int, ocr_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build page entry dari OCRService result"""
+        return {
+            'page_number': page_num,
+            'text': ocr_result.get('text', ''),
+            'extraction_method': 'ocr',
+            'confidence': ocr_result.get('confidence', 0),
+            'word_count': len(ocr_result.get('text', '').split()) if ocr_result.get('text') else 0,
+            'engine_used': ocr_result.get('engine_used', 'unknown'),
+            'processing_time': ocr_result.get('processing_time', 0)
+        }
+    
+    
+    def _ocr_error_entry(self, page_num: int, error: Exception) -> Dict[str, Any]:
+        """Build page entry untuk page yang gagal di-OCR"""
+        return {
+            'page_number': page_num,
+            'text': '',
+            'extraction_method': 'ocr',
+            'confidence': 0,
+            'word_count': 0,
+            'error': str(error)
+        }
+    
+    
+    def _iter_enhanced_pages(self, pdf_path: str, page_numbers: List[int],
+                             enhancement_level: int):
+        """
+        Render dan enhance pages di background threads, overlap dengan OCR caller
+        
+        Render thread -> queue -> enhance thread -> queue -> caller. OpenCV
+        enhancement, pdftoppm subprocesses (pdf2image) dan OCR engines melepas
+        GIL sehingga stages tersebut overlap. PyMuPDF get_pixmap menahan GIL:
+        dengan PyMuPDF backend, rendering tidak overlap dengan stages lain dan
+        hanya enhance/OCR yang berjalan bersamaan. Queues dibatasi
+        pipeline_depth supaya rendered pages tidak menumpuk di memory.
+        
+        Args:
+            pdf_path (str): Path ke PDF file
+            page_numbers (list): Page numbers (1-indexed)
+            enhancement_level (int): Image enhancement level
+        
+        Yields:
+            tuple: (page_number, enhanced_image, error) - error berisi exception
+                enhancement untuk page tersebut (enhanced_image None)
+        
+        Raises:
+            Exception: Error dari rendering stage
+        """
+        depth = self.config['pipeline_depth']
+        rendered = queue.Queue(maxsize=depth)
+        enhanced = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+        
+        def put(target: queue.Queue, item) -> bool:
+            # Put yang berhenti jika consumer sudah selesai (tanpa block selamanya)
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def render():
+            try:
+                for item in self._render_pages(pdf_path, page_numbers):
+                    if not put(rendered, item):
+                        return
+            except Exception as e:
+                put(rendered, e)
+            put(rendered, _PIPELINE_DONE)
+        
+        def enhance():
+            while True:
+                item = rendered.get()
+                if item is _PIPELINE_DONE or isinstance(item, Exception):
+                    put(enhanced, item)
+                    return
+                
+                page_num, image = item
+                try:
+                    result = (page_num, self.image_service.enhance_image(image, enhancement_level), None)
+                except Exception as e:
+                    result = (page_num, None, e)
+                
+                if not put(enhanced, result):
+                    return
+        
+        workers = [
+            threading.Thread(target=render, name='pdf-render', daemon=True),
+            threading.Thread(target=enhance, name='pdf-enhance', daemon=True)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        try:
+            while True:
+                item = enhanced.get()
+                if item is _PIPELINE_DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            # Lepaskan enhance thread yang mungkin menunggu rendered.get()
+            try:
+                rendered.put_nowait(_PIPELINE_DONE)
+            except queue.Full:
+                pass
+    
+    
+    def _render_pages(self, pdf_path: str, page_numbers: List[int]):
+        """
+        Render PDF pages ke images pada config DPI
+        
+        PyMuPDF me-render langsung ke memory (tanpa pdftoppm subprocess dan
+        temp PPM files) dan menghasilkan RGB numpy arrays; tanpa PyMuPDF
+        dipakai pdf2image yang menghasilkan PIL Images.
+        
+        Args:
+            pdf_path (str): Path ke PDF file
+            page_numbers (list): Page numbers (1-indexed, ascending)
+        
+        Yields:
+            tuple: (page_number, image)
+        """
+        if PYMUPDF_AVAILABLE:
+            scale = self.config['dpi'] / 72
+            matrix = fitz.Matrix(scale, scale)
+            
+            with fitz.open(pdf_path) as doc:
+                for page_num in page_numbers:
+                    pix = doc[page_num - 1].get_pixmap(matrix=matrix, alpha=False, colorspace=fitz.csRGB)
+                    # samples: bytes milik array, tetap valid setelah pixmap dibuang
+                    yield page_num, np.frombuffer(pix.samples, dtype=np.uint8).reshape(
+                        pix.height, pix.width, pix.n
+                    )
+            return
+        
+        # pdf2image: satu convert_from_path call per contiguous run of pages
+        runs = []
+        for page_num in page_numbers:
+            if runs and page_num == runs[-1][1] + 1:
+                runs[-1][1] = page_num
+            else:
+                runs.append([page_num, page_num])
+        
+        for first_page, last_page in runs:
+            try:
+                images = convert_from_path(
+                    pdf_path,
+                    dpi=self.config['dpi'],
+                    first_page=first_page,
+                    last_page=last_page,
+                    fmt=self.config['format'],
+                    thread_count=self.config['thread_count']
+                )
+            except OSError as e:
+                if e.errno == errno.EMFILE:
+                    self.logger.warning(
+                        f"Too many open files with thread_count={self.config['thread_count']}; "
+                        "raise the open file limit (ulimit -n) or lower thread_count"
+                    )
+                raise
+            
+            for i, image in enumerate(images):
+                yield first_page + i, image
+    
+    
     def _is_direct_extraction_good(self, extraction_result: Dict[str, Any]) -> bool:
         """
         Evaluate quality dari direct text extraction
@@ -403,7 +941,7 @@ class PDFService:
             dict: Conversion result dengan image paths
         """
         try:
-            if not DEPENDENCIES_AVAILABLE:
+            if not PDF_SUPPORT_AVAILABLE:
                 return {
                     'success': False,
                     'error': 'PDF dependencies not available',
@@ -430,24 +968,17 @@ class PDFService:
             if page_end is None:
                 page_end = total_pages
             
-            # Convert pages
-            images = convert_from_path(
-                pdf_path,
-                dpi=self.config['dpi'],
-                first_page=page_start,
-                last_page=page_end,
-                fmt=self.config['format']
-            )
-            
-            # Save images
+            # Convert dan save pages
             saved_images = []
             base_name = Path(pdf_path).stem
             
-            for i, image in enumerate(images):
-                page_num = page_start + i
+            for page_num, image in self._render_pages(pdf_path, list(range(page_start, page_end + 1))):
                 image_filename = f"{base_name}_page_{page_num:03d}.{self.config['format'].lower()}"
                 image_path = os.path.join(output_dir, image_filename)
                 
+                if isinstance(image, np.ndarray):
+                    image = Image.fromarray(image)
+                
                 image.save(image_path, self.config['format'])
                 saved_images.append({
                     'page_number': page_num,
@@ -471,8 +1002,61 @@ class PDFService:
             }
     
     
+    def _extract_page_list(self, pdf_path: str, pages: List[int], enhancement_level: int,
+                           force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Extract specific pages dalam satu pass (satu PDF open, satu OCR pipeline)
+        
+        Keputusan direct vs OCR tetap per page, sama seperti memanggil
+        extract_text_from_pdf untuk setiap page.
+        
+        Args:
+            pdf_path (str): Path ke PDF file
+            pages (list): Page numbers (1-indexed, boleh tidak urut/duplikat)
+            enhancement_level (int): Enhancement level untuk OCR
+            force_refresh (bool): Abaikan page cache
+        
+        Returns:
+            list: Page entries sesuai urutan pages
+        """
+        pdf_hash = self._pdf_hash(pdf_path)
+        
+        document = _open_document(pdf_path)
+        try:
+            pdf_info = self._build_pdf_info(pdf_path, document)
+            total_pages = pdf_info['page_count']
+            if total_pages == 0:
+                return []
+            
+            # Clamp sama dengan page range validation di extract_text_from_pdf
+            page_numbers = [max(1, min(page_num, total_pages)) for page_num in pages]
+            unique_pages = sorted(set(page_numbers))
+            
+            extracted = {}
+            if pdf_info['has_extractable_text']:
+                direct_result = self._extract_direct_text(
+                    pdf_path, unique_pages, document, pdf_hash, force_refresh
+                )
+                for page in direct_result.get('pages', []):
+                    if self._is_direct_extraction_good({'pages': [page]}):
+                        extracted[page['page_number']] = page
+        finally:
+            _close_document(document)
+        
+        ocr_pages = [page_num for page_num in unique_pages if page_num not in extracted]
+        if ocr_pages:
+            ocr_result = self._extract_with_ocr(
+                pdf_path, ocr_pages, enhancement_level, pdf_hash, force_refresh
+            )
+            for page in ocr_result.get('pages', []):
+                extracted[page['page_number']] = page
+        
+        return [dict(extracted[page_num]) for page_num in page_numbers if page_num in extracted]
+    
+    
     def get_text_from_page_range(self, pdf_path: str, pages: List[int], 
-                                enhancement_level: int = 2) -> Dict[str, Any]:
+                                enhancement_level: int = 2,
+                                force_refresh: bool = False) -> Dict[str, Any]:
         """
         Extract text dari specific pages
         
@@ -480,6 +1064,7 @@ class PDFService:
             pdf_path (str): Path ke PDF file
             pages (list): List of page numbers to extract
             enhancement_level (int): Enhancement level untuk OCR
+            force_refresh (bool): Abaikan page cache dan extract ulang
         
         Returns:
             dict: Extraction result
@@ -487,17 +1072,8 @@ class PDFService:
         try:
             results = []
             
-            for page_num in pages:
-                # Extract single page
-                result = self.extract_text_from_pdf(
-                    pdf_path,
-                    page_start=page_num,
-                    page_end=page_num,
-                    enhancement_level=enhancement_level
-                )
-                
-                if result.get('pages'):
-                    results.extend(result['pages'])
+            if PDF_SUPPORT_AVAILABLE:
+                results = self._extract_page_list(pdf_path, pages, enhancement_level, force_refresh)
             
             # Calculate aggregate statistics
             if results:
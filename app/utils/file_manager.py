@@ -10,15 +10,28 @@ Date: August 2025
 
 import os
 import json
+import hashlib
 import uuid
 import shutil
 import tempfile
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 import time
 from pathlib import Path
 
+# Chunk size untuk streaming uploads ke disk
+_CHUNK_SIZE = 1 << 20
+
+# orjson optional - fallback ke stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class FileManager:
     """
@@ -67,6 +80,63 @@ class FileManager:
         """
         Save uploaded file ke temporary location
         
+        Args:
+            file (FileStorage): Uploaded file
+            identifier (str): Unique identifier untuk filename
+        
+        Returns:
+            str: Path ke saved temporary file
+        """
+        return self._stream_to_temp(file, identifier)
+    
+    
+    def hash_stream(self, stream) -> Tuple[str, int]:
+        """
+        Compute content hash (BLAKE2b, 128-bit) dan size dari seekable stream
+        
+        Stream di-reset ke posisi awal setelah hashing.
+        
+        Args:
+            stream: Seekable binary stream (mis. FileStorage.stream)
+        
+        Returns:
+            tuple: (hex digest, size dalam bytes)
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        size = 0
+        
+        stream.seek(0)
+        while True:
+            chunk = stream.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            size += len(chunk)
+        stream.seek(0)
+        
+        return hasher.hexdigest(), size
+    
+    
+    def get_stream_size(self, stream) -> int:
+        """
+        Get size dari seekable stream tanpa membaca isinya
+        
+        Args:
+            stream: Seekable binary stream
+        
+        Returns:
+            int: Size dalam bytes
+        """
+        position = stream.tell()
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+        return size
+    
+    
+    def _stream_to_temp(self, file: FileStorage, identifier: str) -> str:
+        """
+        Stream upload ke disk dalam chunks (peak memory O(chunk size))
+        
         Args:
             file (FileStorage): Uploaded file
             identifier (str): Unique identifier untuk filename
@@ -87,8 +157,18 @@ class FileManager:
             # Full path
             temp_path = os.path.join(self.base_temp_dir, 'uploads', temp_filename)
             
-            # Save file
-            file.save(temp_path)
+            # Stream file ke disk
+            stream = file.stream
+            size = self.get_stream_size(stream) - stream.tell()
+            with open(temp_path, 'wb', buffering=_CHUNK_SIZE) as dst:
+                # Reserve blocks sekali di awal supaya file tidak tumbuh per chunk
+                if size > 0 and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(dst.fileno(), 0, size)
+                    except OSError:
+                        pass  # Filesystem tidak support fallocate
+                
+                shutil.copyfileobj(stream, dst, _CHUNK_SIZE)
             
             return temp_path
             
@@ -165,8 +245,12 @@ class FileManager:
             }
             
             # Save sebagai JSON
-            with open(result_path, 'w', encoding='utf-8') as f:
-                json.dump(result_data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(result_path, 'wb') as f:
+                    f.write(orjson.dumps(result_data, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2))
+            else:
+                with open(result_path, 'w', encoding='utf-8') as f:
+                    json.dump(result_data, f, indent=2, ensure_ascii=False)
             
             return result_path
             
@@ -190,8 +274,7 @@ class FileManager:
                 result_path = os.path.join(self.base_results_dir, subdir, f"{result_id}.json")
                 
                 if os.path.exists(result_path):
-                    with open(result_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                    return self._read_json(result_path)
             
             return None
             
@@ -199,6 +282,80 @@ class FileManager:
             raise Exception(f"Failed to load result {result_id}: {e}")
     
     
+    def _read_json(self, file_path: str) -> Any:
+        """
+        Read dan parse JSON file (orjson jika tersedia)
+        
+        Args:
+            file_path (str): Path ke JSON file
+        
+        Returns:
+            any: Parsed JSON data
+        """
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    
+    def load_cached_result(self, cache_key: str, max_age_hours: int = 24) -> Optional[Dict[str, Any]]:
+        """
+        Load cached result berdasarkan cache key
+        
+        Args:
+            cache_key (str): Cache key (hex digest)
+            max_age_hours (int): Umur maksimum cache entry
+        
+        Returns:
+            dict: Cached result atau None jika tidak ada / expired
+        """
+        cache_path = os.path.join(self.base_temp_dir, 'cache', f"{cache_key}.json")
+        
+        try:
+            if time.time() - os.path.getmtime(cache_path) > max_age_hours * 3600:
+                return None
+            
+            return self._read_json(cache_path)
+        
+        except (OSError, ValueError):
+            return None
+    
+    
+    def save_cached_result(self, cache_key: str, result_data: Dict[str, Any]) -> str:
+        """
+        Save result ke cache berdasarkan cache key
+        
+        Args:
+            cache_key (str): Cache key (hex digest)
+            result_data (dict): Result data to cache
+        
+        Returns:
+            str: Path ke cache file
+        """
+        try:
+            cache_path = os.path.join(self.base_temp_dir, 'cache', f"{cache_key}.json")
+            
+            # Tanpa save metadata dari save_result
+            data = {key: value for key, value in result_data.items() if key != '_metadata'}
+            
+            # Tulis ke temp file lalu rename, reader tidak pernah melihat file setengah jadi
+            temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            if ORJSON_AVAILABLE:
+                with open(temp_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=_ORJSON_OPTIONS))
+            else:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+            
+            return cache_path
+            
+        except Exception as e:
+            raise Exception(f"Failed to save cached result: {e}")
+    
+    
     def cleanup_temp_file(self, file_path: str) -> bool:
         """
         Remove temporary file
@@ -0,0 +1,74 @@
+"""
+JSON Provider
+=============
+
+Flask JSON provider berbasis orjson untuk serialization API responses.
+
+Author: AI Assistant
+Date: August 2025
+"""
+
+from typing import Any
+from flask.json.provider import DefaultJSONProvider
+
+# orjson optional - fallback ke stdlib json via DefaultJSONProvider
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider yang memakai orjson (C extension) jika tersedia
+    
+    Dipakai oleh jsonify() dan dict return values dari view functions.
+    Output tetap kompatibel dengan DefaultJSONProvider (sort_keys,
+    pretty-print di debug mode, default serializer untuk date/uuid/dataclass).
+    """
+    
+    # Response dicts sudah dibangun dalam urutan yang bermakna (success,
+    # message, data, ...); sorting setiap nested dict hanya menambah cost
+    sort_keys = False
+    
+    if ORJSON_AVAILABLE:
+        _base_option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    
+    def _option(self, pretty: bool = False) -> int:
+        """Build orjson option flags sesuai provider settings"""
+        option = self._base_option
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+    
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj ke JSON string"""
+        if not ORJSON_AVAILABLE or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._option()).decode('utf-8')
+    
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON string atau bytes"""
+        if not ORJSON_AVAILABLE or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    
+    def response(self, *args: Any, **kwargs: Any):
+        """Serialize data langsung ke bytes response body"""
+        if not ORJSON_AVAILABLE:
+            return super().response(*args, **kwargs)
+        
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._option(pretty)),
+            mimetype=self.mimetype
+        )
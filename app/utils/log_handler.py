@@ -0,0 +1,107 @@
+"""
+Log Handler
+===========
+
+Buffered rotating file handler untuk application logging.
+
+Author: AI Assistant
+Date: August 2025
+"""
+
+import os
+import time
+import logging
+from logging.handlers import RotatingFileHandler
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler yang menulis lewat buffer besar
+    
+    Records ditulis ke buffered stream dan hanya di-flush ketika:
+    - Record dengan level >= flush_level (default ERROR)
+    - flush_interval detik sudah lewat sejak flush terakhir
+    - Handler di-close (rollover atau shutdown)
+    
+    Ukuran file (bytes) di-track sendiri supaya rollover check tidak perlu
+    seek/tell (yang akan memaksa flush buffer setiap record). Setiap record
+    hanya di-format sekali di emit.
+    """
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 encoding: str = None, buffer_size: int = 64 * 1024,
+                 flush_interval: float = 30.0, flush_level: int = logging.ERROR):
+        """
+        Initialize BufferedRotatingFileHandler
+        
+        Args:
+            filename (str): Path ke log file
+            maxBytes (int): Ukuran maksimum file sebelum rollover
+            backupCount (int): Jumlah backup files
+            encoding (str): File encoding
+            buffer_size (int): Ukuran write buffer dalam bytes
+            flush_interval (float): Interval flush periodik dalam detik
+            flush_level (int): Level minimum yang memicu flush langsung
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._last_flush = time.monotonic()
+        self._size = 0
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount,
+                         encoding=encoding, delay=True)
+    
+    
+    def _open(self):
+        """Open log file dengan buffer besar dan sync ukuran file"""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        try:
+            self._size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._size = 0
+        return stream
+    
+    
+    def _encoded_size(self, msg: str) -> int:
+        """Ukuran msg dalam bytes sesuai stream encoding (maxBytes adalah bytes)"""
+        if msg.isascii():
+            return len(msg)
+        return len(msg.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+    
+    
+    def _should_rollover(self, size: int) -> bool:
+        """Check rollover untuk record berukuran size bytes (tanpa seek/tell)"""
+        if self.stream is None:
+            self.stream = self._open()
+        return self.maxBytes > 0 and self._size + size >= self.maxBytes
+    
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check rollover berdasarkan tracked size (emit memakai _should_rollover langsung)"""
+        return self._should_rollover(self._encoded_size(self.format(record) + self.terminator))
+    
+    
+    def emit(self, record: logging.LogRecord):
+        """Write record ke buffer, flush hanya sesuai policy"""
+        try:
+            msg = self.format(record) + self.terminator
+            size = self._encoded_size(msg)
+            
+            if self._should_rollover(size):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            
+            self.stream.write(msg)
+            self._size += size
+            
+            now = time.monotonic()
+            if record.levelno >= self.flush_level or now - self._last_flush >= self.flush_interval:
+                self.stream.flush()
+                self._last_flush = now
+        
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,112 @@
+"""
+Text Kernels
+============
+
+Numba-compiled kernels untuk text statistics pada text panjang.
+
+Author: AI Assistant
+Date: August 2025
+"""
+
+from typing import Tuple
+import numpy as np
+
+# numba optional - tanpa numba controller memakai str methods biasa
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Lookup tables untuk ASCII bytes (whitespace sama dengan str.isspace)
+_WHITESPACE = np.zeros(128, dtype=np.uint8)
+_WHITESPACE[[ord(c) for c in ' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f']] = 1
+
+_SPECIAL = np.zeros(128, dtype=np.uint8)
+_SPECIAL[[ord(c) for c in '!@#$%^&*(),.?":{}|<>']] = 1
+
+
+def _text_stats_kernel(buf, whitespace, special):
+    """
+    Single-pass text statistics over ASCII bytes
+
+    Semantics sama dengan _calculate_text_stats di OCRController:
+    words = len(text.split()), lines = text.count('\\n') + 1,
+    paragraphs = non-empty blocks dari text.split('\\n\\n').
+
+    Args:
+        buf: np.uint8 array (ASCII-encoded text)
+        whitespace: np.uint8[128] whitespace lookup table
+        special: np.uint8[128] special-character lookup table
+
+    Returns:
+        tuple: (word_count, line_count, paragraph_count, has_numbers, has_special_chars)
+    """
+    n = buf.shape[0]
+    word_count = 0
+    line_count = 1
+    paragraph_count = 0
+    has_numbers = False
+    has_special = False
+    in_word = False
+    block_has_content = False
+
+    i = 0
+    while i < n:
+        b = buf[i]
+
+        # Paragraph separator '\n\n' (non-overlapping, sama dengan str.split)
+        if b == 10 and i + 1 < n and buf[i + 1] == 10:
+            if block_has_content:
+                paragraph_count += 1
+            block_has_content = False
+            in_word = False
+            line_count += 2
+            i += 2
+            continue
+
+        if whitespace[b]:
+            in_word = False
+            if b == 10:
+                line_count += 1
+        else:
+            if not in_word:
+                word_count += 1
+                in_word = True
+            block_has_content = True
+
+            if 48 <= b <= 57:
+                has_numbers = True
+            elif special[b]:
+                has_special = True
+
+        i += 1
+
+    if block_has_content:
+        paragraph_count += 1
+
+    return word_count, line_count, paragraph_count, has_numbers, has_special
+
+
+if NUMBA_AVAILABLE:
+    _compiled_kernel = njit(cache=True, nogil=True)(_text_stats_kernel)
+else:
+    _compiled_kernel = None
+
+
+def ascii_text_stats(text: str) -> Tuple[int, int, int, bool, bool]:
+    """
+    Compute text statistics dengan compiled kernel
+
+    Args:
+        text (str): ASCII-only text (caller harus cek text.isascii())
+
+    Returns:
+        tuple: (word_count, line_count, paragraph_count, has_numbers, has_special_chars)
+    """
+    buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    word_count, line_count, paragraph_count, has_numbers, has_special = _compiled_kernel(
+        buf, _WHITESPACE, _SPECIAL
+    )
+    return int(word_count), int(line_count), int(paragraph_count), bool(has_numbers), bool(has_special)
@@ -0,0 +1,61 @@
+"""
+Upload Request
+==============
+
+Flask request class dengan multipart parsing yang dituning untuk upload besar.
+
+Author: AI Assistant
+Date: August 2025
+"""
+
+from typing import Optional
+from flask import Request, current_app
+from werkzeug.formparser import FormDataParser, MultiPartParser
+
+# Ukuran chunk yang dibaca parser per iterasi (werkzeug default 64KB)
+_PARSE_BUFFER_SIZE = 1024 * 1024
+
+
+class UploadFormDataParser(FormDataParser):
+    """
+    FormDataParser yang membaca multipart body dalam chunk besar
+    
+    File parts tetap ditulis ke stream dari stream_factory (werkzeug
+    spool ke TemporaryFile untuk body > 500KB), hanya jumlah iterasi
+    Python per upload yang berkurang.
+    """
+    
+    def _parse_multipart(self, stream, mimetype, content_length, options):
+        """Parse multipart body dengan buffer size yang lebih besar"""
+        parser = MultiPartParser(
+            stream_factory=self.stream_factory,
+            max_form_memory_size=self.max_form_memory_size,
+            max_form_parts=self.max_form_parts,
+            cls=self.cls,
+            buffer_size=_PARSE_BUFFER_SIZE
+        )
+        boundary = options.get('boundary', '').encode('ascii')
+        
+        if not boundary:
+            raise ValueError('Missing boundary')
+        
+        form, files = parser.parse(stream, boundary, content_length)
+        return stream, form, files
+
+
+class UploadRequest(Request):
+    """
+    Request class untuk OCR uploads
+    
+    - Multipart parsing via UploadFormDataParser
+    - Batas memory untuk non-file form fields dari MAX_FORM_MEMORY_SIZE config
+    """
+    
+    form_data_parser_class = UploadFormDataParser
+    
+    @property
+    def max_form_memory_size(self) -> Optional[int]:
+        """Maximum in-memory size untuk non-file form fields"""
+        if current_app:
+            return current_app.config.get('MAX_FORM_MEMORY_SIZE')
+        return None
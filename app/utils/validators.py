@@ -9,6 +9,7 @@ Date: August 2025
 """
 
 import os
+import re
 from typing import Dict, Any, List, Optional
 from werkzeug.datastructures import FileStorage
 from flask import Request
@@ -25,6 +26,14 @@ MAGIC_AVAILABLE = False
 #     # Jika ada error lain saat import magic (seperti segfault), disable
 #     MAGIC_AVAILABLE = False
 
+# Patterns dan defaults (compiled sekali saat import)
+_RESULT_ID_RE = re.compile(
+    r'^(?:[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$'
+)
+_DEFAULT_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif'})
+_DEFAULT_PDF_EXTENSIONS = frozenset({'.pdf'})
+_DANGEROUS_CHARS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 
 def validate_request(request: Request, file_required: bool = False, files_required: bool = False) -> Dict[str, Any]:
     """
@@ -118,16 +127,16 @@ def validate_file(file: FileStorage, file_type: str, config: Dict[str, Any]) ->
         
         # Check file extension
         if file_type == 'image':
-            allowed_extensions = config.get('ALLOWED_IMAGE_EXTENSIONS', {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif'})
-            if not any(filename.endswith(ext) for ext in allowed_extensions):
+            allowed_extensions = config.get('ALLOWED_IMAGE_EXTENSIONS', _DEFAULT_IMAGE_EXTENSIONS)
+            if not filename.endswith(tuple(allowed_extensions)):
                 return {
                     'valid': False,
                     'message': f'Invalid image format. Allowed: {", ".join(allowed_extensions)}'
                 }
         
         elif file_type == 'pdf':
-            allowed_extensions = config.get('ALLOWED_PDF_EXTENSIONS', {'.pdf'})
-            if not any(filename.endswith(ext) for ext in allowed_extensions):
+            allowed_extensions = config.get('ALLOWED_PDF_EXTENSIONS', _DEFAULT_PDF_EXTENSIONS)
+            if not filename.endswith(tuple(allowed_extensions)):
                 return {
                     'valid': False,
                     'message': f'Invalid PDF format. Allowed: {", ".join(allowed_extensions)}'
@@ -229,8 +238,8 @@ def validate_ocr_parameters(params: Dict[str, Any]) -> Dict[str, Any]:
             errors.append('enhancement_level must be an integer')
         
         # Engine validation
-        engine = params.get('engine', 'both')
-        valid_engines = ['tesseract', 'easyocr', 'both']
+        engine = params.get('engine', 'auto')
+        valid_engines = ['auto', 'tesseract', 'easyocr', 'both']
         if engine not in valid_engines:
             errors.append(f'engine must be one of: {", ".join(valid_engines)}')
         else:
@@ -323,9 +332,7 @@ def sanitize_filename(filename: str) -> str:
     filename = os.path.basename(filename)
     
     # Replace dangerous characters
-    dangerous_chars = '<>:"/\\|?*'
-    for char in dangerous_chars:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_DANGEROUS_CHARS)
     
     # Remove consecutive underscores
     while '__' in filename:
@@ -364,11 +371,8 @@ def validate_result_id(result_id: str) -> Dict[str, Any]:
                 'message': 'Result ID is required'
             }
         
-        # Check format (should be UUID-like)
-        import re
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        
-        if not re.match(uuid_pattern, result_id.lower()):
+        # Check format (UUID hex, dengan atau tanpa hyphens)
+        if not _RESULT_ID_RE.match(result_id.lower()):
             return {
                 'valid': False,
                 'message': 'Invalid result ID format'
@@ -93,7 +93,7 @@ class OCRCLI:
             # Perform OCR
             ocr_result = self.ocr_service.extract_text(
                 enhanced_image,
-                engine=kwargs.get('engine', 'both'),
+                engine=kwargs.get('engine', 'auto'),
                 languages=kwargs.get('languages', ['en', 'id'])
             )
             
@@ -253,8 +253,8 @@ Examples:
                                help='Process multiple files (supports wildcards)')
         
         # Processing options
-        parser.add_argument('--engine', choices=['tesseract', 'easyocr', 'both'],
-                          default='both', help='OCR engine to use (default: both)')
+        parser.add_argument('--engine', choices=['auto', 'tesseract', 'easyocr', 'both'],
+                          default='auto', help='OCR engine to use (default: auto)')
         parser.add_argument('--enhancement', type=int, choices=[1, 2, 3],
                           default=2, help='Image enhancement level (default: 2)')
         parser.add_argument('--languages', nargs='+', default=['en', 'id'],
@@ -22,7 +22,7 @@ sys.path.insert(0, str(project_root))
 # Import test utilities
 from app.utils.response_formatter import ResponseFormatter
 from app.utils.validators import validate_request, validate_file
-from app.models.ocr_models import OCRResult, BoundingBox, DetectedWord
+from app.models.ocr_models import OCRResult, BoundingBox, DetectedWord, OCRResultVectorized
 
 
 class TestResponseFormatter(unittest.TestCase):
@@ -144,6 +144,98 @@ class TestOCRModels(unittest.TestCase):
         self.assertEqual(result.extracted_text, "Hello World")
         self.assertEqual(result.confidence_score, 90.0)
         self.assertIsNotNone(result.result_id)  # Should auto-generate UUID
+    
+    def test_vectorized_words_conversion(self):
+        """Test OCRResultVectorized dari word dicts"""
+        words = [
+            {'text': 'Hello', 'confidence': 90.0, 'bbox': {'x': 1, 'y': 2, 'width': 30, 'height': 10}},
+            {'text': 'World', 'confidence': 80.5, 'bbox': {'x': 40, 'y': 2, 'width': 35, 'height': 10}}
+        ]
+        vectorized = OCRResultVectorized.from_words(words)
+        
+        self.assertEqual(len(vectorized), 2)
+        self.assertEqual(vectorized.bboxes.shape, (2, 4))
+        self.assertEqual(vectorized[1].text, 'World')
+        self.assertEqual(vectorized[1].bbox.to_dict(), words[1]['bbox'])
+        self.assertEqual(vectorized.to_dict()['bboxes'][0], [1, 2, 30, 10])
+
+
+class TestTextKernels(unittest.TestCase):
+    """Test text statistics kernel"""
+    
+    def test_kernel_matches_str_methods(self):
+        """Test kernel semantics sama dengan str.split based statistics"""
+        import numpy as np
+        from app.utils import text_kernels
+        
+        text = "Invoice 2025\n\nTotal: 100.00\n\n\n  \nThank you\n"
+        buf = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        
+        result = text_kernels._text_stats_kernel(buf, text_kernels._WHITESPACE, text_kernels._SPECIAL)
+        
+        expected = (
+            len(text.split()),
+            text.count('\n') + 1,
+            len([p for p in text.split('\n\n') if p.strip()]),
+            True,
+            True
+        )
+        self.assertEqual(tuple(result), expected)
+
+
+class TestImageServiceGPU(unittest.TestCase):
+    """Test CUDA enhancement pipeline terhadap CPU path"""
+    
+    def test_cuda_adaptive_threshold_matches_cpu(self):
+        """Test CUDA adaptive threshold sama dengan cv2.adaptiveThreshold"""
+        try:
+            import cv2
+            import numpy as np
+            from app.services.image_service import ImageService
+        except ImportError as e:
+            self.skipTest(f"OpenCV not available: {e}")
+        
+        if not hasattr(cv2, 'cuda') or cv2.cuda.getCudaEnabledDeviceCount() == 0:
+            self.skipTest("CUDA device not available")
+        
+        # White page dengan text hitam
+        gray = np.full((120, 400), 255, dtype=np.uint8)
+        cv2.putText(gray, "Invoice 2025", (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 1.5, 0, 3)
+        
+        expected = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
+        
+        gpu_gray = cv2.cuda_GpuMat()
+        gpu_gray.upload(gray)
+        result = ImageService._build_adaptive_threshold_gpu()(gpu_gray).download()
+        
+        # Background putih harus tetap putih
+        self.assertTrue(np.all(result[:20] == 255))
+        # Rounding Gaussian CUDA vs CPU boleh berbeda di beberapa edge pixels
+        self.assertLess(np.count_nonzero(result != expected) / result.size, 0.01)
+
+
+class TestImageServiceStats(unittest.TestCase):
+    """Test image statistics"""
+    
+    def test_bilevel_image_stats(self):
+        """Test get_image_stats untuk mode '1' image"""
+        try:
+            from PIL import Image
+            from app.services.image_service import ImageService
+        except ImportError as e:
+            self.skipTest(f"Image dependencies not available: {e}")
+        
+        # Setengah hitam, setengah putih
+        image = Image.new('1', (40, 20), 0)
+        image.paste(1, (20, 0, 40, 20))
+        
+        stats = ImageService().get_image_stats(image)
+        
+        self.assertNotIn('error', stats)
+        self.assertEqual(stats['color_info']['mode'], '1')
+        self.assertEqual(stats['quality_metrics']['min_value'], 0.0)
+        self.assertEqual(stats['quality_metrics']['max_value'], 255.0)
+        self.assertAlmostEqual(stats['quality_metrics']['mean_brightness'], 127.5)
 
 
 class TestFlaskAppCreation(unittest.TestCase):
@@ -287,6 +379,9 @@ def run_tests():
         TestResponseFormatter,
         TestValidators,
         TestOCRModels,
+        TestTextKernels,
+        TestImageServiceGPU,
+        TestImageServiceStats,
         TestFlaskAppCreation,
         TestProjectStructure,
         TestConfiguration